@@ -0,0 +1,147 @@
+"""
+Micro-benchmark of the challenge state export and load.
+
+Builds the miner states of a challenge with synthetic commits (scoring logs and comparison
+logs against every reference, with script payloads) and times `ChallengeManager.export_state`
+in the public and state views, and `ChallengeManager.load_state` of the exported state.
+
+Usage:
+    python -m benchmarks.bench_commit_views --miners 256 --references 15
+"""
+
+import argparse
+import statistics
+import time
+
+from redteam_core.validator.blob_store import BlobStore
+from redteam_core.validator.challenge_manager import ChallengeManager
+from redteam_core.validator.models import (
+    ComparisonLog,
+    MinerChallengeCommit,
+    MinerChallengeInfo,
+    ScoringLog,
+)
+
+CHALLENGE_INFO = {
+    "name": "benchmark_challenge",
+    "challenge_incentive_weight": 1.0,
+    "comparison_config": {"max_unique_commits": 15},
+}
+
+
+def make_commit(
+    uid: int,
+    num_tasks: int,
+    num_references: int,
+    script_size: int,
+    blob_store: BlobStore,
+) -> MinerChallengeCommit:
+    _script = f"# miner {uid}\n" + "x" * script_size
+    _scoring_logs = [
+        ScoringLog(
+            score=0.5,
+            miner_input={"task_id": f"{uid}_{task}", "payload": list(range(32))},
+            miner_output={"script": _script},
+            solve_duration=1.0,
+        )
+        for task in range(num_tasks)
+    ]
+    _comparison_logs = {
+        f"{reference}_reference": [
+            ComparisonLog.from_payloads(
+                blob_store=blob_store,
+                miner_input={"task_id": f"reference_{reference}"},
+                miner_output={"script": _script},
+                reference_output={
+                    "script": f"# reference {reference}\n" + "y" * script_size
+                },
+                similarity_score=0.1,
+                reason="benchmark",
+                reference_hotkey=f"reference_hotkey_{reference}",
+            )
+        ]
+        for reference in range(num_references)
+    }
+    return MinerChallengeCommit(
+        miner_uid=uid,
+        miner_hotkey=f"hotkey_{uid}",
+        challenge_name=CHALLENGE_INFO["name"],
+        docker_hub_id=f"benchmark/miner_{uid}@sha256:{uid:064x}",
+        encrypted_commit=f"{uid:064x}",
+        key="key",
+        commit=f"benchmark/miner_{uid}@sha256:{uid:064x}",
+        scoring_logs=_scoring_logs,
+        comparison_logs=_comparison_logs,
+        score=0.5,
+        penalty=0.1,
+        accepted=True,
+    )
+
+
+def make_challenge_manager(args: argparse.Namespace) -> ChallengeManager:
+    _challenge_manager = ChallengeManager(CHALLENGE_INFO, metagraph=None)
+    _blob_store = BlobStore()
+    for uid in range(args.miners):
+        _commit = make_commit(
+            uid, args.tasks, args.references, args.script_size, _blob_store
+        )
+        _challenge_manager.miner_states[uid] = MinerChallengeInfo(
+            miner_uid=uid,
+            miner_hotkey=f"hotkey_{uid}",
+            challenge_name=CHALLENGE_INFO["name"],
+            latest_commit=_commit,
+            best_commit=_commit,
+        )
+    return _challenge_manager
+
+
+def time_call(func, repeat: int) -> dict:
+    _durations = []
+    for _ in range(repeat):
+        _start_time = time.perf_counter()
+        func()
+        _durations.append(time.perf_counter() - _start_time)
+    return {
+        "min": min(_durations),
+        "median": statistics.median(_durations),
+        "max": max(_durations),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--miners", type=int, default=256)
+    parser.add_argument("--references", type=int, default=15)
+    parser.add_argument("--tasks", type=int, default=1)
+    parser.add_argument("--script-size", type=int, default=4096)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    _challenge_manager = make_challenge_manager(args)
+    _state = _challenge_manager.export_state()
+    _results = {
+        "export_state (public view)": time_call(
+            lambda: _challenge_manager.export_state(public_view=True), args.repeat
+        ),
+        "export_state (state view)": time_call(
+            lambda: _challenge_manager.export_state(), args.repeat
+        ),
+        "load_state": time_call(
+            lambda: ChallengeManager.load_state(_state, CHALLENGE_INFO, None),
+            args.repeat,
+        ),
+    }
+
+    print(
+        f"\n{args.miners} miners x {args.references} references, {args.tasks} tasks, "
+        f"{args.script_size} bytes scripts, {args.repeat} repeats\n"
+    )
+    print(f"{'operation':<32}{'min':>10}{'median':>10}{'max':>10}")
+    for name, durations in _results.items():
+        print(
+            f"{name:<32}{durations['min']:>10.4f}{durations['median']:>10.4f}{durations['max']:>10.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
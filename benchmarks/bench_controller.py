@@ -0,0 +1,350 @@
+"""
+Offline benchmark of `Controller.start_challenge`.
+
+Runs a full challenge with synthetic miner commits against local stand-in servers of the
+challenge container, the miner containers and the internal services API, with a fake Docker
+client instead of the daemon. Reports the throughput, the latency percentiles of every
+evaluation phase (from the timing spans) and the HTTP calls made in every phase.
+
+Usage:
+    python -m benchmarks.bench_controller --miners 200 --latency 0.005
+    python -m benchmarks.bench_controller --miners 200 --max-concurrent-miners 8
+    python -m benchmarks.bench_controller --miners 200 --pipeline --output report.json
+    python -m benchmarks.bench_controller --miners 200 --deterministic --cache-dir /tmp/cache
+"""
+
+from unittest import mock
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+from redteam_core import tracing
+from redteam_core.challenge_pool import docker_utils
+from redteam_core.challenge_pool.controller import Controller
+from redteam_core.config.main import constants
+from redteam_core.validator.models import MinerChallengeCommit, ScoringLog
+
+from benchmarks.fake_docker import FakeDockerClient
+from benchmarks.stub_servers import (
+    StubServer,
+    create_challenge_server,
+    create_internal_services_server,
+    create_miner_server,
+)
+
+CHALLENGE_NAME = "benchmark_challenge"
+SCRIPT_KEY = "script"
+
+# Evaluation phase (span name) of every stub route
+ROUTE_PHASES = {
+    ("challenge", "GET /health"): "controller.setup_challenge",
+    ("challenge", "POST /reset"): "controller.setup_challenge",
+    ("challenge", "GET /task"): "controller.generate_tasks",
+    ("challenge", "GET /capabilities"): "controller.score",
+    ("challenge", "POST /score"): "controller.score",
+    ("challenge", "POST /score/batch"): "controller.score",
+    ("miner", "GET /health"): "controller.start_miner",
+    ("miner", "POST /solve"): "controller.solve",
+    ("internal_services", "POST /check/challenge"): "controller.compare",
+    ("internal_services", "POST /compare"): "controller.compare",
+    ("internal_services", "POST /compare/all"): "controller.compare",
+    ("internal_services", "POST /compare/all/batch"): "controller.compare",
+    ("internal_services", "POST /compare/baseline-scripts"): "controller.compare",
+    ("internal_services", "POST /compare/same-score"): "controller.score",
+}
+
+
+class BenchmarkController(Controller):
+    """Controller scoring every solved input with the challenge container's `/score`."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.comparison_min_acceptable_score = self.challenge_info[
+            "comparison_config"
+        ].get("min_acceptable_score", 0.6)
+
+    def _exclude_output_keys(self, miner_output: dict, reference_output: dict):
+        pass
+
+    def _score_miner_with_new_inputs(
+        self, miner_commit: MinerChallengeCommit, challenge_inputs
+    ):
+        for scoring_log in miner_commit.scoring_logs:
+            if scoring_log.miner_output is None or scoring_log.score is not None:
+                continue
+            scoring_log.score = self._score_challenge(
+                miner_input=scoring_log.miner_input,
+                miner_output=scoring_log.miner_output,
+            )
+
+
+def make_miner_commits(num_miners: int) -> list[MinerChallengeCommit]:
+    return [
+        MinerChallengeCommit(
+            miner_uid=uid,
+            miner_hotkey=f"hotkey_{uid}",
+            challenge_name=CHALLENGE_NAME,
+            docker_hub_id=f"benchmark/miner_{uid}@{_make_digest(str(uid))}",
+            commit_timestamp=time.time(),
+            encrypted_commit=hashlib.sha256(f"commit_{uid}".encode()).hexdigest(),
+        )
+        for uid in range(num_miners)
+    ]
+
+
+def make_reference_commits(num_references: int) -> list[MinerChallengeCommit]:
+    return [
+        MinerChallengeCommit(
+            miner_uid=100_000 + index,
+            miner_hotkey=f"reference_hotkey_{index}",
+            challenge_name=CHALLENGE_NAME,
+            docker_hub_id=f"benchmark/reference_{index}@{_make_digest(f'reference_{index}')}",
+            encrypted_commit=hashlib.sha256(f"reference_{index}".encode()).hexdigest(),
+            scoring_logs=[
+                ScoringLog(
+                    miner_input={"task_id": f"reference_{index}"},
+                    miner_output={SCRIPT_KEY: f"# reference solution {index}"},
+                    score=0.5 + (index % 5) / 10,
+                )
+            ],
+            penalty=0.0,
+        )
+        for index in range(num_references)
+    ]
+
+
+def _make_digest(value: str) -> str:
+    return f"sha256:{hashlib.sha256(value.encode()).hexdigest()}"
+
+
+def make_challenge_info(args: argparse.Namespace) -> dict:
+    return {
+        "name": CHALLENGE_NAME,
+        "challenge_image": "benchmark/challenge:latest",
+        "challenge_type": "benchmark",
+        "script_path_identifier": SCRIPT_KEY,
+        "num_tasks": args.tasks,
+        "challenge_min_acceptable_score": 0.4,
+        "comparison_config": {
+            "max_unique_commits": 15,
+            "max_self_comparison_score": 0.8,
+            "min_acceptable_score": 0.6,
+        },
+        "challenge_container_run_kwargs": {"name": CHALLENGE_NAME},
+        "miner_container_run_kwargs": {"network": "redteam_local"},
+        "max_concurrent_miners": args.max_concurrent_miners,
+        # Fits 64 miners on the fake Docker host
+        "resource_limits": {"num_cpus": 1, "mem_limit": "4g"},
+        "evaluation_pipeline": args.pipeline,
+        "challenge_solve_concurrency": args.solve_concurrency,
+        "batch_scoring": args.batch_scoring,
+        "collect_resource_usage": args.resource_usage,
+        "deterministic": args.deterministic,
+    }
+
+
+def get_percentile(sorted_values: list[float], percentile: float) -> float:
+    _index = min(
+        len(sorted_values) - 1, int(round(percentile * (len(sorted_values) - 1)))
+    )
+    return sorted_values[_index]
+
+
+def summarize_spans(spans_file: str) -> tuple[dict[str, dict], set]:
+    """
+    Returns the count, error count and latency percentiles (seconds) of every span name,
+    and the UIDs of the miners with a failed span.
+    """
+    _durations: dict[str, list[float]] = {}
+    _errors: dict[str, int] = {}
+    _failed_miner_uids = set()
+    with open(spans_file) as file:
+        for line in file:
+            _span = json.loads(line)
+            _durations.setdefault(_span["name"], []).append(_span["duration"])
+            if _span["error"]:
+                _errors[_span["name"]] = _errors.get(_span["name"], 0) + 1
+                if "miner_uid" in _span["tags"]:
+                    _failed_miner_uids.add(_span["tags"]["miner_uid"])
+
+    _summary = {}
+    for name, durations in sorted(_durations.items()):
+        durations.sort()
+        _summary[name] = {
+            "count": len(durations),
+            "errors": _errors.get(name, 0),
+            "total": sum(durations),
+            "p50": get_percentile(durations, 0.50),
+            "p90": get_percentile(durations, 0.90),
+            "p99": get_percentile(durations, 0.99),
+            "max": durations[-1],
+        }
+    return _summary, _failed_miner_uids
+
+
+def get_http_calls_per_phase(servers: list[StubServer]) -> dict[str, dict[str, int]]:
+    _calls: dict[str, dict[str, int]] = {}
+    for server in servers:
+        for route, stats in server.get_stats().items():
+            _phase = ROUTE_PHASES.get((server.name, route), "other")
+            _calls.setdefault(_phase, {})[f"{server.name} {route}"] = stats["calls"]
+    return _calls
+
+
+def run_benchmark(args: argparse.Namespace) -> dict:
+    _servers = [
+        create_challenge_server(
+            script_key=SCRIPT_KEY,
+            score_batch=args.batch_scoring,
+            deterministic_tasks=args.deterministic,
+            latency={"/score": args.score_latency, "/score/batch": args.score_latency},
+            default_latency=args.latency,
+            jitter=args.jitter,
+        ),
+        create_miner_server(
+            script_key=SCRIPT_KEY,
+            latency={"/solve": args.solve_latency},
+            default_latency=args.latency,
+            jitter=args.jitter,
+        ),
+        create_internal_services_server(
+            default_latency=args.compare_latency, jitter=args.jitter
+        ),
+    ]
+    _challenge_server, _miner_server, _internal_services_server = _servers
+    for server in _servers:
+        server.start()
+
+    _work_dir = tempfile.mkdtemp(prefix="redteam_benchmark_")
+    _spans_file = os.path.join(_work_dir, "spans.jsonl")
+    constants.CACHE_DIR = args.cache_dir or os.path.join(_work_dir, "cache")
+    constants.CHALLENGE_DOCKER_PORT = _challenge_server.port
+    constants.MINER_DOCKER_PORT = _miner_server.port
+    constants.INTERNAL_SERVICES.API_URL = _internal_services_server.url
+    tracing.tracer.enabled = True
+    tracing.tracer.export_path = _spans_file
+    tracing.tracer.reset_summary()
+
+    _docker_client = FakeDockerClient(
+        run_latency=args.run_latency,
+        pull_latency=args.pull_latency,
+        stop_latency=args.stop_latency,
+        exposed_ports=(_miner_server.port,),
+    )
+    # The challenge image is available locally, miner images are pulled
+    _docker_client.images.add("benchmark/challenge:latest")
+    _miner_commits = make_miner_commits(args.miners)
+
+    try:
+        with mock.patch.object(
+            docker_utils, "create_docker_client", return_value=_docker_client
+        ):
+            controller = BenchmarkController(
+                challenge_name=CHALLENGE_NAME,
+                challenge_info=make_challenge_info(args),
+                miner_commits=_miner_commits,
+                reference_comparison_commits=make_reference_commits(args.references),
+                miners_docker_info={
+                    str(commit.miner_uid): {
+                        "dockerhub_username": "benchmark",
+                        "personal_access_token": "benchmark",
+                    }
+                    for commit in _miner_commits
+                },
+            )
+            _start_time = time.perf_counter()
+            controller.start_challenge()
+            _elapsed = time.perf_counter() - _start_time
+            if controller.cleanup_future:
+                controller.cleanup_future.result()
+    finally:
+        for server in _servers:
+            server.stop()
+
+    _phases, _failed_miner_uids = summarize_spans(_spans_file)
+    return {
+        "config": vars(args),
+        "elapsed_seconds": _elapsed,
+        "miners_per_second": args.miners / _elapsed,
+        "failed_miners": len(_failed_miner_uids),
+        "phases": _phases,
+        "http_calls": get_http_calls_per_phase(_servers),
+        "docker_calls": dict(sorted(_docker_client.calls.items())),
+        "result_cache": {
+            "hits": controller.result_cache.hits,
+            "misses": controller.result_cache.misses,
+        },
+    }
+
+
+def print_report(report: dict):
+    print(
+        f"\n{report['config']['miners']} miners in {report['elapsed_seconds']:.2f}s "
+        f"({report['miners_per_second']:.2f} miners/s), {report['failed_miners']} failed\n"
+    )
+    print(
+        f"{'phase':<44}{'count':>8}{'errors':>8}{'total':>10}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}"
+    )
+    for name, stats in report["phases"].items():
+        print(
+            f"{name:<44}{stats['count']:>8}{stats['errors']:>8}{stats['total']:>10.3f}{stats['p50']:>10.4f}"
+            f"{stats['p90']:>10.4f}{stats['p99']:>10.4f}{stats['max']:>10.4f}"
+        )
+    print("\nHTTP calls per phase:")
+    for phase, calls in sorted(report["http_calls"].items()):
+        print(f"  {phase}: {sum(calls.values())} {calls}")
+    print(f"\nDocker calls: {report['docker_calls']}")
+    print(f"Result cache: {report['result_cache']}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--miners", type=int, default=200)
+    parser.add_argument(
+        "--tasks", type=int, default=1, help="Challenge inputs per miner"
+    )
+    parser.add_argument("--references", type=int, default=5)
+    parser.add_argument(
+        "--latency", type=float, default=0.005, help="Default stub route latency (s)"
+    )
+    parser.add_argument("--solve-latency", type=float, default=0.02)
+    parser.add_argument("--score-latency", type=float, default=0.01)
+    parser.add_argument("--compare-latency", type=float, default=0.01)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--run-latency", type=float, default=0.01)
+    parser.add_argument("--pull-latency", type=float, default=0.02)
+    parser.add_argument("--stop-latency", type=float, default=0.01)
+    parser.add_argument("--max-concurrent-miners", type=int, default=1)
+    parser.add_argument("--pipeline", action="store_true")
+    parser.add_argument("--solve-concurrency", type=int, default=1)
+    parser.add_argument("--batch-scoring", action="store_true")
+    parser.add_argument(
+        "--no-resource-usage", dest="resource_usage", action="store_false"
+    )
+    parser.add_argument(
+        "--deterministic",
+        action="store_true",
+        help="Serve the same tasks on every run and cache the solve and score results",
+    )
+    parser.add_argument(
+        "--cache-dir", help="Result cache directory to reuse across runs"
+    )
+    parser.add_argument("--output", help="Write the report to this JSON file")
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+
+    report = run_benchmark(args)
+    print_report(report)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
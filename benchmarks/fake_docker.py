@@ -0,0 +1,337 @@
+from typing import Iterator
+import hashlib
+import itertools
+import threading
+import time
+
+import docker.errors
+
+
+class FakeImage:
+    def __init__(self, name: str, size: int):
+        self.id = f"sha256:{hashlib.sha256(name.encode('utf-8')).hexdigest()}"
+        self.tags = [name]
+        self.attrs = {"Id": self.id, "Size": size}
+
+
+class FakeContainer:
+    """Container record of `FakeDockerClient`, running until it is stopped or removed."""
+
+    def __init__(
+        self,
+        client: "FakeDockerClient",
+        image: str,
+        name: str,
+        labels: dict,
+        ports: dict | None,
+        network: str | None,
+    ):
+        self.client = client
+        self.id = hashlib.sha256(f"{name}-{time.time_ns()}".encode()).hexdigest()
+        self.name = name
+        self.image = image
+        self.labels = labels
+        self.status = "running"
+        # Published ports are bound to the same host port, i.e. the port of the stub server
+        self.attrs = {
+            "Image": client.images.get_id(image),
+            "NetworkSettings": {
+                "Networks": (
+                    {network: {"IPAddress": "127.0.0.1"}} if network else {"bridge": {}}
+                ),
+                "Ports": {
+                    container_port: [
+                        {
+                            "HostIp": "127.0.0.1",
+                            "HostPort": container_port.split("/")[0],
+                        }
+                    ]
+                    for container_port in (ports or {})
+                },
+            },
+        }
+
+    def reload(self):
+        pass
+
+    def logs(self) -> bytes:
+        return b""
+
+    def stop(self, timeout: int = 10):
+        time.sleep(self.client.stop_latency)
+        self.status = "exited"
+
+    def remove(self, force: bool = False, v: bool = False):
+        if self.status == "running" and not force:
+            raise docker.errors.APIError("Container is running")
+        self.client.containers.discard(self.id)
+
+    def stats(self, stream: bool = True, decode: bool = True) -> Iterator[dict]:
+        """Yields a synthetic stats sample every `stats_interval` seconds while running."""
+        for index in itertools.count(1):
+            if self.status != "running":
+                return
+            yield {
+                "memory_stats": {"stats": {"anon": 64 * 1024 * 1024 + index * 4096}},
+                "cpu_stats": {"cpu_usage": {"total_usage": index * 10_000_000}},
+                "networks": {
+                    "eth0": {"rx_bytes": index * 1024, "tx_bytes": index * 512}
+                },
+            }
+            time.sleep(self.client.stats_interval)
+
+    def matches(self, filters: dict | None) -> bool:
+        for key, value in (filters or {}).items():
+            _values = value if isinstance(value, list) else [value]
+            if key == "label":
+                for label in _values:
+                    _key, _, _value = label.partition("=")
+                    if _key not in self.labels or (
+                        _value and self.labels[_key] != _value
+                    ):
+                        return False
+            elif key == "expose":
+                _ports = self.attrs["NetworkSettings"]["Ports"]
+                if not any(
+                    f"{port}/tcp" in _ports or int(port) in self.client.exposed_ports
+                    for port in _values
+                ):
+                    return False
+            elif key == "status":
+                if self.status not in _values:
+                    return False
+            elif key == "name":
+                if self.name not in _values:
+                    return False
+        return True
+
+
+class _ContainerCollection:
+    def __init__(self, client: "FakeDockerClient"):
+        self._client = client
+        self._lock = threading.Lock()
+        self._containers: dict[str, FakeContainer] = {}
+
+    def run(
+        self,
+        image: str,
+        name: str | None = None,
+        labels: dict | None = None,
+        ports: dict | None = None,
+        network: str | None = None,
+        **kwargs,
+    ) -> FakeContainer:
+        time.sleep(self._client.run_latency)
+        with self._lock:
+            _name = name or f"container_{len(self._containers)}_{time.time_ns()}"
+            if any(container.name == _name for container in self._containers.values()):
+                raise docker.errors.APIError(f"Conflict: name {_name} is in use")
+            _container = FakeContainer(
+                client=self._client,
+                image=image,
+                name=_name,
+                labels=labels or {},
+                ports=ports,
+                network=network,
+            )
+            self._containers[_container.id] = _container
+            self._client.count("containers.run")
+            return _container
+
+    def get(self, container_id: str) -> FakeContainer:
+        with self._lock:
+            for container in self._containers.values():
+                if container_id in (container.id, container.name):
+                    return container
+        raise docker.errors.NotFound(f"No such container: {container_id}")
+
+    def list(self, all: bool = False, filters: dict | None = None) -> list:
+        with self._lock:
+            return [
+                container
+                for container in self._containers.values()
+                if (all or container.status == "running") and container.matches(filters)
+            ]
+
+    def discard(self, container_id: str):
+        with self._lock:
+            self._containers.pop(container_id, None)
+            self._client.count("containers.remove")
+
+
+class _ImageCollection:
+    def __init__(self, client: "FakeDockerClient"):
+        self._client = client
+        self._lock = threading.Lock()
+        self._images: dict[str, FakeImage] = {}
+
+    def add(self, name: str) -> FakeImage:
+        with self._lock:
+            return self._images.setdefault(
+                name, FakeImage(name, size=self._client.image_size)
+            )
+
+    def get(self, name: str) -> FakeImage:
+        with self._lock:
+            if name in self._images:
+                return self._images[name]
+            for image in self._images.values():
+                if name == image.id:
+                    return image
+        raise docker.errors.ImageNotFound(f"No such image: {name}")
+
+    def get_id(self, name: str) -> str:
+        try:
+            return self.get(name).id
+        except docker.errors.ImageNotFound:
+            return self.add(name).id
+
+    def list(self) -> list[FakeImage]:
+        with self._lock:
+            return list(self._images.values())
+
+    def remove(self, image: str, force: bool = False):
+        with self._lock:
+            for name, _image in list(self._images.items()):
+                if image in (name, _image.id):
+                    del self._images[name]
+                    return
+        raise docker.errors.ImageNotFound(f"No such image: {image}")
+
+
+class _NetworkCollection:
+    def __init__(self):
+        self._networks: set[str] = set()
+
+    def list(self, names: list[str] | None = None) -> list[str]:
+        return [name for name in self._networks if not names or name in names]
+
+    def create(self, name: str, **kwargs) -> str:
+        self._networks.add(name)
+        return name
+
+    def get(self, name: str) -> str:
+        if name not in self._networks:
+            raise docker.errors.NotFound(f"No such network: {name}")
+        return name
+
+    def prune(self) -> dict:
+        return {"NetworksDeleted": []}
+
+
+class _VolumeCollection:
+    def prune(self, filters: dict | None = None) -> dict:
+        return {"VolumesDeleted": [], "SpaceReclaimed": 0}
+
+
+class _APIClient:
+    """Low-level API calls used by `docker_utils`."""
+
+    def __init__(self, client: "FakeDockerClient"):
+        self._client = client
+
+    def pull(self, repository: str, tag: str = "latest", **kwargs) -> Iterator[dict]:
+        self._client.count("api.pull")
+        _digest = hashlib.sha256(f"{repository}:{tag}".encode()).hexdigest()[:12]
+        yield {"status": "Pulling fs layer", "id": _digest}
+        time.sleep(self._client.pull_latency)
+        yield {
+            "status": "Downloading",
+            "id": _digest,
+            "progressDetail": {"total": self._client.image_size},
+        }
+        _separator = "@" if tag.startswith("sha256:") else ":"
+        self._client.images.add(f"{repository}{_separator}{tag}")
+        yield {"status": "Download complete", "id": _digest}
+
+    def containers(
+        self, all: bool = False, size: bool = False, filters: dict | None = None
+    ) -> list[dict]:
+        return [
+            {
+                "Id": container.id,
+                "Names": [f"/{container.name}"],
+                "ImageID": container.attrs["Image"],
+                "State": container.status,
+                "SizeRw": 0,
+            }
+            for container in self._client.containers.list(all=all, filters=filters)
+        ]
+
+    def remove_container(self, container_id: str, v: bool = False, force: bool = False):
+        self._client.containers.get(container_id).remove(force=force, v=v)
+
+    def prune_builds(self) -> dict:
+        return {"SpaceReclaimed": 0}
+
+
+class _EventStream:
+    """Events stream without events, ends when it is closed."""
+
+    def __init__(self):
+        self._closed = threading.Event()
+
+    def __iter__(self):
+        self._closed.wait()
+        return iter(())
+
+    def close(self):
+        self._closed.set()
+
+
+class FakeDockerClient:
+    """
+    In-memory stand-in of `docker.DockerClient` for the calls made by the controller and
+    `docker_utils`. Container starts, image pulls and container stops take a configurable time,
+    and the number of calls of each operation is counted in `calls`.
+    """
+
+    def __init__(
+        self,
+        run_latency: float = 0.0,
+        pull_latency: float = 0.0,
+        stop_latency: float = 0.0,
+        stats_interval: float = 0.5,
+        image_size: int = 512 * 1024 * 1024,
+        num_cpus: int = 64,
+        mem_total: int = 256 * 1024**3,
+        exposed_ports: tuple[int, ...] = (),
+    ):
+        """
+        Args:
+            run_latency: Time to create and start a container (seconds)
+            pull_latency: Time to pull an image (seconds)
+            stop_latency: Time to stop a container (seconds)
+            stats_interval: Interval of the stats stream samples (seconds)
+            image_size: Size of every image (bytes)
+            num_cpus: CPUs reported by `info`
+            mem_total: Memory reported by `info` (bytes)
+            exposed_ports: Ports exposed by every image, matched by the "expose" filter
+        """
+        self.run_latency = run_latency
+        self.pull_latency = pull_latency
+        self.stop_latency = stop_latency
+        self.stats_interval = stats_interval
+        self.image_size = image_size
+        self.exposed_ports = set(exposed_ports)
+        self._info = {"NCPU": num_cpus, "MemTotal": mem_total}
+
+        self._lock = threading.Lock()
+        # Number of calls, keyed by operation
+        self.calls: dict[str, int] = {}
+
+        self.containers = _ContainerCollection(self)
+        self.images = _ImageCollection(self)
+        self.networks = _NetworkCollection()
+        self.volumes = _VolumeCollection()
+        self.api = _APIClient(self)
+
+    def info(self) -> dict:
+        return dict(self._info)
+
+    def events(self, decode: bool = True, filters: dict | None = None) -> _EventStream:
+        return _EventStream()
+
+    def count(self, operation: str):
+        with self._lock:
+            self.calls[operation] = self.calls.get(operation, 0) + 1
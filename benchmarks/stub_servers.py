@@ -0,0 +1,269 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+import hashlib
+import itertools
+import json
+import random
+import threading
+import time
+import uuid
+
+# Route handler, receives the decoded JSON body (None for GET) and returns (status code, JSON body)
+RouteHandler = Callable[[Any], tuple[int, Any]]
+
+
+class StubServer:
+    """
+    Local stand-in HTTP server answering JSON routes with a configurable latency.
+
+    Routes are matched by the longest registered path prefix, so "/compare/all" and
+    "/check/challenge" also answer their sub-paths. Call counts and the time spent in every
+    route (latency included) are recorded per route.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        routes: dict[tuple[str, str], RouteHandler],
+        latency: dict[str, float] | None = None,
+        default_latency: float = 0.0,
+        jitter: float = 0.0,
+    ):
+        """
+        Args:
+            name: Name of the server in reports
+            routes: Handlers keyed by (HTTP method, path prefix)
+            latency: Latency per path prefix (seconds), `default_latency` for other routes
+            default_latency: Latency of routes without a configured latency (seconds)
+            jitter: Uniform random latency added to every request (seconds)
+        """
+        self.name = name
+        self.routes = routes
+        self.latency = latency or {}
+        self.default_latency = default_latency
+        self.jitter = jitter
+
+        self._lock = threading.Lock()
+        # Call counts and busy time (seconds), keyed by "<METHOD> <path prefix>"
+        self.calls: dict[str, int] = {}
+        self.busy_seconds: dict[str, float] = {}
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name=f"stub_{self.name}", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset_stats(self):
+        with self._lock:
+            self.calls = {}
+            self.busy_seconds = {}
+
+    def get_stats(self) -> dict[str, dict]:
+        with self._lock:
+            return {
+                route: {"calls": _calls, "busy_seconds": self.busy_seconds[route]}
+                for route, _calls in sorted(self.calls.items())
+            }
+
+    def _match_route(self, method: str, path: str) -> str | None:
+        _path = path.split("?", 1)[0]
+        _matches = [
+            prefix
+            for _method, prefix in self.routes
+            if _method == method
+            and (_path == prefix or _path.startswith(prefix.rstrip("/") + "/"))
+        ]
+        return max(_matches, key=len) if _matches else None
+
+    def _get_latency(self, prefix: str) -> float:
+        _latency = self.latency.get(prefix, self.default_latency)
+        if self.jitter:
+            _latency += random.uniform(0, self.jitter)
+        return _latency
+
+    def _record(self, route: str, seconds: float):
+        with self._lock:
+            self.calls[route] = self.calls.get(route, 0) + 1
+            self.busy_seconds[route] = self.busy_seconds.get(route, 0.0) + seconds
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        _stub = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                self._handle("GET")
+
+            def do_POST(self):
+                self._handle("POST")
+
+            def log_message(self, format, *args):
+                pass
+
+            def _handle(self, method: str):
+                _start_time = time.perf_counter()
+                _length = int(self.headers.get("Content-Length", 0) or 0)
+                _raw_body = self.rfile.read(_length) if _length else b""
+                _prefix = _stub._match_route(method, self.path)
+                if _prefix is None:
+                    self._respond(404, {"detail": "Not Found"})
+                    _stub._record(f"{method} <unknown>", 0.0)
+                    return
+
+                time.sleep(_stub._get_latency(_prefix))
+                try:
+                    _body = json.loads(_raw_body) if _raw_body else None
+                    _status, _payload = _stub.routes[(method, _prefix)](_body)
+                except Exception as e:
+                    _status, _payload = 500, {"detail": str(e)}
+                self._respond(_status, _payload)
+                _stub._record(f"{method} {_prefix}", time.perf_counter() - _start_time)
+
+            def _respond(self, status: int, payload: Any):
+                _data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(_data)))
+                self.end_headers()
+                self.wfile.write(_data)
+
+        return _Handler
+
+
+def create_challenge_server(
+    script_key: str = "script",
+    score_batch: bool = True,
+    max_batch_size: int = 32,
+    deterministic_tasks: bool = False,
+    **server_kwargs,
+) -> StubServer:
+    """
+    Creates a stand-in challenge container serving `/health`, `/task`, `/score`, `/score/batch`,
+    `/capabilities` and `/reset`. Scores are derived from the miner output, so the same output
+    always gets the same score. With `deterministic_tasks`, every server serves the same
+    sequence of tasks.
+    """
+    _task_counter = itertools.count()
+
+    def _score(miner_output: dict | None) -> float:
+        _script = (miner_output or {}).get(script_key, "") or ""
+        _digest = hashlib.sha256(_script.encode("utf-8")).digest()
+        return round(0.5 + int.from_bytes(_digest[:4], "big") % 500 / 1000, 3)
+
+    def _task(_) -> tuple[int, Any]:
+        if deterministic_tasks:
+            _index = next(_task_counter)
+            return 200, {"task_id": f"task_{_index}", "payload": _index}
+        return 200, {"task_id": uuid.uuid4().hex, "payload": random.random()}
+
+    def _score_single(body: dict) -> tuple[int, Any]:
+        return 200, _score(body.get("miner_output"))
+
+    def _score_batch(body: dict) -> tuple[int, Any]:
+        return 200, {
+            "scores": [_score(item.get("miner_output")) for item in body["pairs"]]
+        }
+
+    return StubServer(
+        name="challenge",
+        routes={
+            ("GET", "/health"): lambda _: (200, {"status": "ok"}),
+            ("GET", "/task"): _task,
+            ("POST", "/score"): _score_single,
+            ("POST", "/score/batch"): _score_batch,
+            ("GET", "/capabilities"): lambda _: (
+                200,
+                {"score_batch": score_batch, "max_batch_size": max_batch_size},
+            ),
+            ("POST", "/reset"): lambda _: (200, {"status": "ok"}),
+        },
+        **server_kwargs,
+    )
+
+
+def create_miner_server(script_key: str = "script", **server_kwargs) -> StubServer:
+    """
+    Creates a stand-in miner container serving `/health` and `/solve`. Every solve returns a
+    new script, so comparisons are never answered by the similarity cache.
+    """
+
+    def _solve(body: dict) -> tuple[int, Any]:
+        return 200, {
+            script_key: f"# solution {uuid.uuid4().hex}\nprint({json.dumps(body)!r})"
+        }
+
+    return StubServer(
+        name="miner",
+        routes={
+            ("GET", "/health"): lambda _: (200, {"status": "ok"}),
+            ("POST", "/solve"): _solve,
+        },
+        **server_kwargs,
+    )
+
+
+def create_internal_services_server(
+    similarity_score: float = 0.1, **server_kwargs
+) -> StubServer:
+    """
+    Creates a stand-in internal services API serving `/compare`, `/compare/all`,
+    `/compare/all/batch`, `/compare/same-score`, `/compare/baseline-scripts` and
+    `/check/challenge/{type}`. Every comparison answers `similarity_score`, below the
+    acceptance thresholds by default so that every comparison step runs.
+    """
+
+    def _comparison(_) -> tuple[int, Any]:
+        return 200, {
+            "data": {"similarity_score": similarity_score, "reason": "benchmark"}
+        }
+
+    def _compare_all_batch(body: dict) -> tuple[int, Any]:
+        return 200, {
+            "data": {
+                "similarity_scores": [similarity_score]
+                * len(body.get("reference_scripts", []) or [])
+            }
+        }
+
+    return StubServer(
+        name="internal_services",
+        routes={
+            ("POST", "/compare"): _comparison,
+            ("POST", "/compare/all"): _comparison,
+            ("POST", "/compare/all/batch"): _compare_all_batch,
+            ("POST", "/compare/same-score"): _comparison,
+            ("POST", "/compare/baseline-scripts"): lambda _: (
+                200,
+                {
+                    "data": [
+                        {
+                            "target": "script_1",
+                            "similarity_score": similarity_score,
+                            "reason": "benchmark",
+                        }
+                    ]
+                },
+            ),
+            ("POST", "/check/challenge"): lambda _: (200, {"data": {"is_valid": True}}),
+        },
+        **server_kwargs,
+    )
@@ -0,0 +1,96 @@
+import threading
+
+import bittensor as bt
+import docker.models.containers
+
+
+class ContainerStatsCollector:
+    """
+    Samples the resource usage of a container from its Docker stats stream in a background
+    thread, between `start` and `stop`.
+
+    The summary holds the peak resident memory, the CPU time and the network traffic of the
+    container over the sampled window.
+    """
+
+    def __init__(self, container: docker.models.containers.Container):
+        """
+        Args:
+            container: Container to sample
+        """
+        self.container = container
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self._samples = 0
+        self._peak_rss_bytes = 0
+        self._first_sample: dict | None = None
+        self._last_sample: dict | None = None
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._collect,
+            name=f"stats_{self.container.name}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> dict:
+        """
+        Stops sampling. The stats stream delivers about one sample per second, so the
+        background thread ends with the next sample.
+
+        Returns:
+            dict: Peak RSS (bytes), CPU time (seconds), received and transmitted network
+                bytes over the sampled window, and the number of samples
+        """
+        self._stop_event.set()
+        return self.get_summary()
+
+    def get_summary(self) -> dict:
+        with self._lock:
+            if not self._first_sample or not self._last_sample:
+                return {"samples": 0}
+            _first, _last = self._first_sample, self._last_sample
+            return {
+                "samples": self._samples,
+                "peak_rss_bytes": self._peak_rss_bytes,
+                "cpu_seconds": (_last["cpu_ns"] - _first["cpu_ns"]) / 1e9,
+                "network_rx_bytes": _last["rx_bytes"] - _first["rx_bytes"],
+                "network_tx_bytes": _last["tx_bytes"] - _first["tx_bytes"],
+            }
+
+    def _collect(self):
+        try:
+            for stats in self.container.stats(stream=True, decode=True):
+                if self._stop_event.is_set():
+                    return
+                self._add_sample(stats)
+        except Exception as e:
+            # Stream ends with an error when the container is removed
+            bt.logging.debug(
+                f"[STATS] Stats stream of {self.container.name} ended: {e}"
+            )
+
+    def _add_sample(self, stats: dict):
+        _memory_stats = stats.get("memory_stats", {}) or {}
+        _memory_details = _memory_stats.get("stats", {}) or {}
+        # cgroup v1 reports "rss", cgroup v2 reports "anon"
+        _rss_bytes = _memory_details.get(
+            "rss", _memory_details.get("anon", _memory_stats.get("usage", 0))
+        )
+        _networks = (stats.get("networks", {}) or {}).values()
+        _sample = {
+            "cpu_ns": (stats.get("cpu_stats", {}) or {})
+            .get("cpu_usage", {})
+            .get("total_usage", 0),
+            "rx_bytes": sum(network.get("rx_bytes", 0) for network in _networks),
+            "tx_bytes": sum(network.get("tx_bytes", 0) for network in _networks),
+        }
+        with self._lock:
+            self._samples += 1
+            self._peak_rss_bytes = max(self._peak_rss_bytes, _rss_bytes or 0)
+            if self._first_sample is None:
+                self._first_sample = _sample
+            self._last_sample = _sample
@@ -1,5 +1,11 @@
 from abc import abstractmethod
+from typing import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 import copy
+import hashlib
+import json
+import os
+import threading
 import time
 import traceback
 
@@ -7,6 +13,16 @@ import bittensor as bt
 import requests
 
 from redteam_core.challenge_pool import docker_utils
+from redteam_core.challenge_pool.container_stats import ContainerStatsCollector
+from redteam_core.challenge_pool.http_client import HTTPClient
+from redteam_core.challenge_pool.image_cache import ImageCache
+from redteam_core.challenge_pool.image_prefetcher import ImagePrefetcher
+from redteam_core.challenge_pool.pipeline import EvaluationPipeline
+from redteam_core.challenge_pool.result_cache import ResultCache
+from redteam_core.challenge_pool.similarity_cache import SimilarityCache
+from redteam_core.challenge_pool.task_generator import TaskGenerator
+from redteam_core import tracing
+from redteam_core.validator.blob_store import BlobStore
 from redteam_core.validator.models import (
     MinerChallengeCommit,
     ScoringLog,
@@ -15,6 +31,32 @@ from redteam_core.validator.models import (
 from redteam_core.config.main import constants
 
 
+def _hash_input(miner_input) -> str:
+    """Hashes a miner input the same way as `ScoringLog.input_hash`."""
+    return hashlib.sha256(json.dumps(miner_input).encode("utf-8")).hexdigest()
+
+
+def _hash_payload(payload) -> str:
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+class _DeferredMinerStart:
+    """
+    Start of a miner container deferred because its solve results were cached, shared by the
+    solve workers of the miner so that the container is started at most once.
+    """
+
+    def __init__(self, miner_commit: MinerChallengeCommit):
+        self.miner_commit = miner_commit
+        self.lock = threading.Lock()
+        self.started = False
+        self.error: Exception | None = None
+        # Miner context of the started container (container, ip and port)
+        self.context: dict = {}
+
+
 class Controller:
     """
     A class to manage the lifecycle of a challenge, including the initialization
@@ -47,9 +89,60 @@ class Controller:
         self.miners_docker_info = miners_docker_info
 
         self.docker_client = docker_utils.create_docker_client()
+        self.image_cache = ImageCache(
+            client=self.docker_client,
+            cache_dir=os.path.join(constants.CACHE_DIR, "images"),
+            max_bytes=constants.IMAGE_CACHE_MAX_BYTES,
+        )
+
+        self.similarity_cache = SimilarityCache(
+            cache_dir=os.path.join(constants.CACHE_DIR, "similarity"),
+            ttl=constants.SIMILARITY_CACHE_TTL,
+            size_limit=constants.SIMILARITY_CACHE_MAX_BYTES,
+        )
+        # Interned payloads of the comparison logs of this run
+        self.blob_store = BlobStore()
+        self.result_cache = ResultCache(
+            cache_dir=os.path.join(constants.CACHE_DIR, "results"),
+            size_limit=constants.RESULT_CACHE_MAX_BYTES,
+        )
+        # Local image ID of the challenge, set in `_setup_challenge`
+        self._challenge_image_digest: str | None = None
+
+        # Pooled HTTP clients per target, retry policies can be overridden in `http_client_config`
+        _http_client_config = self.challenge_info.get("http_client_config", {})
+        self.challenge_http_client = HTTPClient(
+            name="challenge",
+            **{"max_retries": 2, **_http_client_config.get("challenge", {})},
+        )
+        self.miner_http_client = HTTPClient(
+            name="miner", **_http_client_config.get("miner", {})
+        )
+        self.internal_services_http_client = HTTPClient(
+            name="internal_services",
+            **{"max_retries": 2, **_http_client_config.get("internal_services", {})},
+        )
 
         self.local_network = "redteam_local"
+        # Miner endpoint is bound per evaluation thread for parallel miner workers
+        self._miner_context = threading.local()
+        self._parallel_miners = False
         self.miner_ip = None
+        self.image_prefetcher: ImagePrefetcher | None = None
+        self.evaluation_pipeline: EvaluationPipeline | None = None
+        # Background cleanup of the run's Docker resources, resolves to the cleanup report
+        self.cleanup_future: Future | None = None
+        # Resource usage of the evaluated miners, keyed by "<miner_uid>_<miner_hotkey>"
+        self.resource_usage: dict[str, dict] = {}
+        self._resource_usage_lock = threading.Lock()
+        self.task_generator: TaskGenerator | None = None
+        # Time to ready (seconds) of started containers, keyed by challenge name or miner image
+        self.container_ready_times: dict[str, float] = {}
+        # Optional features of the challenge container, negotiated on first use
+        self._challenge_capabilities: dict | None = None
+        self._capabilities_lock = threading.Lock()
+        # Unknown until the internal services answer the first batch comparison request
+        self._compare_all_batch_supported: bool | None = None
 
         self.max_self_comparison_score = self.challenge_info["comparison_config"].get(
             "max_self_comparison_score", 0.9
@@ -58,20 +151,89 @@ class Controller:
             "challenge_min_acceptable_score", 0.6
         )
 
+    @property
+    def miner_ip(self) -> str | None:
+        """IP address of the miner container evaluated by the current thread."""
+        return getattr(self._miner_context, "ip", None)
+
+    @miner_ip.setter
+    def miner_ip(self, value: str | None):
+        self._miner_context.ip = value
+
+    @property
+    def miner_port(self) -> int:
+        """Port of the miner container evaluated by the current thread."""
+        return getattr(self._miner_context, "port", constants.MINER_DOCKER_PORT)
+
+    @miner_port.setter
+    def miner_port(self, value: int):
+        self._miner_context.port = value
+
+    def _start_deferred_miner_container(self):
+        """
+        Starts the miner container whose start was deferred because its solve results were cached,
+        on the first cache miss. The container is started once for all the solve workers of the
+        miner, and its endpoint is bound to the calling thread.
+        """
+        _deferred_start: _DeferredMinerStart | None = getattr(
+            self._miner_context, "deferred_start", None
+        )
+        if _deferred_start is None:
+            return
+
+        with _deferred_start.lock:
+            if not _deferred_start.started:
+                _deferred_start.started = True
+                try:
+                    self._setup_miner_container(_deferred_start.miner_commit)
+                except Exception as e:
+                    _deferred_start.error = e
+                finally:
+                    # Kept even if the setup failed, so that the container is released
+                    _deferred_start.context = {
+                        key: value
+                        for key, value in self._miner_context.__dict__.items()
+                        if key in ("container", "ip", "port")
+                    }
+
+        self._miner_context.__dict__.update(_deferred_start.context)
+        if _deferred_start.error is not None:
+            raise RuntimeError(
+                f"Deferred miner container failed to start: {_deferred_start.error}"
+            )
+
+    def _is_deterministic(self) -> bool:
+        """Whether solve and score results can be cached, see `ResultCache`."""
+        return (
+            self.challenge_info.get("deterministic", False)
+            and self._challenge_image_digest is not None
+        )
+
     def _setup_challenge(self):
         """
         Sets up the challenge environment by building and running the challenge container
         in an isolated Docker network. Includes building the image, creating the network,
         and verifying the container's health status.
+
+        With `reuse_challenge_container` enabled, a healthy container from a previous run is reset
+        and reused as long as the image and `challenge_container_run_kwargs` are unchanged.
         """
 
-        # Remove existing challenge container
-        docker_utils.remove_container(
+        _challenge_image = self.challenge_info["challenge_image"]
+        _challenge_run_kwargs = self.challenge_info.get(
+            "challenge_container_run_kwargs", {}
+        )
+        _config_hash = docker_utils.get_container_config_hash(
             client=self.docker_client,
-            container_name=self.challenge_name,
-            stop_timeout=10,
-            force=True,
-            remove_volumes=True,
+            image=_challenge_image,
+            container_run_kwargs=_challenge_run_kwargs,
+        )
+        self.task_generator = TaskGenerator(
+            fetch_task=self._get_challenge_from_container,
+            cache_dir=os.path.join(constants.CACHE_DIR, "tasks", self.challenge_name),
+            pool_key=_config_hash,
+            max_concurrency=self.challenge_info.get("task_generation_concurrency", 4),
+            ttl=self.challenge_info.get("task_pool_ttl", 24 * 60 * 60),
         )
 
         # Create network
@@ -81,26 +243,117 @@ class Controller:
             allow_internet=False,
         )
 
+        self.image_cache.pin(_challenge_image)
+        self._challenge_image_digest = docker_utils.get_image_id(
+            client=self.docker_client, image=_challenge_image
+        )
+        if self.challenge_info.get("reuse_challenge_container", False):
+            self.challenge_container = self._get_warm_challenge_container(
+                config_hash=_config_hash
+            )
+            if self.challenge_container:
+                return
+
+        # Remove existing challenge container
+        docker_utils.remove_container(
+            client=self.docker_client,
+            container_name=self.challenge_name,
+            stop_timeout=10,
+            force=True,
+            remove_volumes=True,
+        )
+
         self.challenge_container = docker_utils.run_container(
             client=self.docker_client,
-            image=self.challenge_info["challenge_image"],
+            image=_challenge_image,
             detach=True,
             ports={
                 f"{constants.CHALLENGE_DOCKER_PORT}/tcp": constants.CHALLENGE_DOCKER_PORT
             },
-            **self.challenge_info.get("challenge_container_run_kwargs", {}),
+            **{
+                **_challenge_run_kwargs,
+                "labels": {
+                    **_challenge_run_kwargs.get("labels", {}),
+                    docker_utils.CONFIG_HASH_LABEL: _config_hash,
+                },
+            },
         )
         bt.logging.info(
             f"[CONTROLLER] Challenge container started: {self.challenge_container.status}"
         )
 
         _protocol, _ssl_verify = self._check_protocol(is_challenger=True)
-        docker_utils.check_container_alive(
-            container=self.challenge_container,
-            health_port=constants.CHALLENGE_DOCKER_PORT,
+        self.container_ready_times[self.challenge_name] = (
+            docker_utils.check_container_alive(
+                container=self.challenge_container,
+                health_port=constants.CHALLENGE_DOCKER_PORT,
+                protocol=_protocol,
+                ssl_verify=_ssl_verify,
+            )
+        )
+
+    def _get_warm_challenge_container(self, config_hash: str):
+        """
+        Returns the challenge container left running by a previous run if it can be reused,
+        i.e. it was started with the same image and run configuration, it is healthy and its
+        state was reset successfully. Returns None if the container has to be recreated.
+        """
+        _container = docker_utils.get_container(
+            client=self.docker_client, container_name=self.challenge_name
+        )
+        if not _container or _container.status != "running":
+            return None
+        if _container.labels.get(docker_utils.CONFIG_HASH_LABEL) != config_hash:
+            bt.logging.info(
+                "[CONTROLLER] Challenge container configuration changed, recreating it"
+            )
+            return None
+
+        _protocol, _ssl_verify = self._check_protocol(is_challenger=True)
+        if not docker_utils.is_container_alive(
+            port=constants.CHALLENGE_DOCKER_PORT,
             protocol=_protocol,
             ssl_verify=_ssl_verify,
+            ip="localhost",
+            http_client=self.challenge_http_client,
+            request_timeout=10,
+        ):
+            bt.logging.info(
+                "[CONTROLLER] Challenge container is not healthy, recreating it"
+            )
+            return None
+        if not self._reset_challenge_container():
+            return None
+
+        bt.logging.info(
+            f"[CONTROLLER] Reusing warm challenge container {_container.name}"
         )
+        self.container_ready_times[self.challenge_name] = 0.0
+        return _container
+
+    def _reset_challenge_container(self) -> bool:
+        """
+        Resets the state of a reused challenge container through its reset endpoint
+        (`challenge_reset_endpoint`, default "/reset").
+
+        Returns:
+            bool: True if the container was reset, False if it has to be recreated
+        """
+        _protocol, _ssl_verify = self._check_protocol(is_challenger=True)
+        _reset_endpoint = self.challenge_info.get("challenge_reset_endpoint", "/reset")
+        try:
+            response = self.challenge_http_client.post(
+                f"{_protocol}://localhost:{constants.CHALLENGE_DOCKER_PORT}{_reset_endpoint}",
+                verify=_ssl_verify,
+                timeout=self.challenge_info.get("challenge_reset_timeout", 60),
+            )
+            response.raise_for_status()
+            return True
+        except Exception as e:
+            bt.logging.warning(
+                f"[CONTROLLER] Failed to reset challenge container, recreating it: {e}"
+            )
+            return False
 
     def start_challenge(self):
         """
@@ -108,97 +361,524 @@ class Controller:
 
         This process involves:
         1. Building and running the challenge container within an isolated Docker network.
-        2. Generating or retrieving challenge inputs to evaluate miners.
-        3. Iteratively running each miner's Docker container to submit and score their solutions.
+        2. Generating or retrieving challenge inputs to evaluate miners, taking pre-generated tasks
+           from the task pool first and requesting the rest concurrently. The pool is refilled in
+           the background up to `task_pool_size` while miners are evaluated.
+        3. Running each miner's Docker container to submit and score their solutions, either one by one
+           in a bounded pool of parallel workers when `max_concurrent_miners` is configured, or through
+           pipeline stages (start, solve, stop, compare, score) when `evaluation_pipeline` is enabled.
         4. Collecting and logging the results, including any errors encountered during execution.
-        5. Cleaning up Docker resources to ensure no residual containers or images remain.
+        5. Cleaning up Docker resources once per run in the background, evicting miner images only when
+           the image cache exceeds its disk budget.
 
         The method ensures that each miner's submission is evaluated against the challenge inputs,
         and comparison logs are generated to assess performance relative to reference commits.
         """
-        self._setup_challenge()
+        with tracing.span("controller.start_challenge", challenge=self.challenge_name):
+            docker_utils.remove_orphan_containers(
+                client=self.docker_client, role="miner"
+            )
+            with tracing.span("controller.setup_challenge"):
+                self._setup_challenge()
 
-        num_task = self.challenge_info.get(
-            "num_tasks", constants.N_CHALLENGES_PER_EPOCH
-        )
-        # Start with seed inputs and generate more if needed to reach num_task
-        challenge_inputs = self.seed_inputs.copy()
-        remaining_tasks = max(0, num_task - len(challenge_inputs))
-        if remaining_tasks > 0:
-            challenge_inputs.extend(
-                [self._get_challenge_from_container() for _ in range(remaining_tasks)]
+            num_task = self.challenge_info.get(
+                "num_tasks", constants.N_CHALLENGES_PER_EPOCH
             )
+            # Start with seed inputs and generate more if needed to reach num_task
+            challenge_inputs = self.seed_inputs.copy()
+            remaining_tasks = max(0, num_task - len(challenge_inputs))
+            if remaining_tasks > 0:
+                with tracing.span(
+                    "controller.generate_tasks", num_tasks=remaining_tasks
+                ):
+                    challenge_inputs.extend(
+                        self.task_generator.generate(remaining_tasks)
+                    )
 
-        bt.logging.debug(
-            f"[CONTROLLER] Generated {len(challenge_inputs)} challenge inputs"
-        )
+            bt.logging.debug(
+                f"[CONTROLLER] Generated {len(challenge_inputs)} challenge inputs"
+            )
 
-        for miner_commit in self.miner_commits:
-            uid, hotkey = miner_commit.miner_uid, miner_commit.miner_hotkey
+            # Pre-generate tasks of the next runs while miners are evaluated
+            _task_pool_size = self.challenge_info.get("task_pool_size", 0)
+            if _task_pool_size > 0:
+                self.task_generator.start_prefill(
+                    target_size=_task_pool_size,
+                    max_concurrency=self.challenge_info.get("task_pool_concurrency", 1),
+                )
+
+            self.image_prefetcher = ImagePrefetcher(
+                client=self.docker_client,
+                miner_commits=self.miner_commits,
+                miners_docker_info=self.miners_docker_info,
+                image_cache=self.image_cache,
+                lookahead=self.challenge_info.get("image_prefetch_lookahead", 1),
+            )
 
+            _max_concurrent_miners = self._get_max_concurrent_miners()
+            _use_pipeline = _max_concurrent_miners <= 1 and self.challenge_info.get(
+                "evaluation_pipeline", False
+            )
+            # Pipeline stages also run the next miner's container while the previous one is stopped
+            self._parallel_miners = _max_concurrent_miners > 1 or _use_pipeline
             try:
+                if _max_concurrent_miners > 1:
+                    self._run_miner_pool(challenge_inputs, _max_concurrent_miners)
+                elif _use_pipeline:
+                    self._run_miner_pipeline(challenge_inputs)
+                else:
+                    for index, miner_commit in enumerate(self.miner_commits):
+                        self.image_prefetcher.schedule(index)
+                        self._evaluate_miner(miner_commit, challenge_inputs)
+                        self.image_prefetcher.release(miner_commit)
+
+                        # Also resets the miner context, so that the next miner does not
+                        # start from this miner's endpoint
+                        self._release_miner_container()
+                        self.image_cache.evict(
+                            keep_images=self.image_prefetcher.pending_images()
+                        )
+            finally:
+                self.image_prefetcher.shutdown()
+                self.task_generator.stop_prefill(
+                    timeout=self.challenge_info.get("task_generation_timeout", 30)
+                )
+
+            bt.logging.debug(
+                f"[CONTROLLER] HTTP latency summary: {self.get_http_latency_summary()}"
+            )
+            bt.logging.debug(
+                f"[CONTROLLER] Container time to ready: {self.container_ready_times}"
+            )
+            bt.logging.debug(
+                f"[CONTROLLER] Span timing summary: {tracing.tracer.get_summary()}"
+            )
+            self._export_resource_report()
+            if self._is_deterministic():
+                bt.logging.info(
+                    f"[CONTROLLER] Result cache hits: {self.result_cache.hits}, misses: {self.result_cache.misses}"
+                )
+
+            bt.logging.debug(
+                "[CONTROLLER] Challenge completed, cleaning up challenge container"
+            )
+
+            if not self.challenge_info.get("reuse_challenge_container", False):
+                docker_utils.remove_container(
+                    client=self.docker_client,
+                    container_name=self.challenge_name,
+                    stop_timeout=10,
+                    force=True,
+                    remove_volumes=True,
+                )
+            # Stopped containers and volumes of the whole run are cleaned once, without blocking
+            self.cleanup_future = docker_utils.clean_docker_resources_in_background(
+                client=self.docker_client,
+                remove_containers=True,
+                remove_images=False,
+            )
+
+    def get_http_latency_summary(self) -> dict[str, dict]:
+        """Returns the per-endpoint latency histograms of every HTTP target."""
+        return {
+            _http_client.name: _http_client.get_latency_summary()
+            for _http_client in (
+                self.challenge_http_client,
+                self.miner_http_client,
+                self.internal_services_http_client,
+            )
+        }
+
+    def _evaluate_miner(
+        self,
+        miner_commit: MinerChallengeCommit,
+        challenge_inputs: list[dict],
+        previous_scored: threading.Event | None = None,
+    ):
+        """
+        Runs the full evaluation of a single miner: container setup, solving, comparison and scoring.
+        Errors are recorded in the miner's scoring logs instead of being raised.
+
+        Args:
+            miner_commit: The miner's commit to evaluate
+            challenge_inputs: Challenge inputs to solve
+            previous_scored: Set once the previous miner is scored, comparisons wait for it so
+                that the miner is compared with the same scored miners as in the sequential loop
+        """
+        try:
+            self._start_miner_container(miner_commit, challenge_inputs)
+            self._solve_miner(miner_commit, challenge_inputs)
+            if previous_scored is not None:
+                previous_scored.wait()
+            self._compare_miner(miner_commit)
+            self._score_miner(miner_commit, challenge_inputs)
+        except Exception as e:
+            self._record_miner_error(miner_commit, e)
+        finally:
+            self._miner_context.deferred_start = None
+            self._miner_context.miner_digest = None
+
+    def _start_miner_container(
+        self, miner_commit: MinerChallengeCommit, challenge_inputs: list[dict]
+    ):
+        """
+        Starts the miner container, or defers its start when the solve results of
+        all challenge inputs are cached.
+        """
+        with tracing.span(
+            "controller.start_miner", **self._get_span_tags(miner_commit)
+        ):
+            _docker_hub_id = miner_commit.docker_hub_id or ""
+            self._miner_context.miner_digest = _docker_hub_id.split("@")[-1]
+            self._miner_context.deferred_start = None
+            if self._is_deterministic() and self._are_solves_cached(challenge_inputs):
+                if not docker_utils.is_image_digest_format_valid(
+                    miner_commit.docker_hub_id
+                ):
+                    raise ValueError("Invalid image format")
+                # Only started if the miner endpoint is needed for an uncached input
+                bt.logging.info(
+                    f"[CONTROLLER] Solve results of miner {miner_commit.miner_uid} are cached, "
+                    "deferring its container start"
+                )
+                self._miner_context.deferred_start = _DeferredMinerStart(miner_commit)
+            else:
                 self._setup_miner_container(miner_commit)
+                self._get_resource_usage(miner_commit)["startup_seconds"] = (
+                    self.container_ready_times.get(miner_commit.docker_hub_id, None)
+                )
+
+    def _compare_miner(self, miner_commit: MinerChallengeCommit):
+        """Compares the miner's outputs with the reference commits."""
+        with tracing.span("controller.compare", **self._get_span_tags(miner_commit)):
+            _max_comparison_score = self._check_comparison_score(miner_commit)
+            if _max_comparison_score >= 0.6:
+                bt.logging.info(
+                    f"[CONTROLLER] Max comparison score {_max_comparison_score} >= 0.6,\
+                        skipping comparison validation."
+                )
+                miner_commit.comparison_logs = {
+                    "skipped": [
+                        ComparisonLog(
+                            similarity_score=_max_comparison_score,
+                            reason="high similarity detected",
+                        )
+                    ]
+                }
+            else:
+                self._run_reference_comparison_inputs(miner_commit)
 
+    def _solve_miner(
+        self, miner_commit: MinerChallengeCommit, challenge_inputs: list[dict]
+    ):
+        """Solves the challenge inputs with the miner container, sampling its resource usage."""
+        with tracing.span("controller.solve", **self._get_span_tags(miner_commit)):
+            _resource_usage = self._get_resource_usage(miner_commit)
+            _stats_collector = self._start_stats_collector(
+                getattr(self._miner_context, "container", None)
+            )
+            _start_time = time.time()
+            try:
                 self._generate_scoring_logs(miner_commit, challenge_inputs)
-                _max_comparison_score = self._check_comparison_score(miner_commit)
-                if _max_comparison_score >= 0.6:
-                    bt.logging.info(
-                        f"[CONTROLLER] Max comparison score {_max_comparison_score} >= 0.6,\
-                            skipping comparison validation."
-                    )
-                    miner_commit.comparison_logs = {
-                        "skipped": [
-                            ComparisonLog(
-                                similarity_score=_max_comparison_score,
-                                reason="high similarity detected",
-                            )
-                        ]
-                    }
-                else:
-                    self._run_reference_comparison_inputs(miner_commit)
+            finally:
+                _resource_usage["solve_seconds"] = time.time() - _start_time
+                if _stats_collector:
+                    _resource_usage["miner"] = _stats_collector.stop()
 
+    def _score_miner(
+        self, miner_commit: MinerChallengeCommit, challenge_inputs: list[dict]
+    ):
+        """
+        Scores the miner's outputs and compares them with references of the same score.
+        The resource usage of the challenge container is sampled while scoring, and kept in
+        the resource report of the run.
+        """
+        with tracing.span("controller.score", **self._get_span_tags(miner_commit)):
+            _resource_usage = self._get_resource_usage(miner_commit)
+            _stats_collector = self._start_stats_collector(self.challenge_container)
+            _start_time = time.time()
+            try:
+                if self.challenge_info.get("batch_scoring", False):
+                    self._prescore_scoring_logs(miner_commit)
                 self._score_miner_with_new_inputs(miner_commit, challenge_inputs)
-                self.same_score_comparison(miner_commit)
-
-            except Exception as e:
-                bt.logging.error(f"Error while processing miner {uid} - {hotkey}: {e}")
-                bt.logging.error(traceback.format_exc())
-                if not miner_commit.scoring_logs:
-                    miner_commit.scoring_logs.append(
-                        ScoringLog(
-                            miner_input=None,
-                            miner_output=None,
-                            score=0,
-                            error=str(e),
-                        )
+                _unused_prescored = getattr(self._miner_context, "prescored", {})
+                if _unused_prescored:
+                    bt.logging.warning(
+                        f"[CONTROLLER] {len(_unused_prescored)} batch scores of miner {miner_commit.miner_uid} "
+                        "were not used, `_score_miner_with_new_inputs` must score the scoring logs' "
+                        "input and output pairs unchanged"
                     )
+                self._miner_context.prescored = {}
+            finally:
+                _resource_usage["score_seconds"] = time.time() - _start_time
+                if _stats_collector:
+                    _resource_usage["challenge"] = _stats_collector.stop()
+            self.same_score_comparison(miner_commit)
+
+    def _get_span_tags(self, miner_commit: MinerChallengeCommit) -> dict:
+        """Returns the tags of the miner's timing spans."""
+        return {
+            "challenge": self.challenge_name,
+            "miner_uid": miner_commit.miner_uid,
+            "miner_digest": (miner_commit.docker_hub_id or "").split("@")[-1],
+        }
 
-            docker_utils.remove_container_by_port(
-                client=self.docker_client,
-                port=constants.MINER_DOCKER_PORT,
+    def _get_resource_usage(self, miner_commit: MinerChallengeCommit) -> dict:
+        """Returns the resource usage record of the miner in this run, see `get_resource_report`."""
+        with self._resource_usage_lock:
+            return self.resource_usage.setdefault(
+                f"{miner_commit.miner_uid}_{miner_commit.miner_hotkey}",
+                {
+                    "docker_hub_id": miner_commit.docker_hub_id,
+                    "startup_seconds": None,
+                    "solve_seconds": None,
+                    "score_seconds": None,
+                    "miner": None,
+                    "challenge": None,
+                },
             )
-            docker_utils.clean_docker_resources(
-                client=self.docker_client,
-                remove_containers=True,
-                remove_images=True,
+
+    def _start_stats_collector(self, container) -> ContainerStatsCollector | None:
+        if container is None or not self.challenge_info.get(
+            "collect_resource_usage", True
+        ):
+            return None
+        _stats_collector = ContainerStatsCollector(container)
+        _stats_collector.start()
+        return _stats_collector
+
+    def get_resource_report(self) -> dict:
+        """
+        Returns the resource usage of every miner evaluated in this run: container startup, solve
+        and score durations (seconds), and the stats of the miner container while solving and of
+        the challenge container while scoring (peak RSS, CPU seconds, network bytes).
+        """
+        with self._resource_usage_lock:
+            return {
+                "challenge_name": self.challenge_name,
+                "challenge_image": self.challenge_info.get("challenge_image", None),
+                "miners": copy.deepcopy(self.resource_usage),
+            }
+
+    def _export_resource_report(self):
+        """Writes the resource report of the run as JSON to `CACHE_DIR/reports`."""
+        _report_dir = os.path.join(constants.CACHE_DIR, "reports")
+        _report_path = os.path.join(
+            _report_dir, f"{self.challenge_name}_{int(time.time())}.json"
+        )
+        try:
+            os.makedirs(_report_dir, exist_ok=True)
+            with open(_report_path, "w") as report_file:
+                json.dump(self.get_resource_report(), report_file, indent=2)
+            bt.logging.info(f"[CONTROLLER] Resource report written to {_report_path}")
+        except OSError as e:
+            bt.logging.warning(f"[CONTROLLER] Failed to write resource report: {e}")
+
+    def _record_miner_error(self, miner_commit: MinerChallengeCommit, error: Exception):
+        bt.logging.error(
+            f"Error while processing miner {miner_commit.miner_uid} - {miner_commit.miner_hotkey}: {error}"
+        )
+        bt.logging.error(
+            "".join(traceback.format_exception(type(error), error, error.__traceback__))
+        )
+        if not miner_commit.scoring_logs:
+            miner_commit.scoring_logs.append(
+                ScoringLog(
+                    miner_input=None,
+                    miner_output=None,
+                    score=0,
+                    error=str(error),
+                )
             )
 
-        bt.logging.debug(
-            "[CONTROLLER] Challenge completed, cleaning up challenge container"
+    def _are_solves_cached(self, challenge_inputs: list[dict]) -> bool:
+        """Whether all challenge inputs have a cached solve result for the current miner."""
+        return all(
+            self.result_cache.contains(self._get_solve_cache_key(challenge_input))
+            for challenge_input in challenge_inputs
         )
 
-        docker_utils.remove_container(
-            client=self.docker_client,
-            container_name=self.challenge_name,
-            stop_timeout=10,
-            force=True,
-            remove_volumes=True,
+    def _get_solve_cache_key(self, challenge_input: dict) -> str | None:
+        """Returns the result cache key of solving the input with the current miner, None if not cacheable."""
+        _miner_digest = getattr(self._miner_context, "miner_digest", None)
+        if not self._is_deterministic() or not _miner_digest:
+            return None
+        return ResultCache.make_solve_key(
+            challenge_digest=self._challenge_image_digest,
+            miner_digest=_miner_digest,
+            input_hash=_hash_input(challenge_input),
         )
-        docker_utils.clean_docker_resources(
+
+    def _get_score_cache_key(self, miner_input: dict, miner_output: dict) -> str | None:
+        """Returns the result cache key of scoring the input and output pair, None if not cacheable."""
+        if not self._is_deterministic():
+            return None
+        return ResultCache.make_score_key(
+            challenge_digest=self._challenge_image_digest,
+            input_hash=_hash_input(miner_input),
+            output_digest=_hash_payload(miner_output),
+        )
+
+    def _get_max_concurrent_miners(self) -> int:
+        """
+        Returns the number of miner containers that may run at once for this challenge.
+        The configured `max_concurrent_miners` is capped by how many containers with the
+        challenge's `resource_limits` fit on the Docker host.
+        """
+        _max_concurrent_miners = int(
+            self.challenge_info.get("max_concurrent_miners", 1)
+        )
+        if _max_concurrent_miners <= 1:
+            return 1
+
+        _resource_limits = self.challenge_info.get("resource_limits", {})
+        _host_capacity = docker_utils.get_max_parallel_containers(
             client=self.docker_client,
-            remove_containers=True,
-            remove_images=False,
+            num_cpus=_resource_limits.get("num_cpus", None),
+            mem_limit=_resource_limits.get("mem_limit", None),
         )
+        _max_concurrent_miners = min(_max_concurrent_miners, _host_capacity)
+        bt.logging.info(
+            f"[CONTROLLER] Max concurrent miners: {_max_concurrent_miners} (host capacity: {_host_capacity})"
+        )
+        return _max_concurrent_miners
+
+    def _run_miner_pool(self, challenge_inputs: list[dict], max_workers: int):
+        """
+        Evaluates miners with a bounded pool of workers, each running its own miner container.
+        Image cleanup is deferred until every worker is done so that no worker loses its image.
+
+        Miners are started and solved concurrently, but compared with the scored miners before
+        them, so the comparison of a miner waits until the previous miner is scored, as in the
+        sequential evaluation. Miners are submitted in order, so the previous miner always has
+        a worker.
+        """
+        _scored_events = [threading.Event() for _ in self.miner_commits]
+
+        def _evaluate_and_release(index: int, miner_commit: MinerChallengeCommit):
+            try:
+                self.image_prefetcher.schedule(index)
+                self._evaluate_miner(
+                    miner_commit,
+                    challenge_inputs,
+                    previous_scored=_scored_events[index - 1] if index > 0 else None,
+                )
+            finally:
+                # Failed miners are not scored, but later miners must not wait for them
+                _scored_events[index].set()
+                self.image_prefetcher.release(miner_commit)
+                self._release_miner_container()
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="miner_worker"
+        ) as executor:
+            list(
+                executor.map(
+                    _evaluate_and_release,
+                    range(len(self.miner_commits)),
+                    self.miner_commits,
+                )
+            )
+
+        self.image_cache.evict()
+
+    def _run_miner_pipeline(self, challenge_inputs: list[dict]):
+        """
+        Evaluates miners through pipeline stages connected by bounded queues (`pipeline_queue_size`):
+        start (with image prefetch), solve, stop, compare and score. The next miner's container
+        starts while the previous miner is compared and scored, since those stages only need its outputs.
+
+        Miners are compared with the scored miners before them, so the compare stage of a miner
+        waits until the previous miner is scored, as in the sequential evaluation.
+        """
+        _contexts: dict[int, dict] = {}
+        _failed_indices: set[int] = set()
+        _scored_events = [threading.Event() for _ in self.miner_commits]
+
+        def _stage(
+            handler: Callable[[int], None], always_run: bool = False
+        ) -> Callable[[int], None]:
+            def _run_stage(index: int):
+                # Miner context is thread-local, so it is carried from stage to stage
+                self._miner_context.__dict__.clear()
+                self._miner_context.__dict__.update(_contexts.pop(index, {}))
+                try:
+                    if always_run or index not in _failed_indices:
+                        handler(index)
+                except Exception as e:
+                    _failed_indices.add(index)
+                    self._record_miner_error(self.miner_commits[index], e)
+                    # Counted in the stage metrics
+                    raise
+                finally:
+                    _contexts[index] = dict(self._miner_context.__dict__)
+
+            return _run_stage
+
+        def _start(index: int):
+            self.image_prefetcher.schedule(index)
+            self._start_miner_container(self.miner_commits[index], challenge_inputs)
+
+        def _solve(index: int):
+            self._solve_miner(self.miner_commits[index], challenge_inputs)
+
+        def _stop(index: int):
+            # Cleanup errors must not discard the miner's outputs
+            try:
+                self.image_prefetcher.release(self.miner_commits[index])
+                self._release_miner_container()
+                self.image_cache.evict(
+                    keep_images=self.image_prefetcher.pending_images()
+                )
+            except Exception as e:
+                bt.logging.error(
+                    f"[CONTROLLER] Failed to clean up after miner {self.miner_commits[index].miner_uid}: {e}"
+                )
+
+        def _compare(index: int):
+            if index > 0:
+                _scored_events[index - 1].wait()
+            self._compare_miner(self.miner_commits[index])
+
+        def _score(index: int):
+            try:
+                if index not in _failed_indices:
+                    self._score_miner(self.miner_commits[index], challenge_inputs)
+            finally:
+                # Failed miners are not scored, but later miners must not wait for them
+                _scored_events[index].set()
+
+        self.evaluation_pipeline = EvaluationPipeline(
+            stages=[
+                ("start", _stage(_start)),
+                ("solve", _stage(_solve)),
+                ("stop", _stage(_stop, always_run=True)),
+                ("compare", _stage(_compare)),
+                ("score", _stage(_score, always_run=True)),
+            ],
+            queue_size=self.challenge_info.get("pipeline_queue_size", 1),
+        )
+        self.evaluation_pipeline.run(list(range(len(self.miner_commits))))
+
+    def _release_miner_container(self):
+        """Removes the miner container bound to the current thread and resets its endpoint."""
+        _miner_container = getattr(self._miner_context, "container", None)
+        self._miner_context.__dict__.clear()
+        if _miner_container is None:
+            return
+
+        try:
+            docker_utils.remove_container(
+                client=self.docker_client,
+                container_name=_miner_container.name,
+                stop_timeout=10,
+                force=True,
+                remove_volumes=True,
+            )
+        except Exception as e:
+            bt.logging.error(
+                f"[CONTROLLER] Failed to remove miner container {_miner_container.name}: {e}"
+            )
 
     def _setup_miner_container(self, miner_commit: MinerChallengeCommit):
         """Setup and validate miner container. Raises if validation or setup fails."""
@@ -206,10 +886,11 @@ class Controller:
         if not docker_utils.is_image_digest_format_valid(miner_commit.docker_hub_id):
             raise ValueError("Invalid image format")
 
-        docker_utils.remove_container_by_port(
-            client=self.docker_client,
-            port=constants.MINER_DOCKER_PORT,
-        )
+        if not self._parallel_miners:
+            docker_utils.remove_container_by_port(
+                client=self.docker_client,
+                port=constants.MINER_DOCKER_PORT,
+            )
 
         bt.logging.info(
             f"[CONTROLLER] Running miner {miner_commit.miner_uid} - {miner_commit.docker_hub_id}"
@@ -217,33 +898,54 @@ class Controller:
 
         miner_start_time = time.time()
         miner_docker_info = self.miners_docker_info.get(str(miner_commit.miner_uid), {})
+        _miner_run_kwargs = self.challenge_info.get("miner_container_run_kwargs", {})
+        if self._parallel_miners and "network" not in _miner_run_kwargs:
+            # Let Docker allocate a free host port for each parallel miner
+            _miner_run_kwargs = {
+                **_miner_run_kwargs,
+                "ports": {f"{constants.MINER_DOCKER_PORT}/tcp": None},
+            }
+        if self.image_prefetcher:
+            # Only wait for the pull that is already in flight
+            self.image_prefetcher.wait(miner_commit)
         miner_container = docker_utils.run_container(
             is_miner=True,
+            skip_pull=self.image_prefetcher is not None,
             client=self.docker_client,
             image=miner_commit.docker_hub_id,
             detach=True,
             miner_docker_info=miner_docker_info,
-            **self.challenge_info.get("miner_container_run_kwargs", {}),
+            **_miner_run_kwargs,
         )
+        self._miner_context.container = miner_container
         miner_container.reload()
         _local_network = miner_container.attrs["NetworkSettings"]["Networks"].get(
             self.local_network, None
         )
         if _local_network:
             self.miner_ip = _local_network.get("IPAddress", None)
+            self.miner_port = constants.MINER_DOCKER_PORT
         else:
             self.miner_ip = "localhost"
+            self.miner_port = (
+                docker_utils.get_container_host_port(
+                    miner_container, constants.MINER_DOCKER_PORT
+                )
+                or constants.MINER_DOCKER_PORT
+            )
 
         # Check miner container health
         _protocol, _ssl_verify = self._check_protocol(is_challenger=False)
-        docker_utils.check_container_alive(
-            container=miner_container,
-            health_port=constants.MINER_DOCKER_PORT,
-            protocol=_protocol,
-            ssl_verify=_ssl_verify,
-            timeout=self.challenge_info.get("docker_run_timeout", 600),
-            start_time=miner_start_time,
-            ip=self.miner_ip,
+        self.container_ready_times[miner_commit.docker_hub_id] = (
+            docker_utils.check_container_alive(
+                container=miner_container,
+                health_port=self.miner_port,
+                protocol=_protocol,
+                ssl_verify=_ssl_verify,
+                timeout=self.challenge_info.get("docker_run_timeout", 600),
+                start_time=miner_start_time,
+                ip=self.miner_ip,
+            )
         )
 
     def _run_reference_comparison_inputs(self, miner_commit: MinerChallengeCommit):
@@ -285,84 +987,167 @@ class Controller:
         if _reference_commit_limit:
             reference_commits = reference_commits[:_reference_commit_limit]
 
-        for reference_commit in reference_commits:
-
-            _unique_commit_key = (
-                f"{reference_commit.miner_uid}_{reference_commit.encrypted_commit[:10]}"
-            )
-            bt.logging.info(
-                f"[CONTROLLER] Running comparison with reference commit {_unique_commit_key}"
-            )
-            if _unique_commit_key not in miner_commit.comparison_logs:
-                miner_commit.comparison_logs[_unique_commit_key] = []
-            reference_log = reference_commit.scoring_logs[0]
+        # Comparisons run concurrently, results are still applied in reference order below
+        _executor = ThreadPoolExecutor(
+            max_workers=self.challenge_info["comparison_config"].get(
+                "max_concurrent_comparisons", 8
+            ),
+            thread_name_prefix="reference_comparison",
+        )
+        _comparison_futures = self._submit_reference_comparisons(
+            executor=_executor,
+            miner_commit=miner_commit,
+            reference_commits=reference_commits,
+        )
+        try:
+            for index, reference_commit in enumerate(reference_commits):
 
-            if (
-                reference_log.miner_output is None
-                or not miner_commit.scoring_logs
-                or miner_commit.scoring_logs[0].miner_output is None
-            ):
-                bt.logging.warning(
-                    f"[CONTROLLER] Skipping comparison with {reference_commit.docker_hub_id} for miner because \
-                        the reference log is missing input or output."
+                _unique_commit_key = f"{reference_commit.miner_uid}_{reference_commit.encrypted_commit[:10]}"
+                bt.logging.info(
+                    f"[CONTROLLER] Running comparison with reference commit {_unique_commit_key}"
                 )
-                continue
+                if _unique_commit_key not in miner_commit.comparison_logs:
+                    miner_commit.comparison_logs[_unique_commit_key] = []
+                reference_log = reference_commit.scoring_logs[0]
 
-            _miner_output = miner_commit.scoring_logs[0].miner_output.copy()
-            _reference_output = reference_log.miner_output.copy()
+                if (
+                    reference_log.miner_output is None
+                    or not miner_commit.scoring_logs
+                    or miner_commit.scoring_logs[0].miner_output is None
+                ):
+                    bt.logging.warning(
+                        f"[CONTROLLER] Skipping comparison with {reference_commit.docker_hub_id} for miner because \
+                            the reference log is missing input or output."
+                    )
+                    continue
 
-            _compare_result = self._compare_outputs(
-                miner_output=_miner_output,
-                reference_output=_reference_output,
-                user_id=miner_commit.docker_hub_id,
-            )
-            _similarity_score = _compare_result.get("similarity_score", 1.0)
-            _similarity_reason = _compare_result.get("reason", "Unknown")
+                _miner_output = miner_commit.scoring_logs[0].miner_output.copy()
+                _reference_output = reference_log.miner_output.copy()
 
-            self._exclude_output_keys(_miner_output, _reference_output)
+                _compare_result = _comparison_futures[index].result()
+                _similarity_score = _compare_result.get("similarity_score", 1.0)
+                _similarity_reason = _compare_result.get("reason", "Unknown")
 
-            if (
-                miner_commit.miner_hotkey == reference_commit.miner_hotkey
-                and _similarity_score < self.max_self_comparison_score
-            ):
-                bt.logging.warning(
-                    f"[CONTROLLER] Skipping self-comparison for {miner_commit.miner_hotkey}\
-                          with {reference_commit.miner_hotkey} due to low similarity score {_similarity_score}"
+                self._exclude_output_keys(_miner_output, _reference_output)
+
+                if (
+                    miner_commit.miner_hotkey == reference_commit.miner_hotkey
+                    and _similarity_score < self.max_self_comparison_score
+                ):
+                    bt.logging.warning(
+                        f"[CONTROLLER] Skipping self-comparison for {miner_commit.miner_hotkey}\
+                              with {reference_commit.miner_hotkey} due to low similarity score {_similarity_score}"
+                    )
+                    if _unique_commit_key in miner_commit.comparison_logs:
+                        del miner_commit.comparison_logs[_unique_commit_key]
+                    continue
+
+                comparison_log = ComparisonLog.from_payloads(
+                    blob_store=self.blob_store,
+                    miner_input=reference_log.miner_input,
+                    miner_output=_miner_output,
+                    reference_output=_reference_output,
+                    reference_hotkey=reference_commit.miner_hotkey,
+                    reference_similarity_score=reference_commit.penalty,
+                    similarity_score=_similarity_score,
+                    reason=_similarity_reason,
                 )
-                if _unique_commit_key in miner_commit.comparison_logs:
+
+                miner_commit.comparison_logs[_unique_commit_key].append(comparison_log)
+                if _similarity_score > self.challenge_info["comparison_config"].get(
+                    "min_acceptable_score", 0.6
+                ):
+                    bt.logging.warning(
+                        f"[CONTROLLER] Stopping comparison because of high similarity threshold is reached,\
+                              similarity score {_similarity_score}"
+                    )
+                    return
+
+                if (
+                    _unique_commit_key in miner_commit.comparison_logs
+                    and not miner_commit.comparison_logs[_unique_commit_key]
+                ):
+                    bt.logging.info(
+                        f"[CONTROLLER] Removing empty comparison logs for {_unique_commit_key} for miner."
+                    )
                     del miner_commit.comparison_logs[_unique_commit_key]
-                continue
+        finally:
+            _executor.shutdown(wait=False, cancel_futures=True)
 
-            comparison_log = ComparisonLog(
-                miner_input=reference_log.miner_input,
-                miner_output=_miner_output,
-                reference_output=_reference_output,
-                reference_hotkey=reference_commit.miner_hotkey,
-                reference_similarity_score=reference_commit.penalty,
-                similarity_score=_similarity_score,
-                reason=_similarity_reason,
-            )
-
-            miner_commit.comparison_logs[_unique_commit_key].append(comparison_log)
-            if _similarity_score > self.challenge_info["comparison_config"].get(
-                "min_acceptable_score", 0.6
-            ):
-                bt.logging.warning(
-                    f"[CONTROLLER] Stopping comparison because of high similarity threshold is reached,\
-                          similarity score {_similarity_score}"
-                )
+        self._compare_with_baseline(miner_commit)
+        return
+
+    def _submit_reference_comparisons(
+        self,
+        executor: ThreadPoolExecutor,
+        miner_commit: MinerChallengeCommit,
+        reference_commits: list[MinerChallengeCommit],
+    ) -> dict[int, Future]:
+        """
+        Submits the comparison of the miner's output with each reference commit to the executor.
+        Once a comparison crosses `min_acceptable_score` (and is not a skipped self-comparison),
+        the comparisons after it are cancelled, because `_run_reference_comparison_inputs` stops there.
+
+        Returns:
+            dict[int, Future]: Futures of `_compare_outputs` results, keyed by reference index
+        """
+        _min_acceptable_score = self.challenge_info["comparison_config"].get(
+            "min_acceptable_score", 0.6
+        )
+        _lock = threading.RLock()
+        _stop_index = len(reference_commits)
+        futures: dict[int, Future] = {}
+
+        def _compare(index: int, reference_commit: MinerChallengeCommit):
+            if index > _stop_index:
+                return None
+            return self._compare_outputs(
+                miner_output=miner_commit.scoring_logs[0].miner_output.copy(),
+                reference_output=reference_commit.scoring_logs[0].miner_output.copy(),
+                user_id=miner_commit.docker_hub_id,
+            )
+
+        def _stop_after_threshold(
+            index: int, reference_commit: MinerChallengeCommit, future: Future
+        ):
+            nonlocal _stop_index
+            try:
+                _compare_result = future.result()
+                _similarity_score = _compare_result.get("similarity_score", 1.0)
+                if (
+                    miner_commit.miner_hotkey == reference_commit.miner_hotkey
+                    and _similarity_score < self.max_self_comparison_score
+                ) or _similarity_score <= _min_acceptable_score:
+                    return
+            except Exception:
+                # Errors are raised again when the result is consumed in order
                 return
 
-            if (
-                _unique_commit_key in miner_commit.comparison_logs
-                and not miner_commit.comparison_logs[_unique_commit_key]
-            ):
-                bt.logging.info(
-                    f"[CONTROLLER] Removing empty comparison logs for {_unique_commit_key} for miner."
+            with _lock:
+                if index >= _stop_index:
+                    return
+                _stop_index = index
+                for _index, _future in futures.items():
+                    if _index > index:
+                        _future.cancel()
+
+        if not miner_commit.scoring_logs or (
+            miner_commit.scoring_logs[0].miner_output is None
+        ):
+            return futures
+
+        with _lock:
+            for index, reference_commit in enumerate(reference_commits):
+                if reference_commit.scoring_logs[0].miner_output is None:
+                    continue
+                futures[index] = executor.submit(_compare, index, reference_commit)
+                futures[index].add_done_callback(
+                    lambda future, index=index, reference_commit=reference_commit: (
+                        _stop_after_threshold(index, reference_commit, future)
+                    )
                 )
-                del miner_commit.comparison_logs[_unique_commit_key]
-        self._compare_with_baseline(miner_commit)
-        return
+
+        return futures
 
     def _validate_miner_submission(self, miner_commit: MinerChallengeCommit) -> bool:
         """
@@ -395,8 +1180,9 @@ class Controller:
                 "Content-Type": "application/json",
                 "X-API-KEY": constants.INTERNAL_SERVICES.API_KEY,
             }
-            response = requests.post(
+            response = self.internal_services_http_client.post(
                 _validator_endpoint,
+                endpoint="/check/challenge",
                 timeout=self.challenge_info.get("challenge_compare_timeout", 240),
                 verify=False,  # nosec
                 json=payload,
@@ -418,10 +1204,17 @@ class Controller:
     def _generate_scoring_logs(
         self, miner_commit: MinerChallengeCommit, challenge_inputs
     ):
-        """Run and score miner with new challenge inputs."""
-        for miner_input in challenge_inputs:
-            miner_output, error_message = self._submit_challenge_to_miner(miner_input)
-
+        """
+        Run and score miner with new challenge inputs.
+        Up to `challenge_solve_concurrency` inputs (default 1) are solved concurrently by the miner.
+        """
+        _solve_results = self._solve_challenge_inputs(challenge_inputs)
+        for miner_input, (
+            miner_output,
+            error_message,
+            solve_duration,
+            queue_delay,
+        ) in zip(challenge_inputs, _solve_results):
             if miner_output is None or error_message:
                 bt.logging.warning(
                     f"[CONTROLLER - ABSController] Miner {miner_commit.miner_hotkey} \
@@ -437,6 +1230,8 @@ class Controller:
                             if error_message
                             else "[Not Accepted] No output from miner"
                         ),
+                        solve_duration=solve_duration,
+                        queue_delay=queue_delay,
                     ),
                 )
                 continue
@@ -446,9 +1241,54 @@ class Controller:
                     miner_input=miner_input,
                     miner_output=miner_output,
                     error=error_message,
+                    solve_duration=solve_duration,
+                    queue_delay=queue_delay,
                 ),
             )
 
+    def _solve_challenge_inputs(
+        self, challenge_inputs: list[dict]
+    ) -> list[tuple[dict, str, float, float]]:
+        """
+        Submits the challenge inputs to the current miner container, up to
+        `challenge_solve_concurrency` at a time.
+
+        Returns:
+            list[tuple[dict, str, float, float]]: Miner output, error message, solve duration and
+                queueing delay (seconds) of each input, in input order
+        """
+        _concurrency = max(1, self.challenge_info.get("challenge_solve_concurrency", 1))
+        # Miner context is bound to the evaluation thread, so it is passed to the solve workers
+        _miner_context = dict(self._miner_context.__dict__)
+        _queued_time = time.time()
+
+        def _solve(miner_input: dict) -> tuple[dict, str, float, float]:
+            self._miner_context.__dict__.update(_miner_context)
+            _start_time = time.time()
+            miner_output, error_message = self._submit_challenge_to_miner(miner_input)
+            return (
+                miner_output,
+                error_message,
+                time.time() - _start_time,
+                _start_time - _queued_time,
+            )
+
+        # Results of a deferred miner container are cached, solving them is not worth a thread pool
+        _deferred_start = _miner_context.get("deferred_start", None)
+        if _concurrency == 1 or len(challenge_inputs) <= 1 or _deferred_start:
+            _solve_results = [_solve(miner_input) for miner_input in challenge_inputs]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(_concurrency, len(challenge_inputs)),
+                thread_name_prefix="challenge_solve",
+            ) as executor:
+                _solve_results = list(executor.map(_solve, challenge_inputs))
+
+        # A deferred container started by a worker is released by the evaluation thread
+        if _deferred_start is not None and _deferred_start.started:
+            self._miner_context.__dict__.update(_deferred_start.context)
+        return _solve_results
+
     def _compare_outputs(
         self, miner_output: dict, reference_output: dict, user_id: str | None = None
     ) -> list[dict]:
@@ -477,13 +1317,24 @@ class Controller:
                 "identifier": self.challenge_info.get("script_path_identifier", None),
                 "user_id": user_id,
             }
+            _cache_key = self.similarity_cache.make_key(
+                challenge_type=payload["challenge_type"],
+                endpoint="/compare",
+                miner_script=payload["miner_script"],
+                reference_script=payload["reference_script"],
+            )
+            _cached_data = self.similarity_cache.get(_cache_key)
+            if _cached_data is not None:
+                return _cached_data
+
             headers = {
                 "Content-Type": "application/json",
                 "X-API-KEY": constants.INTERNAL_SERVICES.API_KEY,
             }
 
-            response = requests.post(
+            response = self.internal_services_http_client.post(
                 f"{constants.INTERNAL_SERVICES.API_URL}/compare",
+                endpoint="/compare",
                 timeout=self.challenge_info.get("challenge_compare_timeout", 300),
                 verify=False,  # nosec
                 json=payload,
@@ -498,6 +1349,8 @@ class Controller:
 
             response_data = response.json()
             data = response_data.get("data", [])
+            if response.ok and data:
+                self.similarity_cache.set(_cache_key, data)
 
             return data
 
@@ -611,13 +1464,30 @@ class Controller:
                 "reference_metadata": reference_metadata,
                 "user_id": user_id,
             }
+            # Same-score similarity also depends on the metadata sent with each script
+            _cache_key = None
+            if (
+                payload["miner_script"] is not None
+                and payload["reference_script"] is not None
+            ):
+                _cache_key = self.similarity_cache.make_key(
+                    challenge_type=payload["challenge_type"],
+                    endpoint="/compare/same-score",
+                    miner_script=[payload["miner_script"], _miner_metadata],
+                    reference_script=[payload["reference_script"], reference_metadata],
+                )
+            _cached_data = self.similarity_cache.get(_cache_key)
+            if _cached_data is not None:
+                return _cached_data
+
             headers = {
                 "Content-Type": "application/json",
                 "X-API-KEY": constants.INTERNAL_SERVICES.API_KEY,
             }
 
-            response = requests.post(
+            response = self.internal_services_http_client.post(
                 f"{constants.INTERNAL_SERVICES.API_URL}/compare/same-score",
+                endpoint="/compare/same-score",
                 timeout=self.challenge_info.get("challenge_compare_timeout", 300),
                 verify=False,  # nosec
                 json=payload,
@@ -632,6 +1502,8 @@ class Controller:
 
             response_data = response.json()
             data = response_data.get("data", [])
+            if response.ok and data:
+                self.similarity_cache.set(_cache_key, data)
 
             return data
 
@@ -646,10 +1518,12 @@ class Controller:
             ]
 
     def _check_comparison_score(self, miner_commit: MinerChallengeCommit) -> float:
-        compare_url = f"{constants.INTERNAL_SERVICES.API_URL}/compare/all"
         max_score = 0.0
         try:
             _miner_output = miner_commit.scoring_logs[0].miner_output.copy()
+            _script_path_identifier = self.challenge_info.get(
+                "script_path_identifier", None
+            )
 
             current_commits_to_compare = self._get_current_commits_to_compare(
                 miner_commit
@@ -657,38 +1531,58 @@ class Controller:
             reference_commits = (
                 self.reference_comparison_commits + current_commits_to_compare
             )
-
-            headers = {
-                "Content-Type": "application/json",
-                "X-API-KEY": constants.INTERNAL_SERVICES.API_KEY,
-            }
-
-            for reference_commit in reference_commits:
-                if reference_commit.miner_uid == miner_commit.miner_uid:
-                    continue
-                _reference_output = reference_commit.scoring_logs[0].miner_output.copy()
-                payload = {
-                    "challenge_type": self.challenge_info.get("challenge_type", None),
-                    "miner_script": _miner_output.get(
-                        self.challenge_info.get("script_path_identifier", None), None
-                    ),
-                    "reference_script": _reference_output.get(
-                        self.challenge_info.get("script_path_identifier", None), None
-                    ),
-                    "user_id": miner_commit.docker_hub_id,
-                }
-
-                response = requests.post(
-                    compare_url,
-                    json=payload,
-                    timeout=100,
-                    verify=False,  # nosec
-                    headers=headers,
+            _reference_scripts = [
+                reference_commit.scoring_logs[0].miner_output.get(
+                    _script_path_identifier, None
                 )
-                response.raise_for_status()
-                data = response.json()
+                for reference_commit in reference_commits
+                if reference_commit.miner_uid != miner_commit.miner_uid
+            ]
+            _miner_script = _miner_output.get(_script_path_identifier, None)
+
+            # Only compare reference scripts that are not answered by the similarity cache
+            _cache_keys = [
+                self.similarity_cache.make_key(
+                    challenge_type=self.challenge_info.get("challenge_type", None),
+                    endpoint="/compare/all",
+                    miner_script=_miner_script,
+                    reference_script=reference_script,
+                )
+                for reference_script in _reference_scripts
+            ]
+            similarity_scores = [
+                self.similarity_cache.get(cache_key) for cache_key in _cache_keys
+            ]
+            _uncached_indices = [
+                index for index, score in enumerate(similarity_scores) if score is None
+            ]
+            _uncached_scripts = [_reference_scripts[i] for i in _uncached_indices]
+
+            _new_scores = None
+            if self._compare_all_batch_supported is not False:
+                try:
+                    _new_scores = self._compare_all_batch(
+                        miner_script=_miner_script,
+                        reference_scripts=_uncached_scripts,
+                        user_id=miner_commit.docker_hub_id,
+                    )
+                except Exception as exc:
+                    bt.logging.warning(
+                        f"[CONTROLLER] Batch comparison failed, falling back to single comparisons: {exc}"
+                    )
+            if _new_scores is None:
+                _new_scores = self._compare_all_concurrently(
+                    miner_script=_miner_script,
+                    reference_scripts=_uncached_scripts,
+                    user_id=miner_commit.docker_hub_id,
+                )
+
+            for index, similarity_score in zip(_uncached_indices, _new_scores):
+                similarity_scores[index] = similarity_score
+                if similarity_score is not None:
+                    self.similarity_cache.set(_cache_keys[index], similarity_score)
 
-                similarity_score = data.get("data", {}).get("similarity_score", 0.0)
+            for similarity_score in similarity_scores:
                 if similarity_score:
                     max_score = max(max_score, similarity_score)
 
@@ -703,6 +1597,106 @@ class Controller:
             )
             return max_score
 
+    def _compare_all_batch(
+        self, miner_script, reference_scripts: list, user_id: str | None = None
+    ) -> list[float] | None:
+        """
+        Compares the miner script with all reference scripts in one request to `/compare/all/batch`.
+
+        Returns:
+            list[float] | None: Similarity score per reference script, in the same order,
+                or None if the internal services do not support batch comparison.
+        """
+        if not reference_scripts:
+            return []
+
+        payload = {
+            "challenge_type": self.challenge_info.get("challenge_type", None),
+            "miner_script": miner_script,
+            "reference_scripts": reference_scripts,
+            "user_id": user_id,
+        }
+        headers = {
+            "Content-Type": "application/json",
+            "X-API-KEY": constants.INTERNAL_SERVICES.API_KEY,
+        }
+        response = self.internal_services_http_client.post(
+            f"{constants.INTERNAL_SERVICES.API_URL}/compare/all/batch",
+            endpoint="/compare/all/batch",
+            json=payload,
+            timeout=self.challenge_info.get("challenge_compare_timeout", 300),
+            verify=False,  # nosec
+            headers=headers,
+        )
+        if response.status_code in (404, 405, 501):
+            bt.logging.info(
+                "[CONTROLLER] Batch comparison is not supported, falling back to concurrent single comparisons."
+            )
+            self._compare_all_batch_supported = False
+            return None
+
+        response.raise_for_status()
+        self._compare_all_batch_supported = True
+        similarity_scores = response.json().get("data", {}).get("similarity_scores", [])
+        if len(similarity_scores) != len(reference_scripts):
+            raise ValueError(
+                f"Batch comparison returned {len(similarity_scores)} scores for {len(reference_scripts)} references"
+            )
+        return similarity_scores
+
+    def _compare_all_concurrently(
+        self, miner_script, reference_scripts: list, user_id: str | None = None
+    ) -> list[float | None]:
+        """
+        Compares the miner script with each reference script through `/compare/all`,
+        running up to `max_concurrent_comparisons` requests at once.
+
+        Returns:
+            list[float | None]: Similarity score per reference script, in the same order,
+                None if the comparison failed
+        """
+        headers = {
+            "Content-Type": "application/json",
+            "X-API-KEY": constants.INTERNAL_SERVICES.API_KEY,
+        }
+
+        def _compare(reference_script) -> float:
+            payload = {
+                "challenge_type": self.challenge_info.get("challenge_type", None),
+                "miner_script": miner_script,
+                "reference_script": reference_script,
+                "user_id": user_id,
+            }
+            response = self.internal_services_http_client.post(
+                f"{constants.INTERNAL_SERVICES.API_URL}/compare/all",
+                endpoint="/compare/all",
+                json=payload,
+                timeout=100,
+                verify=False,  # nosec
+                headers=headers,
+            )
+            response.raise_for_status()
+            return response.json().get("data", {}).get("similarity_score", 0.0)
+
+        similarity_scores = []
+        _max_workers = self.challenge_info["comparison_config"].get(
+            "max_concurrent_comparisons", 8
+        )
+        with ThreadPoolExecutor(
+            max_workers=_max_workers, thread_name_prefix="compare_all"
+        ) as executor:
+            futures = [
+                executor.submit(_compare, script) for script in reference_scripts
+            ]
+            for future in futures:
+                try:
+                    similarity_scores.append(future.result())
+                except Exception as exc:
+                    bt.logging.error(f"[CONTROLLER] Error in comparison request: {exc}")
+                    similarity_scores.append(None)
+
+        return similarity_scores
+
     def _compare_with_baseline(self, miner_commit: MinerChallengeCommit):
         try:
             _miner_output = miner_commit.scoring_logs[0].miner_output.copy()
@@ -718,21 +1712,39 @@ class Controller:
                 "identifier": self.challenge_info.get("script_path_identifier", None),
                 "user_id": miner_commit.docker_hub_id,
             }
-            headers = {
-                "Content-Type": "application/json",
-                "X-API-KEY": constants.INTERNAL_SERVICES.API_KEY,
-            }
-            _internal_service_url = str(constants.INTERNAL_SERVICES.API_URL).rstrip("/")
-            response = requests.post(
-                f"{_internal_service_url}/compare/baseline-scripts",
-                timeout=self.challenge_info.get("challenge_compare_timeout", 240),
-                verify=False,  # nosec
-                json=payload,
-                headers=headers,
+            # Baseline scripts are held by the internal services and may change with the
+            # challenge, results are keyed by the challenge image and kept for a short time
+            _cache_key = self.similarity_cache.make_key(
+                challenge_type=payload["challenge_type"],
+                endpoint="/compare/baseline-scripts",
+                miner_script=_miner_submission_script,
+                reference_script={"challenge_image": self._challenge_image_digest},
             )
+            data = self.similarity_cache.get(_cache_key)
+            if data is None:
+                headers = {
+                    "Content-Type": "application/json",
+                    "X-API-KEY": constants.INTERNAL_SERVICES.API_KEY,
+                }
+                _internal_service_url = str(constants.INTERNAL_SERVICES.API_URL).rstrip(
+                    "/"
+                )
+                response = self.internal_services_http_client.post(
+                    f"{_internal_service_url}/compare/baseline-scripts",
+                    endpoint="/compare/baseline-scripts",
+                    timeout=self.challenge_info.get("challenge_compare_timeout", 240),
+                    verify=False,  # nosec
+                    json=payload,
+                    headers=headers,
+                )
+
+                response_data = response.json()
+                data = response_data.get("data", {})
+                if response.ok and data:
+                    self.similarity_cache.set(
+                        _cache_key, data, ttl=constants.SIMILARITY_BASELINE_CACHE_TTL
+                    )
 
-            response_data = response.json()
-            data = response_data.get("data", {})
             if not data:
                 bt.logging.warning(
                     f"[CONTROLLER] No baseline comparison data returned for miner {miner_commit.miner_hotkey}."
@@ -748,7 +1760,8 @@ class Controller:
                 elif not isinstance(_similarity_score, float):
                     _similarity_score = 1.0
 
-                comparison_log = ComparisonLog(
+                comparison_log = ComparisonLog.from_payloads(
+                    blob_store=self.blob_store,
                     miner_output=_miner_output,
                     similarity_score=_similarity_score,
                     reason=_outputs.get("reason", "Unknown"),
@@ -778,15 +1791,23 @@ class Controller:
             A dictionary representing the miner's output.
         """
 
+        _solve_cache_key = self._get_solve_cache_key(challenge_input)
+        if _solve_cache_key:
+            _cached_output = self.result_cache.get(_solve_cache_key)
+            if _cached_output is not None:
+                return _cached_output, ""
+
         error_message = ""
         miner_input = copy.deepcopy(challenge_input)
         exclude_miner_input_key = self.challenge_info.get("exclude_miner_input_key", [])
         for key in exclude_miner_input_key:
             miner_input[key] = None
         try:
+            # First cache miss of a miner whose container start was deferred
+            self._start_deferred_miner_container()
             _protocol, _ssl_verify = self._check_protocol(is_challenger=False)
-            response = requests.post(
-                f"{_protocol}://{self.miner_ip}:{constants.MINER_DOCKER_PORT}/solve",
+            response = self.miner_http_client.post(
+                f"{_protocol}://{self.miner_ip}:{self.miner_port}/solve",
                 timeout=self.challenge_info.get("challenge_solve_timeout", 60),
                 verify=_ssl_verify,
                 json=miner_input,
@@ -797,7 +1818,10 @@ class Controller:
                 bt.logging.warning(error_message)
                 return None, error_message
 
-            return response.json(), error_message
+            miner_output = response.json()
+            if _solve_cache_key and miner_output is not None:
+                self.result_cache.set(_solve_cache_key, miner_output)
+            return miner_output, error_message
         except requests.exceptions.Timeout:
             error_message = "Timeout occurred while trying to solve challenge."
             bt.logging.error(error_message)
@@ -807,17 +1831,23 @@ class Controller:
             bt.logging.error(error_message)
             return None, error_message
 
-    def _get_challenge_from_container(self) -> dict:
+    def _get_challenge_from_container(
+        self, stop_event: threading.Event | None = None
+    ) -> dict:
         """
         Retrieves a challenge input from the running challenge container by making an HTTP POST request.
         The challenge container returns a task that will be sent to the miners.
-        Will retry up to 3 times if request fails.
+        Will retry up to 3 times with exponential backoff if request fails or times out
+        (`task_generation_timeout`, default 30 seconds).
+
+        Args:
+            stop_event: Event set when the task is not needed anymore, no retry is made once set
 
         Returns:
             A dictionary representing the challenge input.
 
         Raises:
-            Exception: If all retry attempts fail
+            Exception: If all retry attempts fail, or if stopped before a retry
         """
         _protocol, _ssl_verify = self._check_protocol(is_challenger=True)
         url = f"{_protocol}://localhost:{constants.CHALLENGE_DOCKER_PORT}/task"
@@ -825,7 +1855,11 @@ class Controller:
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                response = requests.get(url, verify=_ssl_verify)
+                response = self.challenge_http_client.get(
+                    url,
+                    verify=_ssl_verify,
+                    timeout=self.challenge_info.get("task_generation_timeout", 30),
+                )
                 response.raise_for_status()
                 return response.json()
             except Exception as e:
@@ -833,11 +1867,18 @@ class Controller:
                     raise Exception(
                         f"Failed to get challenge after {max_retries} attempts: {str(e)}"
                     )
+                if stop_event is None:
+                    time.sleep(0.5 * 2**attempt)
+                elif stop_event.wait(0.5 * 2**attempt):
+                    raise Exception(
+                        f"Stopped getting challenge after {attempt + 1} attempts: {str(e)}"
+                    )
 
     def _score_challenge(self, miner_input, miner_output, task_id: int = 0) -> float:
         """
         Submits the miner's input and output for scoring by making an HTTP POST request to the challenge container.
         The challenge container computes a score based on the miner's performance.
+        Scores computed ahead by `_prescore_scoring_logs` are served without a new request.
 
         Args:
             miner_input: The input provided to the miner.
@@ -847,6 +1888,25 @@ class Controller:
         Returns:
             A float representing the score for the miner's solution.
         """
+        _prescored = getattr(self._miner_context, "prescored", {})
+        if _prescored:
+            _key = (_hash_input(miner_input), _hash_payload(miner_output))
+            if _key in _prescored:
+                return _prescored.pop(_key)
+        return self._request_score(miner_input, miner_output)
+
+    def _request_score(
+        self, miner_input, miner_output, check_cache: bool = True
+    ) -> float:
+        """
+        Scores a single input and output pair through the challenge container's `/score`.
+        Scores of deterministic challenges are served from and stored in the result cache.
+        """
+        _score_cache_key = self._get_score_cache_key(miner_input, miner_output)
+        if _score_cache_key and check_cache:
+            _cached_score = self.result_cache.get(_score_cache_key)
+            if _cached_score is not None:
+                return _cached_score
 
         _protocol, _ssl_verify = self._check_protocol(is_challenger=True)
 
@@ -858,25 +1918,182 @@ class Controller:
 
             bt.logging.debug(f"[CONTROLLER] Scoring payload: {str(payload)[:100]}...")
 
-            response = requests.post(
+            response = self.challenge_http_client.post(
                 f"{_protocol}://localhost:{constants.CHALLENGE_DOCKER_PORT}/score",
                 verify=_ssl_verify,
                 json=payload,
                 headers=self.challenge_info.get("scoring_headers", {}),
+                timeout=self.challenge_info.get("challenge_score_timeout", 300),
             )
 
             score = response.json()
 
         except Exception as ex:
             bt.logging.error(f"Score challenge failed: {str(ex)}")
-            score = 0.0
+            return 0.0
 
         if isinstance(score, int):
             score = float(score)
         elif not isinstance(score, float):
-            score = 0.0
+            return 0.0
+        if _score_cache_key and response.ok:
+            self.result_cache.set(_score_cache_key, score)
         return score
 
+    def _prescore_scoring_logs(self, miner_commit: MinerChallengeCommit):
+        """
+        Scores all scoring logs with an output of the miner ahead of `_score_miner_with_new_inputs`,
+        so that its per-log `_score_challenge` calls are served without a round trip each.
+
+        Scores are keyed by the log's input hash and a digest of its output, like the result
+        cache. `_score_miner_with_new_inputs` must therefore score the logs' `miner_input` and
+        `miner_output` as they are: a pair changed before `_score_challenge` is scored again
+        with a single request, and the unused scores are reported by `_score_miner`.
+        """
+        _scoring_logs = [
+            scoring_log
+            for scoring_log in miner_commit.scoring_logs
+            if scoring_log.miner_input is not None
+            and scoring_log.miner_output is not None
+        ]
+        _scores = self._score_challenges(
+            [
+                (scoring_log.miner_input, scoring_log.miner_output)
+                for scoring_log in _scoring_logs
+            ]
+        )
+        self._miner_context.prescored = {
+            (
+                scoring_log.input_hash or _hash_input(scoring_log.miner_input),
+                _hash_payload(scoring_log.miner_output),
+            ): score
+            for scoring_log, score in zip(_scoring_logs, _scores)
+        }
+
+    def _score_challenges(self, pairs: list[tuple[dict, dict]]) -> list[float]:
+        """
+        Scores many input and output pairs, in batches of `max_batch_size` through `/score/batch`
+        if the challenge container advertises it in `/capabilities`, otherwise through up to
+        `challenge_score_concurrency` (default 4) concurrent single `/score` requests.
+
+        Args:
+            pairs: Miner input and output pairs
+
+        Returns:
+            list[float]: Score of each pair, in the same order
+        """
+        if not pairs:
+            return []
+
+        _scores: list[float | None] = [None] * len(pairs)
+        _score_cache_keys = [
+            self._get_score_cache_key(miner_input, miner_output)
+            for miner_input, miner_output in pairs
+        ]
+        for index, _score_cache_key in enumerate(_score_cache_keys):
+            if _score_cache_key:
+                _scores[index] = self.result_cache.get(_score_cache_key)
+
+        _unscored_indices = [
+            index for index, score in enumerate(_scores) if score is None
+        ]
+        _capabilities = self._get_challenge_capabilities() if _unscored_indices else {}
+        if _capabilities.get("score_batch", False):
+            _batch_size = _capabilities.get("max_batch_size", None) or len(
+                _unscored_indices
+            )
+            for _start in range(0, len(_unscored_indices), _batch_size):
+                _end = _start + _batch_size
+                _batch_indices = _unscored_indices[_start:_end]
+                try:
+                    _batch_scores = self._score_batch(
+                        [pairs[index] for index in _batch_indices]
+                    )
+                except Exception as e:
+                    bt.logging.warning(
+                        f"[CONTROLLER] Batch scoring failed, falling back to single requests: {e}"
+                    )
+                    continue
+                for index, score in zip(_batch_indices, _batch_scores):
+                    _scores[index] = score
+                    if _score_cache_keys[index]:
+                        self.result_cache.set(_score_cache_keys[index], score)
+
+        _unscored_indices = [
+            index for index, score in enumerate(_scores) if score is None
+        ]
+        if _unscored_indices:
+            with ThreadPoolExecutor(
+                max_workers=self.challenge_info.get("challenge_score_concurrency", 4),
+                thread_name_prefix="challenge_score",
+            ) as executor:
+                for index, score in zip(
+                    _unscored_indices,
+                    executor.map(
+                        lambda index: self._request_score(
+                            *pairs[index], check_cache=False
+                        ),
+                        _unscored_indices,
+                    ),
+                ):
+                    _scores[index] = score
+        return _scores
+
+    def _score_batch(self, pairs: list[tuple[dict, dict]]) -> list[float]:
+        """Scores input and output pairs in one request to the challenge container's `/score/batch`."""
+        _protocol, _ssl_verify = self._check_protocol(is_challenger=True)
+        payload = {
+            "pairs": [
+                {"miner_input": miner_input, "miner_output": miner_output}
+                for miner_input, miner_output in pairs
+            ]
+        }
+        response = self.challenge_http_client.post(
+            f"{_protocol}://localhost:{constants.CHALLENGE_DOCKER_PORT}/score/batch",
+            verify=_ssl_verify,
+            json=payload,
+            headers=self.challenge_info.get("scoring_headers", {}),
+            timeout=self.challenge_info.get("challenge_score_timeout", 300),
+        )
+        response.raise_for_status()
+        scores = response.json()
+        if isinstance(scores, dict):
+            scores = scores.get("scores", [])
+        if len(scores) != len(pairs):
+            raise ValueError(
+                f"Batch scoring returned {len(scores)} scores for {len(pairs)} pairs"
+            )
+        return [
+            float(score) if isinstance(score, (int, float)) else 0.0 for score in scores
+        ]
+
+    def _get_challenge_capabilities(self) -> dict:
+        """
+        Negotiates the optional features of the challenge container through its `/capabilities`
+        endpoint, e.g. {"score_batch": true, "max_batch_size": 32}. The answer is kept for the
+        lifetime of the controller, containers without the endpoint have no optional features.
+        """
+        with self._capabilities_lock:
+            if self._challenge_capabilities is None:
+                _protocol, _ssl_verify = self._check_protocol(is_challenger=True)
+                try:
+                    response = self.challenge_http_client.get(
+                        f"{_protocol}://localhost:{constants.CHALLENGE_DOCKER_PORT}/capabilities",
+                        verify=_ssl_verify,
+                        timeout=10,
+                    )
+                    response.raise_for_status()
+                    self._challenge_capabilities = response.json()
+                except Exception as e:
+                    bt.logging.info(
+                        f"[CONTROLLER] Challenge container capabilities are not available: {e}"
+                    )
+                    self._challenge_capabilities = {}
+                bt.logging.info(
+                    f"[CONTROLLER] Challenge container capabilities: {self._challenge_capabilities}"
+                )
+            return self._challenge_capabilities
+
     def _get_current_commits_to_compare(
         self, miner_commit: MinerChallengeCommit = None
     ) -> list[MinerChallengeCommit]:
@@ -1,19 +1,73 @@
+from concurrent.futures import Future, ThreadPoolExecutor
 import copy
+import hashlib
+import json
 import re
 import subprocess
+import threading
 import time
 
 import bittensor as bt
 import docker
 import docker.models.containers
+import docker.models.images
 import docker.types
 import requests
 
+from redteam_core.challenge_pool.http_client import HTTPClient, get_default_client
+from redteam_core.tracing import traced
 
+# Label holding the hash of the image and run configuration a container was started with
+CONFIG_HASH_LABEL = "redteam.config_hash"
+# Labels of every container started through `run_container`
+MANAGED_LABEL = "redteam.managed"
+ROLE_LABEL = "redteam.role"
+
+
+class ContainerRegistry:
+    """
+    Tracks the containers started through `run_container` by ID, so that teardown does not
+    need to scan every container on the host. Containers are also labelled with
+    `MANAGED_LABEL` and `ROLE_LABEL`, so that containers left by a crashed process can be
+    found with a label filter.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Mapping from container ID to {"name": container name, "role": "challenge" or "miner"}
+        self._containers: dict[str, dict] = {}
+
+    def register(self, container: docker.models.containers.Container, role: str):
+        with self._lock:
+            self._containers[container.id] = {"name": container.name, "role": role}
+
+    def unregister(self, container_id: str):
+        with self._lock:
+            self._containers.pop(container_id, None)
+
+    def get_ids(self, role: str | None = None) -> list[str]:
+        """Returns the IDs of the tracked containers, optionally only those with the given role."""
+        with self._lock:
+            return [
+                container_id
+                for container_id, info in self._containers.items()
+                if role is None or info["role"] == role
+            ]
+
+    def __contains__(self, container_id: str) -> bool:
+        with self._lock:
+            return container_id in self._containers
+
+
+container_registry = ContainerRegistry()
+
+
+@traced("docker.run_container")
 def run_container(
     client: docker.DockerClient,
     image: str,
     is_miner: bool = False,
+    skip_pull: bool = False,
     **container_run_kwargs,
 ) -> docker.models.containers.Container:
     """
@@ -22,28 +76,25 @@ def run_container(
     Args:
         client: Docker client instance
         image: Docker image name
+        is_miner: Whether the image is a miner image that must be pulled with miner credentials
+        skip_pull: Whether to skip pulling the miner image (e.g. it was already prefetched)
         **container_run_kwargs: Additional container run arguments
 
     Returns:
         Container instance
     """
     if is_miner:
-        _miner_docker_info = container_run_kwargs.get("miner_docker_info", {})
-        _miner_username = _miner_docker_info.get("dockerhub_username", None)
-        _miner_pat = _miner_docker_info.get("personal_access_token", None)
-        if not _miner_username or not _miner_pat:
-            raise ValueError(
-                "Miner Docker image requires authentication. \
-                    Please provide 'dockerhub_username' and 'personal_access_token'."
-            )
-        _auth_config = {
-            "username": _miner_username,
-            "password": _miner_pat,
-        }
-        client.images.pull(image, auth_config=_auth_config, platform="linux/amd64")
-        del container_run_kwargs["miner_docker_info"]
+        _miner_docker_info = container_run_kwargs.pop("miner_docker_info", {})
+        if not skip_pull:
+            pull_image(client, image, _miner_docker_info)
 
     _run_kwargs = copy.deepcopy(container_run_kwargs)
+    _role = "miner" if is_miner else "challenge"
+    _run_kwargs["labels"] = {
+        **_run_kwargs.get("labels", {}),
+        MANAGED_LABEL: "true",
+        ROLE_LABEL: _role,
+    }
 
     # Prepare DeviceRequest
     if "device_requests" in _run_kwargs:
@@ -53,7 +104,65 @@ def run_container(
             for device_request in _device_requests
         ]
 
-    return client.containers.run(image, **_run_kwargs)
+    container = client.containers.run(image, **_run_kwargs)
+    if isinstance(container, docker.models.containers.Container):
+        container_registry.register(container, role=_role)
+    return container
+
+
+@traced("docker.pull_image")
+def pull_image(
+    client: docker.DockerClient,
+    image: str,
+    miner_docker_info: dict,
+    platform: str = "linux/amd64",
+) -> tuple[docker.models.images.Image, int]:
+    """
+    Pulls a miner Docker image with the miner's Docker Hub credentials.
+
+    Args:
+        client: Docker client instance
+        image: Docker image name with digest
+        miner_docker_info: Miner's 'dockerhub_username' and 'personal_access_token'
+        platform: Platform of the image to pull
+
+    Returns:
+        tuple[Image, int]: Pulled image and number of bytes downloaded for its layers
+    """
+    _miner_username = miner_docker_info.get("dockerhub_username", None)
+    _miner_pat = miner_docker_info.get("personal_access_token", None)
+    if not _miner_username or not _miner_pat:
+        raise ValueError(
+            "Miner Docker image requires authentication. \
+                Please provide 'dockerhub_username' and 'personal_access_token'."
+        )
+    _auth_config = {
+        "username": _miner_username,
+        "password": _miner_pat,
+    }
+
+    _repository, _tag = docker.utils.parse_repository_tag(image)
+    _tag = _tag or "latest"
+    _layer_bytes = {}
+    for _event in client.api.pull(
+        _repository,
+        tag=_tag,
+        stream=True,
+        decode=True,
+        auth_config=_auth_config,
+        platform=platform,
+    ):
+        if "error" in _event:
+            raise docker.errors.APIError(_event["error"])
+        if _event.get("status") == "Downloading":
+            _layer_bytes[_event["id"]] = _event.get("progressDetail", {}).get(
+                "total", 0
+            )
+
+    _separator = "@" if _tag.startswith("sha256:") else ":"
+    return client.images.get(f"{_repository}{_separator}{_tag}"), sum(
+        _layer_bytes.values()
+    )
 
 
 # MARK: SETUP
@@ -64,6 +173,105 @@ def create_docker_client() -> docker.DockerClient:
     return docker.from_env()
 
 
+def get_max_parallel_containers(
+    client: docker.DockerClient,
+    num_cpus: float | None = None,
+    mem_limit: str | int | None = None,
+) -> int:
+    """
+    Calculates how many containers with the given resource limits fit on the Docker host.
+
+    Args:
+        client: Docker client instance
+        num_cpus: Number of CPUs reserved for each container
+        mem_limit: Memory reserved for each container (e.g. "12g" or bytes)
+
+    Returns:
+        int: Number of containers that can run at once (at least 1)
+    """
+    try:
+        _host_info = client.info()
+    except Exception as e:
+        bt.logging.warning(f"Failed to get Docker host info: {e}")
+        return 1
+
+    _capacities = []
+    if num_cpus:
+        _capacities.append(int(_host_info.get("NCPU", 0) // float(num_cpus)))
+    if mem_limit:
+        _mem_bytes = docker.utils.parse_bytes(mem_limit)
+        if _mem_bytes:
+            _capacities.append(int(_host_info.get("MemTotal", 0) // _mem_bytes))
+
+    if not _capacities:
+        return 1
+    return max(1, min(_capacities))
+
+
+def get_container_config_hash(
+    client: docker.DockerClient, image: str, container_run_kwargs: dict
+) -> str:
+    """
+    Hashes the image and run configuration of a container, so that a running container can be
+    reused only if it was started from the same image ID with the same arguments.
+
+    Args:
+        client: Docker client instance
+        image: Docker image name
+        container_run_kwargs: Container run arguments
+
+    Returns:
+        str: SHA256 hash of the configuration
+    """
+    _config = {
+        "image": image,
+        "image_id": get_image_id(client, image),
+        "run_kwargs": container_run_kwargs,
+    }
+    return hashlib.sha256(
+        json.dumps(_config, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def get_image_id(client: docker.DockerClient, image: str) -> str | None:
+    """Returns the local image ID (sha256 digest of the image config), or None if not pulled."""
+    try:
+        return client.images.get(image).id
+    except docker.errors.ImageNotFound:
+        return None
+
+
+def get_container(
+    client: docker.DockerClient, container_name: str
+) -> docker.models.containers.Container | None:
+    """Returns the container with the given name, or None if it does not exist."""
+    try:
+        return client.containers.get(container_name)
+    except docker.errors.NotFound:
+        return None
+
+
+def get_container_host_port(
+    container: docker.models.containers.Container, container_port: int
+) -> int | None:
+    """
+    Returns the host port that Docker published for a container port.
+
+    Args:
+        container: Container instance
+        container_port: Port exposed inside the container
+
+    Returns:
+        int | None: Host port if the container port is published, None otherwise
+    """
+    container.reload()
+    _ports = container.attrs["NetworkSettings"].get("Ports", None) or {}
+    _bindings = _ports.get(f"{container_port}/tcp", None)
+    if not _bindings:
+        return None
+    return int(_bindings[0]["HostPort"])
+
+
 def build_challenge_image(
     client: docker.DockerClient, challenge_name: str, build_path: str
 ) -> None:
@@ -128,6 +336,7 @@ def create_network(
 # MARK: CLEANING
 
 
+@traced("docker.remove_container")
 def remove_container(
     client: docker.DockerClient,
     container_name: str,
@@ -141,40 +350,139 @@ def remove_container(
 
     Args:
         client: Docker client instance
-        container_name: Name of the container to remove
+        container_name: Name or ID of the container to remove
         stop_timeout: Timeout in seconds for stopping the container (default: 10)
         force: Whether to force remove the container (default: True)
         remove_volumes: Whether to remove associated volumes (default: True)
-        max_retries: Maximum number of removal attempts (default: 3)
+        max_retries: Maximum number of removal attempts (default: 12)
 
     Returns:
         bool: True if container was successfully removed or doesn't exist,
               False if removal failed after retries
     """
     try:
-        containers = client.containers.list(all=True)
+        target_container = client.containers.get(container_name)
+    except docker.errors.NotFound:
+        bt.logging.info(f"Container '{container_name}' not found")
+        return True
     except Exception as e:
-        bt.logging.error(f"Failed to list containers: {str(e)}")
+        bt.logging.error(f"Failed to get container '{container_name}': {str(e)}")
         return False
 
-    target_container = None
-    for container in containers:
-        if container.name == container_name:
-            target_container = container
-            break
+    return _stop_and_remove_container(
+        container=target_container,
+        stop_timeout=stop_timeout,
+        force=force,
+        remove_volumes=remove_volumes,
+        max_retries=max_retries,
+    )
+
+
+@traced("docker.remove_containers")
+def remove_containers(
+    containers: list[docker.models.containers.Container],
+    stop_timeout: int = 10,
+    force: bool = True,
+    remove_volumes: bool = True,
+    max_retries: int = 12,
+    max_workers: int = 8,
+) -> int:
+    """
+    Stops and removes containers concurrently through the Docker API.
+
+    Args:
+        containers: Containers to remove
+        stop_timeout: Timeout in seconds for stopping each container
+        force: Whether to force remove the containers
+        remove_volumes: Whether to remove associated volumes
+        max_retries: Maximum number of removal attempts per container
+        max_workers: Maximum number of containers stopped at once
+
+    Returns:
+        int: Number of containers removed
+    """
+    if not containers:
+        return 0
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(containers)),
+        thread_name_prefix="container_teardown",
+    ) as executor:
+        _removed = executor.map(
+            lambda container: _stop_and_remove_container(
+                container=container,
+                stop_timeout=stop_timeout,
+                force=force,
+                remove_volumes=remove_volumes,
+                max_retries=max_retries,
+            ),
+            containers,
+        )
+        return sum(_removed)
+
+
+def remove_container_by_port(client: docker.DockerClient, port: int) -> None:
+    """
+    Removes all containers using a specific port. Containers are filtered by the Docker daemon
+    instead of inspecting every container on the host.
+
+    Args:
+        client: Docker client instance
+        port: Port number to match
+    """
+    try:
+        containers = client.containers.list(all=True, filters={"expose": str(port)})
+    except Exception as e:
+        bt.logging.error(f"Failed to list containers exposing port {port}: {e}")
+        return
+
+    remove_containers(containers, stop_timeout=0)
 
-    if not target_container:
-        bt.logging.info(f"Container '{container_name}' not found")
-        return True
+
+def remove_orphan_containers(client: docker.DockerClient, role: str = "miner") -> int:
+    """
+    Removes containers with the given role that were started by `run_container` but are not
+    tracked by this process, e.g. containers left behind by a crashed validator.
+
+    Args:
+        client: Docker client instance
+        role: Role label of the containers to recover ("miner" or "challenge")
+
+    Returns:
+        int: Number of containers removed
+    """
+    try:
+        containers = client.containers.list(
+            all=True, filters={"label": [MANAGED_LABEL, f"{ROLE_LABEL}={role}"]}
+        )
+    except Exception as e:
+        bt.logging.error(f"Failed to list orphan containers: {e}")
+        return 0
+
+    _orphans = [
+        container for container in containers if container.id not in container_registry
+    ]
+    if _orphans:
+        bt.logging.info(
+            f"Removing orphan containers: {[container.name for container in _orphans]}"
+        )
+    return remove_containers(_orphans, stop_timeout=0)
+
+
+def _stop_and_remove_container(
+    container: docker.models.containers.Container,
+    stop_timeout: int = 10,
+    force: bool = True,
+    remove_volumes: bool = True,
+    max_retries: int = 12,
+) -> bool:
+    _container_name = container.name
 
     # Try to stop container if running
     try:
-        target_container.reload()
-        if target_container.status != "exited":
-            bt.logging.info(f"Stopping container '{container_name}'")
-            subprocess.run(
-                ["sudo", "docker", "stop", "-t", str(stop_timeout), container_name],
-            )
+        if container.status != "exited" and stop_timeout > 0:
+            bt.logging.info(f"Stopping container '{_container_name}'")
+            container.stop(timeout=stop_timeout)
     except (docker.errors.NotFound, docker.errors.APIError) as e:
         bt.logging.info(f"Container stop status: {str(e)}")
     except Exception as e:
@@ -183,13 +491,14 @@ def remove_container(
     # Attempt removal with retries
     for attempt in range(max_retries):
         try:
-            # target_container.kill()
-            target_container.remove(force=force, v=remove_volumes)
-            bt.logging.info(f"Container '{container_name}' removed successfully")
+            container.remove(force=force, v=remove_volumes)
+            container_registry.unregister(container.id)
+            bt.logging.info(f"Container '{_container_name}' removed successfully")
             return True
         except (docker.errors.NotFound, docker.errors.APIError) as e:
             bt.logging.info(f"Container remove attempt {attempt + 1} status: {str(e)}")
             if isinstance(e, docker.errors.NotFound):
+                container_registry.unregister(container.id)
                 return True
         except Exception as e:
             bt.logging.warning(
@@ -200,30 +509,12 @@ def remove_container(
             time.sleep(2**attempt)  # Exponential backoff
 
     bt.logging.error(
-        f"Failed to remove container '{container_name}' after {max_retries} attempts"
+        f"Failed to remove container '{_container_name}' after {max_retries} attempts"
     )
     return False
 
 
-def remove_container_by_port(client: docker.DockerClient, port: int) -> None:
-    """
-    Removes all containers using a specific port.
-
-    Args:
-        client: Docker client instance
-        port: Port number to match
-    """
-    containers = client.containers.list(all=True)
-    for container in containers:
-        try:
-            container_ports = container.attrs["NetworkSettings"]["Ports"]
-            if any([str(port) in p for p in container_ports]):
-                container.remove(force=True)
-                bt.logging.info(f"Removed container {container.name}")
-        except Exception as e:
-            bt.logging.error(f"Error processing container {container.name}: {e}")
-
-
+@traced("docker.clean_docker_resources")
 def clean_docker_resources(
     client: docker.DockerClient,
     remove_containers: bool = True,
@@ -231,55 +522,136 @@ def clean_docker_resources(
     prune_volumes: bool = True,
     remove_networks: bool = False,
     prune_builds: bool = False,
-) -> None:
+    keep_images: set[str] | None = None,
+) -> dict:
     """
-    Cleans up Docker resources.
+    Cleans up Docker resources. Only containers labelled as created by `run_container`, their
+    anonymous volumes and their images are cleaned, other containers, volumes and images on
+    the host are left untouched.
 
     Args:
         client: Docker client instance
         remove_containers: Whether to remove stopped containers
-        remove_images: Whether to remove dangling images
+        remove_images: Whether to remove the images of labelled containers that are not used
+            by any container anymore
+        prune_volumes: Whether to remove the anonymous volumes of the removed containers
         remove_networks: Whether to remove unused networks
         prune_builds: Whether to prune build cache
+        keep_images: Image references (name@sha256:digest) that must not be removed
+
+    Returns:
+        dict: Cleanup report with the number of removed containers and images,
+            the reclaimed bytes and the time spent (seconds)
     """
+    _start_time = time.time()
+    _report = {"containers": 0, "images": 0, "reclaimed_bytes": 0, "seconds": 0.0}
+    _keep_digests = {image.split("@")[-1] for image in keep_images or ()}
     try:
+        # Images of the labelled containers, listed before their containers are removed
+        _managed_image_ids = set()
+        if remove_images:
+            _managed_image_ids = {
+                container["ImageID"]
+                for container in client.api.containers(
+                    all=True, filters={"label": MANAGED_LABEL}
+                )
+            }
+
         if remove_containers:
-            for container in client.containers.list(all=True):
-                if container.status in ["exited", "dead"]:
-                    bt.logging.info(
-                        f"Removing container {container.name} ({container.id})..."
-                    )
-                    container.remove(force=True)
+            # Filtered by the daemon, with their writable layer size in the same call
+            _stopped_containers = client.api.containers(
+                all=True,
+                size=True,
+                filters={"label": MANAGED_LABEL, "status": ["exited", "dead"]},
+            )
+            with ThreadPoolExecutor(
+                max_workers=8, thread_name_prefix="container_cleanup"
+            ) as executor:
+                _removed = executor.map(
+                    lambda container: _remove_stopped_container(
+                        client, container, remove_volumes=prune_volumes
+                    ),
+                    _stopped_containers,
+                )
+                for container, removed in zip(_stopped_containers, _removed):
+                    if removed:
+                        _report["containers"] += 1
+                        _report["reclaimed_bytes"] += container.get("SizeRw", 0) or 0
 
         if remove_images:
-            used_image_ids = set()
-            for container in client.containers.list(all=True):
-                used_image_ids.add(container.image.id)
-
-            for image in client.images.list():
-                if image.id not in used_image_ids:
-                    try:
-                        client.images.remove(image.id, force=True)
-                        bt.logging.info(f"Removed: {image.id}")
-                    except docker.errors.APIError as e:
-                        bt.logging.info(f"Skipped {image.id}: {e}")
-
-        # Delete unused resources (volumes, build cache)
-        if prune_volumes:
-            bt.logging.info("Pruning volumes...")
-            client.volumes.prune()
-
+            used_image_ids = {
+                container["ImageID"] for container in client.api.containers(all=True)
+            }
+
+            for image_id in _managed_image_ids - used_image_ids:
+                try:
+                    image = client.images.get(image_id)
+                except docker.errors.ImageNotFound:
+                    continue
+                _repo_digests = image.attrs.get("RepoDigests", None) or []
+                if any(
+                    _repo_digest.split("@")[-1] in _keep_digests
+                    for _repo_digest in _repo_digests
+                ):
+                    bt.logging.info(f"Kept: {image.id}")
+                    continue
+                try:
+                    client.images.remove(image.id, force=True)
+                    _report["images"] += 1
+                    _report["reclaimed_bytes"] += image.attrs.get("Size", 0)
+                    bt.logging.info(f"Removed: {image.id}")
+                except docker.errors.APIError as e:
+                    bt.logging.info(f"Skipped {image.id}: {e}")
+
+        # Delete unused resources (networks, build cache)
         if remove_networks:
             bt.logging.info("Pruning networks...")
             client.networks.prune()
 
         if prune_builds:
             bt.logging.info("Pruning build cache...")
-            client.api.prune_builds()
+            _result = client.api.prune_builds()
+            _report["reclaimed_bytes"] += _result.get("SpaceReclaimed", 0) or 0
 
-        bt.logging.info("Docker resources cleaned up successfully")
+        _report["seconds"] = time.time() - _start_time
+        bt.logging.info(f"Docker resources cleaned up successfully: {_report}")
     except Exception as e:
+        _report["seconds"] = time.time() - _start_time
         bt.logging.error(f"Error cleaning Docker resources: {e}")
+    return _report
+
+
+_cleanup_executor = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="docker_cleanup"
+)
+
+
+def clean_docker_resources_in_background(
+    client: docker.DockerClient, **kwargs
+) -> Future:
+    """
+    Runs `clean_docker_resources` in a background thread, so that it does not block the
+    evaluation. Cleanups are queued and run one at a time.
+
+    Returns:
+        Future: Future of the cleanup report
+    """
+    return _cleanup_executor.submit(clean_docker_resources, client, **kwargs)
+
+
+def _remove_stopped_container(
+    client: docker.DockerClient, container: dict, remove_volumes: bool = True
+) -> bool:
+    try:
+        client.api.remove_container(container["Id"], v=remove_volumes, force=True)
+        container_registry.unregister(container["Id"])
+        bt.logging.info(f"Removed container {container['Names']} ({container['Id']})")
+        return True
+    except docker.errors.NotFound:
+        return False
+    except docker.errors.APIError as e:
+        bt.logging.info(f"Skipped container {container['Id']}: {e}")
+        return False
 
 
 def is_image_digest_format_valid(image: str) -> bool:
@@ -301,6 +673,7 @@ def is_image_digest_format_valid(image: str) -> bool:
     return True
 
 
+@traced("docker.check_container_alive")
 def check_container_alive(
     container,
     health_port,
@@ -309,34 +682,161 @@ def check_container_alive(
     timeout=None,
     start_time=None,
     ip="localhost",
-):
-    """Check when the container is running successfully"""
+    http_client: HTTPClient | None = None,
+    initial_interval: float = 0.05,
+    max_interval: float = 2.0,
+) -> float:
+    """
+    Waits until the container answers its health endpoint.
+
+    Health probes start every `initial_interval` seconds and back off exponentially up to
+    `max_interval`. A watcher on the Docker events stream wakes the probe loop as soon as the
+    container reports a HEALTHCHECK status or dies, so the container is used the moment it is
+    ready. The events stream only reports events after the subscription, so the container
+    state is also reloaded once after subscribing and on every backoff tick without an event,
+    which catches a container that died before the watcher started.
+
+    Args:
+        container: Container to wait for
+        health_port: Port of the health endpoint
+        protocol: Protocol of the health endpoint
+        ssl_verify: SSL verification of the health endpoint
+        timeout: Maximum time to wait (seconds), waits forever if None
+        start_time: Start time of the timeout, defaults to now
+        ip: IP address of the health endpoint
+        http_client: HTTP client used for the health probes
+        initial_interval: Delay before the second probe (seconds)
+        max_interval: Maximum delay between probes (seconds)
+
+    Returns:
+        float: Time to ready (seconds) since `start_time`
+    """
     if not start_time:
         start_time = time.time()
-    while not is_container_alive(
-        port=health_port, protocol=protocol, ssl_verify=ssl_verify, ip=ip
-    ) and (not timeout or time.time() - start_time < timeout):
-        container.reload()
-        if container.status in ["exited", "dead"]:
-            container_logs = container.logs().decode("utf-8", errors="ignore")
-            bt.logging.error(
-                f"Container {container} failed with status: {container.status}"
-            )
-            bt.logging.error(f"Container logs:\n{container_logs}")
-            raise RuntimeError(
-                f"Container failed to start. Status: {container.status}. Container logs: {container_logs}"
-            )
-        else:
-            bt.logging.info(f"Waiting for container to start. {container.status}")
-            time.sleep(5)
 
+    _watcher = _ContainerEventWatcher(container)
+    _interval = initial_interval
+    # The container may have died before the subscription
+    _reload = True
+    try:
+        while not is_container_alive(
+            port=health_port,
+            protocol=protocol,
+            ssl_verify=ssl_verify,
+            ip=ip,
+            http_client=http_client,
+            request_timeout=max(1.0, max_interval),
+        ):
+            _remaining = timeout - (time.time() - start_time) if timeout else None
+            if _remaining is not None and _remaining <= 0:
+                bt.logging.warning(
+                    f"Container {container.name} is not ready after {timeout}s"
+                )
+                return time.time() - start_time
+
+            # Without the events stream, the container state has to be polled instead
+            if _reload or _watcher.is_dead or not _watcher.is_watching:
+                container.reload()
+            if _watcher.is_dead or container.status in ["exited", "dead"]:
+                container_logs = container.logs().decode("utf-8", errors="ignore")
+                bt.logging.error(
+                    f"Container {container} failed with status: {container.status}"
+                )
+                bt.logging.error(f"Container logs:\n{container_logs}")
+                raise RuntimeError(
+                    f"Container failed to start. Status: {container.status}. Container logs: {container_logs}"
+                )
+
+            bt.logging.debug(
+                f"Waiting for container to start. {container.status}, health: {_watcher.health_status}"
+            )
+            if _watcher.wait(
+                _interval if _remaining is None else min(_interval, _remaining)
+            ):
+                # Probe right away when the container reports a state change
+                _interval = initial_interval
+                _reload = False
+            else:
+                _interval = min(_interval * 2, max_interval)
+                _reload = True
+    finally:
+        _watcher.close()
+
+    _time_to_ready = time.time() - start_time
+    bt.logging.info(f"Container {container.name} ready in {_time_to_ready:.3f}s")
+    return _time_to_ready
+
+
+class _ContainerEventWatcher:
+    """Follows the Docker events of a single container in a background thread."""
+
+    def __init__(self, container):
+        self.health_status: str | None = None
+        self.is_dead = False
+        self.is_watching = False
+        self._changed = threading.Event()
+        self._events = None
 
-def is_container_alive(port=10001, protocol="http", ssl_verify=None, ip=None):
+        try:
+            self._events = container.client.events(
+                decode=True,
+                filters={
+                    "container": container.id,
+                    "event": ["die", "oom", "health_status"],
+                },
+            )
+            self.is_watching = True
+        except Exception as e:
+            bt.logging.debug(f"Docker events are not available: {e}")
+            return
+
+        threading.Thread(
+            target=self._watch, name=f"events_{container.name}", daemon=True
+        ).start()
+
+    def wait(self, timeout: float) -> bool:
+        """Waits up to `timeout` seconds for a container event, returns True if one arrived."""
+        _changed = self._changed.wait(timeout)
+        self._changed.clear()
+        return _changed
+
+    def close(self):
+        if self._events is not None:
+            try:
+                self._events.close()
+            except Exception:
+                pass
+
+    def _watch(self):
+        try:
+            for _event in self._events:
+                _status = _event.get("status") or _event.get("Action") or ""
+                if _status.startswith("health_status"):
+                    self.health_status = _status.split(":", 1)[-1].strip()
+                elif _status in ("die", "oom"):
+                    self.is_dead = True
+                self._changed.set()
+        except Exception:
+            # Stream closed or daemon unreachable, fall back to polling
+            pass
+        finally:
+            self.is_watching = False
+
+
+def is_container_alive(
+    port=10001,
+    protocol="http",
+    ssl_verify=None,
+    ip=None,
+    http_client: HTTPClient | None = None,
+    request_timeout: float | None = None,
+):
+    http_client = http_client or get_default_client()
     try:
         url = f"{protocol}://{ip}:{port}/health"
-        response = requests.get(url, verify=ssl_verify)
+        response = http_client.get(url, verify=ssl_verify, timeout=request_timeout)
         if response.status_code == 200:
             return True
-    except requests.exceptions.ConnectionError:
+    except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
         return False
     return False
@@ -0,0 +1,151 @@
+from urllib.parse import urlparse
+import bisect
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+
+class HTTPClient:
+    """
+    Pooled HTTP client for a single target (challenge container, miner containers or internal services).
+
+    Connections are kept alive and reused across calls, connection errors are retried with
+    exponential backoff, and the latency of every call is recorded in a per-endpoint histogram.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        max_retries: int = 0,
+        backoff_factor: float = 0.5,
+        status_forcelist: list[int] | None = None,
+    ):
+        """
+        Args:
+            name: Name of the target, used in logs and metrics
+            pool_connections: Number of hosts to keep connection pools for
+            pool_maxsize: Maximum number of kept-alive connections per host
+            max_retries: Maximum number of retries on connection errors and `status_forcelist` statuses
+            backoff_factor: Backoff factor between retries (backoff_factor * 2 ** (retry - 1) seconds)
+            status_forcelist: HTTP statuses to retry on, none by default
+        """
+        self.name = name
+        status_forcelist = list(status_forcelist or [])
+
+        _retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            # Read errors are never retried, the request may already have been processed
+            read=False,
+            status=max_retries if status_forcelist else 0,
+            backoff_factor=backoff_factor,
+            status_forcelist=status_forcelist,
+            allowed_methods=None,
+            raise_on_status=False,
+        )
+        _adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=_retry,
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", _adapter)
+        self.session.mount("https://", _adapter)
+
+        self._lock = threading.Lock()
+        # Latency histograms, mapping from endpoint to {"count", "errors", "total_seconds", "buckets"}
+        self._latencies: dict[str, dict] = {}
+
+    def request(
+        self, method: str, url: str, endpoint: str | None = None, **kwargs
+    ) -> requests.Response:
+        """
+        Sends a request through the pooled session and records its latency.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            endpoint: Name of the endpoint in the latency histograms, defaults to the URL path
+            **kwargs: Additional `requests` arguments (json, headers, timeout, verify, ...)
+        """
+        _endpoint = endpoint or urlparse(url).path
+        _start_time = time.perf_counter()
+        _failed = True
+        try:
+            response = self.session.request(method, url, **kwargs)
+            _failed = False
+            return response
+        finally:
+            self._record_latency(_endpoint, time.perf_counter() - _start_time, _failed)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def get_latency_summary(self) -> dict[str, dict]:
+        """
+        Returns the latency histogram of every endpoint called through this client.
+
+        Returns:
+            dict[str, dict]: Mapping from endpoint to its call count, error count, mean latency
+                and cumulative bucket counts keyed by bucket upper bound ("+Inf" for the rest)
+        """
+        with self._lock:
+            _summary = {}
+            for _endpoint, _stats in self._latencies.items():
+                _cumulative_buckets = {}
+                _count = 0
+                for _bound, _bucket_count in zip(
+                    (*LATENCY_BUCKETS, "+Inf"), _stats["buckets"]
+                ):
+                    _count += _bucket_count
+                    _cumulative_buckets[str(_bound)] = _count
+                _summary[_endpoint] = {
+                    "count": _stats["count"],
+                    "errors": _stats["errors"],
+                    "mean_seconds": _stats["total_seconds"] / _stats["count"],
+                    "buckets": _cumulative_buckets,
+                }
+            return _summary
+
+    def close(self):
+        self.session.close()
+
+    def _record_latency(self, endpoint: str, seconds: float, failed: bool):
+        with self._lock:
+            _stats = self._latencies.setdefault(
+                endpoint,
+                {
+                    "count": 0,
+                    "errors": 0,
+                    "total_seconds": 0.0,
+                    "buckets": [0] * (len(LATENCY_BUCKETS) + 1),
+                },
+            )
+            _stats["count"] += 1
+            _stats["errors"] += int(failed)
+            _stats["total_seconds"] += seconds
+            _stats["buckets"][bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+
+_default_client: HTTPClient | None = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> HTTPClient:
+    """Returns the process-wide client used when no target-specific client is given."""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = HTTPClient(name="default")
+        return _default_client
@@ -0,0 +1,133 @@
+import os
+import threading
+import time
+
+import bittensor as bt
+import docker
+import docker.errors
+from diskcache import Cache
+
+from redteam_core.challenge_pool import docker_utils
+
+
+class ImageCache:
+    """
+    Disk-budgeted local cache of Docker images keyed on their `@sha256:` digest.
+
+    Images are only removed by LRU eviction once the cached images exceed the disk budget,
+    so unchanged digests resubmitted across epochs are not pulled again. Pinned images
+    (e.g. the active challenge image) are never evicted. The usage index is persisted in
+    a diskcache so the LRU order survives validator restarts.
+    """
+
+    def __init__(self, client: docker.DockerClient, cache_dir: str, max_bytes: int):
+        """
+        Args:
+            client: Docker client instance
+            cache_dir: Directory of the persisted usage index
+            max_bytes: Disk budget for cached images (bytes)
+        """
+        self.client = client
+        self.max_bytes = max_bytes
+
+        os.makedirs(cache_dir, exist_ok=True)
+        # Usage index, mapping from digest to {"image": reference, "size": bytes, "last_used": timestamp}
+        self._index = Cache(cache_dir, eviction_policy="none")
+        self._lock = threading.Lock()
+        self._pinned_digests: set[str] = set()
+
+        self.hits = 0
+        self.misses = 0
+
+    def ensure(self, image: str, miner_docker_info: dict) -> int:
+        """
+        Makes sure the image is available locally, pulling it only on a cache miss.
+
+        Args:
+            image: Docker image name with digest
+            miner_docker_info: Miner's Docker Hub credentials used for pulling
+
+        Returns:
+            int: Number of bytes downloaded (0 on a cache hit)
+        """
+        try:
+            _image = self.client.images.get(image)
+            _pull_bytes = 0
+            self.hits += 1
+            bt.logging.info(f"[IMAGE CACHE] Hit: {image}")
+        except docker.errors.ImageNotFound:
+            _image, _pull_bytes = docker_utils.pull_image(
+                self.client, image, miner_docker_info
+            )
+            self.misses += 1
+            bt.logging.info(f"[IMAGE CACHE] Miss: {image}, pulled {_pull_bytes} bytes")
+
+        self.touch(image, size=_image.attrs.get("Size", 0))
+        return _pull_bytes
+
+    def touch(self, image: str, size: int | None = None):
+        """Marks the image as most recently used."""
+        _digest = self._get_digest(image)
+        with self._lock:
+            _entry = self._index.get(_digest, None) or {"image": image, "size": 0}
+            if size is not None:
+                _entry["size"] = size
+            _entry["last_used"] = time.time()
+            self._index[_digest] = _entry
+
+    def pin(self, image: str):
+        """Protects the image from eviction, registering it in the cache if needed."""
+        with self._lock:
+            self._pinned_digests.add(self._get_digest(image))
+        try:
+            self.touch(image, size=self.client.images.get(image).attrs.get("Size", 0))
+        except docker.errors.ImageNotFound:
+            self.touch(image)
+
+    def unpin(self, image: str):
+        with self._lock:
+            self._pinned_digests.discard(self._get_digest(image))
+
+    def evict(self, keep_images: set[str] | None = None) -> int:
+        """
+        Removes least recently used images until the cached images fit in the disk budget.
+        Pinned images, images in `keep_images` and images used by containers are kept.
+
+        Returns:
+            int: Number of bytes freed
+        """
+        _keep_digests = {self._get_digest(image) for image in keep_images or ()}
+        with self._lock:
+            _entries = sorted(
+                ((digest, self._index[digest]) for digest in self._index.iterkeys()),
+                key=lambda item: item[1]["last_used"],
+            )
+            _total_bytes = sum(entry["size"] for _, entry in _entries)
+            _freed_bytes = 0
+
+            for _digest, _entry in _entries:
+                if _total_bytes <= self.max_bytes:
+                    break
+                if _digest in self._pinned_digests or _digest in _keep_digests:
+                    continue
+
+                try:
+                    self.client.images.remove(_entry["image"], force=False)
+                    bt.logging.info(
+                        f"[IMAGE CACHE] Evicted {_entry['image']} ({_entry['size']} bytes)"
+                    )
+                except docker.errors.ImageNotFound:
+                    pass
+                except docker.errors.APIError as e:
+                    # Image is still used by a container
+                    bt.logging.info(f"[IMAGE CACHE] Skipped {_entry['image']}: {e}")
+                    continue
+
+                del self._index[_digest]
+                _total_bytes -= _entry["size"]
+                _freed_bytes += _entry["size"]
+
+        return _freed_bytes
+
+    def _get_digest(self, image: str) -> str:
+        return image.split("@")[-1]
@@ -0,0 +1,108 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
+import time
+
+import bittensor as bt
+import docker
+
+from redteam_core.challenge_pool.image_cache import ImageCache
+from redteam_core.validator.models import MinerChallengeCommit
+
+
+class ImagePrefetcher:
+    """
+    Pulls miner images ahead of their evaluation in background threads, so that image
+    downloads overlap with the evaluation of the miners before them.
+    """
+
+    def __init__(
+        self,
+        client: docker.DockerClient,
+        miner_commits: list[MinerChallengeCommit],
+        miners_docker_info: dict[str, dict],
+        image_cache: ImageCache,
+        lookahead: int = 1,
+    ):
+        """
+        Args:
+            client: Docker client instance
+            miner_commits: Miner commits in the order they will be evaluated
+            miners_docker_info: Docker Hub credentials of miners, keyed by miner UID
+            image_cache: Local image cache, images already cached are not pulled again
+            lookahead: Number of upcoming miner images to pull in the background
+        """
+        self.client = client
+        self.image_cache = image_cache
+        self.miner_commits = miner_commits
+        self.miners_docker_info = miners_docker_info
+        self.lookahead = max(0, lookahead)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, self.lookahead), thread_name_prefix="image_prefetch"
+        )
+        self._lock = threading.Lock()
+        self._pulls: dict[str, Future] = {}
+        self._released_images: set[str] = set()
+
+        # Pull metrics, mapping from image to {"pull_latency": seconds, "pull_bytes": bytes}
+        self.metrics: dict[str, dict] = {}
+
+    def schedule(self, index: int):
+        """Starts pulling the images of the miner at `index` and the `lookahead` miners after it."""
+        _end = index + self.lookahead + 1
+        for miner_commit in self.miner_commits[index:_end]:
+            self._submit(miner_commit)
+
+    def wait(self, miner_commit: MinerChallengeCommit):
+        """
+        Blocks until the miner's image is pulled, pulling it now if it was not prefetched.
+        Raises the pull error if the pull failed.
+        """
+        _future = self._submit(miner_commit)
+        if _future:
+            _future.result()
+
+    def release(self, miner_commit: MinerChallengeCommit):
+        """Marks the miner's image as consumed, so that cleanup no longer needs to keep it."""
+        with self._lock:
+            self._released_images.add(miner_commit.docker_hub_id)
+
+    def pending_images(self) -> set[str]:
+        """Returns images that were prefetched for miners that are not evaluated yet."""
+        with self._lock:
+            return set(self._pulls) - self._released_images
+
+    def shutdown(self):
+        """Stops the background pulls that have not started yet."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self.metrics:
+            _total_latency = sum(m["pull_latency"] for m in self.metrics.values())
+            _total_bytes = sum(m["pull_bytes"] for m in self.metrics.values())
+            bt.logging.info(
+                f"[PREFETCH] Pulled {len(self.metrics)} images, {_total_bytes} bytes in {_total_latency:.2f}s"
+            )
+
+    def _submit(self, miner_commit: MinerChallengeCommit) -> Future | None:
+        _image = miner_commit.docker_hub_id
+        if not _image or "@sha256:" not in _image:
+            return None
+
+        with self._lock:
+            if _image not in self._pulls:
+                _miner_docker_info = self.miners_docker_info.get(
+                    str(miner_commit.miner_uid), {}
+                )
+                self._pulls[_image] = self._executor.submit(
+                    self._pull, _image, _miner_docker_info
+                )
+            return self._pulls[_image]
+
+    def _pull(self, image: str, miner_docker_info: dict):
+        _start_time = time.time()
+        _pull_bytes = self.image_cache.ensure(image, miner_docker_info)
+        _pull_latency = time.time() - _start_time
+
+        self.metrics[image] = {"pull_latency": _pull_latency, "pull_bytes": _pull_bytes}
+        bt.logging.info(
+            f"[PREFETCH] Pulled {image}: {_pull_bytes} bytes in {_pull_latency:.2f}s"
+        )
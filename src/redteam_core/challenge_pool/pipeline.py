@@ -0,0 +1,118 @@
+from typing import Any, Callable
+import queue
+import threading
+import time
+
+import bittensor as bt
+
+_STOP = object()
+
+
+class EvaluationPipeline:
+    """
+    Runs items through a sequence of stages, each processed by its own worker thread and
+    connected to the next stage by a bounded queue. Items keep their order in every stage,
+    and a stage only blocks when the queue of the next stage is full.
+
+    Stage errors are logged and the item is passed on, so that later stages (e.g. container
+    cleanup) still see it. Handlers are expected to record their own errors on the item.
+    """
+
+    def __init__(
+        self,
+        stages: list[tuple[str, Callable[[Any], None]]],
+        queue_size: int = 1,
+    ):
+        """
+        Args:
+            stages: Stage names and handlers, in processing order
+            queue_size: Maximum number of items waiting in front of each stage
+        """
+        self.stages = stages
+        self._queues = [queue.Queue(maxsize=max(1, queue_size)) for _ in stages]
+        self._lock = threading.Lock()
+
+        # Stage metrics, mapping from stage name to {"processed", "errors", "busy_seconds", "max_backlog"}
+        self.metrics: dict[str, dict] = {
+            name: {"processed": 0, "errors": 0, "busy_seconds": 0.0, "max_backlog": 0}
+            for name, _ in stages
+        }
+
+    def run(self, items: list):
+        """Feeds the items into the first stage and blocks until the last stage processed them all."""
+        _workers = [
+            threading.Thread(
+                target=self._work,
+                args=(index,),
+                name=f"pipeline_{name}",
+                daemon=True,
+            )
+            for index, (name, _) in enumerate(self.stages)
+        ]
+        for worker in _workers:
+            worker.start()
+
+        _start_time = time.time()
+        for item in items:
+            self._put(0, item)
+        self._queues[0].put(_STOP)
+        for worker in _workers:
+            worker.join()
+        bt.logging.info(
+            f"[PIPELINE] Processed {len(items)} items in {time.time() - _start_time:.2f}s: {self.get_summary()}"
+        )
+
+    def get_backlog(self) -> dict[str, int]:
+        """Returns the number of items waiting in front of each stage."""
+        return {
+            name: self._queues[index].qsize()
+            for index, (name, _) in enumerate(self.stages)
+        }
+
+    def get_summary(self) -> dict[str, dict]:
+        """Returns the metrics of each stage, with its throughput in items per busy second."""
+        with self._lock:
+            return {
+                name: {
+                    **_metrics,
+                    "throughput": (
+                        _metrics["processed"] / _metrics["busy_seconds"]
+                        if _metrics["busy_seconds"]
+                        else None
+                    ),
+                }
+                for name, _metrics in self.metrics.items()
+            }
+
+    def _put(self, index: int, item):
+        self._queues[index].put(item)
+        _name = self.stages[index][0]
+        with self._lock:
+            self.metrics[_name]["max_backlog"] = max(
+                self.metrics[_name]["max_backlog"], self._queues[index].qsize()
+            )
+
+    def _work(self, index: int):
+        _name, _handler = self.stages[index]
+        _is_last = index == len(self.stages) - 1
+        while True:
+            item = self._queues[index].get()
+            if item is _STOP:
+                if not _is_last:
+                    self._queues[index + 1].put(_STOP)
+                return
+
+            _start_time = time.time()
+            _failed = False
+            try:
+                _handler(item)
+            except Exception as e:
+                _failed = True
+                bt.logging.error(f"[PIPELINE] Stage {_name} failed: {e}")
+            with self._lock:
+                self.metrics[_name]["processed"] += 1
+                self.metrics[_name]["errors"] += int(_failed)
+                self.metrics[_name]["busy_seconds"] += time.time() - _start_time
+
+            if not _is_last:
+                self._put(index + 1, item)
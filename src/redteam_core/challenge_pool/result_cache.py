@@ -0,0 +1,59 @@
+from typing import Any
+import os
+
+from diskcache import Cache
+
+
+class ResultCache:
+    """
+    Persistent cache of solve and score results for deterministic challenges.
+
+    Solve results are keyed by (challenge image digest, miner image digest, input_hash) and
+    score results by (challenge image digest, input_hash, miner output digest), so resubmitted
+    miner images and replayed seed inputs are neither solved nor scored again. The least
+    recently used entries are evicted once the cache exceeds `size_limit` bytes.
+    """
+
+    def __init__(self, cache_dir: str, size_limit: int):
+        """
+        Args:
+            cache_dir: Directory of the cache
+            size_limit: Maximum size of the cache on disk (bytes)
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        self._cache = Cache(
+            cache_dir, size_limit=size_limit, eviction_policy="least-recently-used"
+        )
+
+        # Hit and miss counters, per result kind ("solve" or "score")
+        self.hits = {"solve": 0, "score": 0}
+        self.misses = {"solve": 0, "score": 0}
+
+    @staticmethod
+    def make_solve_key(
+        challenge_digest: str, miner_digest: str, input_hash: str
+    ) -> str:
+        return "|".join(["solve", challenge_digest, miner_digest, input_hash])
+
+    @staticmethod
+    def make_score_key(
+        challenge_digest: str, input_hash: str, output_digest: str
+    ) -> str:
+        return "|".join(["score", challenge_digest, input_hash, output_digest])
+
+    def get(self, key: str) -> Any:
+        """Returns the cached result, or None if it was not computed yet."""
+        _kind = key.split("|", 1)[0]
+        _value = self._cache.get(key, default=None)
+        if _value is None:
+            self.misses[_kind] += 1
+        else:
+            self.hits[_kind] += 1
+        return _value
+
+    def contains(self, key: str | None) -> bool:
+        """Whether the result is cached, without counting a hit or a miss."""
+        return key is not None and key in self._cache
+
+    def set(self, key: str, value: Any):
+        self._cache.set(key, value)
@@ -0,0 +1,82 @@
+from typing import Any
+import hashlib
+import json
+import os
+
+from diskcache import Cache
+
+
+class SimilarityCache:
+    """
+    Persistent cache of similarity results between two submissions.
+
+    Similarity only depends on the compared scripts, so results are keyed by
+    (challenge_type, hash(miner_script), hash(reference_script), endpoint) and reused
+    across epochs. Pairs with a missing script have no key and are never cached. Entries
+    expire after `ttl` seconds and the least recently used entries are evicted once the
+    cache exceeds `size_limit` bytes.
+    """
+
+    def __init__(self, cache_dir: str, ttl: int, size_limit: int):
+        """
+        Args:
+            cache_dir: Directory of the cache
+            ttl: Time to live of an entry (seconds)
+            size_limit: Maximum size of the cache on disk (bytes)
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        self.ttl = ttl
+        self._cache = Cache(
+            cache_dir, size_limit=size_limit, eviction_policy="least-recently-used"
+        )
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def hash_script(script: Any) -> str:
+        """Hashes a script (or any JSON serializable submission content) canonically."""
+        return hashlib.sha256(
+            json.dumps(script, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
+    def make_key(
+        self,
+        challenge_type: str,
+        endpoint: str,
+        miner_script: Any,
+        reference_script: Any,
+    ) -> str | None:
+        """Returns the key of the compared pair, None if either script is missing."""
+        if miner_script is None or reference_script is None:
+            return None
+        return "|".join(
+            [
+                str(challenge_type),
+                self.hash_script(miner_script),
+                self.hash_script(reference_script),
+                endpoint,
+            ]
+        )
+
+    def get(self, key: str) -> Any:
+        """Returns the cached result, or None if the pair was not compared yet."""
+        if key is None:
+            return None
+        _value = self._cache.get(key, default=None)
+        if _value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return _value
+
+    def set(self, key: str | None, value: Any, ttl: int | None = None):
+        """
+        Args:
+            key: Key of the compared pair, nothing is cached if None
+            value: Similarity result
+            ttl: Time to live of the entry (seconds), the cache's `ttl` by default
+        """
+        if key is None:
+            return
+        self._cache.set(key, value, expire=ttl or self.ttl)
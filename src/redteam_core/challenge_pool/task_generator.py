@@ -0,0 +1,152 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+import os
+import threading
+
+import bittensor as bt
+from diskcache import Cache
+
+
+class TaskGenerator:
+    """
+    Generates challenge tasks with a bounded number of in-flight requests to the challenge
+    container, and keeps a persisted pool of tasks pre-generated for the next runs.
+
+    Pooled tasks are stored under a key prefix (e.g. the challenge container configuration hash),
+    so tasks generated by another challenge version are never served. They expire after `ttl`
+    seconds.
+    """
+
+    def __init__(
+        self,
+        fetch_task: Callable[..., dict],
+        cache_dir: str,
+        pool_key: str,
+        max_concurrency: int = 4,
+        ttl: int | None = None,
+    ):
+        """
+        Args:
+            fetch_task: Function requesting a single task from the challenge container. The
+                background fill passes it a `stop_event` keyword argument, set when the fill is
+                stopped, so that it gives up retrying
+            cache_dir: Directory of the persisted task pool
+            pool_key: Key prefix of the pooled tasks
+            max_concurrency: Maximum number of in-flight task requests
+            ttl: Time to live of a pooled task (seconds), never expires if None
+        """
+        self.fetch_task = fetch_task
+        self.pool_key = pool_key
+        self.max_concurrency = max(1, max_concurrency)
+        self.ttl = ttl
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self._pool = Cache(cache_dir)
+        self._stop_event = threading.Event()
+        self._prefill_thread: threading.Thread | None = None
+
+    def generate(self, num_tasks: int) -> list[dict]:
+        """
+        Returns `num_tasks` tasks, taking pre-generated tasks from the pool first and
+        requesting the rest concurrently. Raises if a task request fails.
+        """
+        tasks = []
+        while len(tasks) < num_tasks:
+            _, _task = self._pool.pull(prefix=self.pool_key)
+            if _task is None:
+                break
+            tasks.append(_task)
+        if tasks:
+            bt.logging.info(f"[TASK GENERATOR] Took {len(tasks)} tasks from the pool")
+
+        _remaining_tasks = num_tasks - len(tasks)
+        if _remaining_tasks > 0:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_concurrency, _remaining_tasks),
+                thread_name_prefix="task_generator",
+            ) as executor:
+                tasks.extend(
+                    executor.map(lambda _: self.fetch_task(), range(_remaining_tasks))
+                )
+        return tasks
+
+    def pool_size(self) -> int:
+        """Returns the number of pooled tasks that are not expired."""
+        self._pool.expire()
+        return sum(
+            1
+            for key in self._pool.iterkeys()
+            if isinstance(key, str) and key.startswith(f"{self.pool_key}-")
+        )
+
+    def start_prefill(self, target_size: int, max_concurrency: int = 1):
+        """
+        Starts filling the pool up to `target_size` tasks in a background thread.
+
+        Args:
+            target_size: Number of pooled tasks to reach
+            max_concurrency: Maximum number of in-flight task requests of the background fill,
+                kept low so that it does not slow down the running challenge
+        """
+        _missing_tasks = target_size - self.pool_size()
+        if _missing_tasks <= 0:
+            return
+
+        self._stop_event.clear()
+        self._prefill_thread = threading.Thread(
+            target=self._prefill,
+            args=(_missing_tasks, max(1, max_concurrency)),
+            name="task_prefill",
+            daemon=True,
+        )
+        self._prefill_thread.start()
+
+    def stop_prefill(self, timeout: float | None = None):
+        """
+        Stops the background fill and waits for it to finish its in-flight requests, so that
+        the challenge container is not requested anymore once it returns.
+
+        Args:
+            timeout: Time after which a warning is logged if the fill is still running (seconds)
+        """
+        self._stop_event.set()
+        if self._prefill_thread:
+            self._prefill_thread.join(timeout=timeout)
+            if self._prefill_thread.is_alive():
+                bt.logging.warning(
+                    "[TASK GENERATOR] Waiting for in-flight task requests of the background fill"
+                )
+                self._prefill_thread.join()
+            self._prefill_thread = None
+
+    def _prefill(self, num_tasks: int, max_concurrency: int):
+        _lock = threading.Lock()
+        _pooled_tasks = 0
+
+        def _fetch_and_push(_):
+            nonlocal _pooled_tasks
+            if self._stop_event.is_set():
+                return
+            try:
+                _task = self.fetch_task(stop_event=self._stop_event)
+            except Exception as e:
+                if not self._stop_event.is_set():
+                    bt.logging.warning(
+                        f"[TASK GENERATOR] Failed to pre-generate task: {e}"
+                    )
+                return
+            # Tasks fetched while stopping may come from a container being removed
+            if self._stop_event.is_set():
+                return
+            self._pool.push(_task, prefix=self.pool_key, expire=self.ttl)
+            with _lock:
+                _pooled_tasks += 1
+
+        with ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="task_prefill"
+        ) as executor:
+            list(executor.map(_fetch_and_push, range(num_tasks)))
+
+        bt.logging.info(
+            f"[TASK GENERATOR] Pre-generated {_pooled_tasks}/{num_tasks} tasks"
+        )
@@ -1,4 +1,5 @@
 import datetime
+import os
 from pydantic import Field, model_validator, AnyHttpUrl
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing_extensions import Self
@@ -57,6 +58,49 @@ class MainConfig(BaseSettings):
         le=65535,
     )
 
+    CACHE_DIR: str = Field(
+        default=os.path.join(os.path.expanduser("~"), ".cache", "redteam"),
+        description="Directory for local caches used by the controller",
+    )
+    IMAGE_CACHE_MAX_BYTES: int = Field(
+        default=100 * 1024**3,
+        description="Disk budget for cached miner images (bytes)",
+        ge=0,
+    )
+    SIMILARITY_CACHE_TTL: int = Field(
+        default=3600 * 24 * 30,
+        description="Time to live of cached similarity results (seconds)",
+        ge=1,
+    )
+    SIMILARITY_BASELINE_CACHE_TTL: int = Field(
+        default=3600,
+        description="Time to live of cached similarity results against the baseline scripts (seconds)",
+        ge=1,
+    )
+    SIMILARITY_CACHE_MAX_BYTES: int = Field(
+        default=1024**3,
+        description="Disk budget for cached similarity results (bytes)",
+        ge=0,
+    )
+    RESULT_CACHE_MAX_BYTES: int = Field(
+        default=1024**3,
+        description="Disk budget for cached solve and score results of deterministic challenges (bytes)",
+        ge=0,
+    )
+
+    TRACING_ENABLED: bool = Field(
+        default=True, description="Flag to enable timing spans of the validator run"
+    )
+    TRACE_FILE: str = Field(
+        default="",
+        description="JSON lines file the timing spans are exported to, defaults to <CACHE_DIR>/traces/spans.jsonl",
+    )
+    TRACE_FILE_MAX_BYTES: int = Field(
+        default=64 * 1024**2,
+        description="Size the timing spans file is rotated at, keeping one backup (bytes), never rotated if 0",
+        ge=0,
+    )
+
     COMMIT_COOLDOWN: int = Field(
         default=3600 * 24,
         description="Time interval for commit cooldown(seconds)",
@@ -73,6 +117,18 @@ class MainConfig(BaseSettings):
         default=60, description="Timeout for queries in seconds", ge=1
     )
 
+    STATE_SNAPSHOT_INTERVAL: int = Field(
+        default=12,
+        description="Number of validator state deltas written between two full validator state snapshots",
+        ge=0,
+    )
+
+    STATE_SNAPSHOT_RETENTION: int = Field(
+        default=48,
+        description="Number of full validator states kept in local cache per validator hotkey",
+        ge=1,
+    )
+
     STORAGE_API_URL: AnyHttpUrl = Field(
         default=AnyHttpUrl("https://storage-api.theredteam.io"),
         description="Full URL for storing miners' work (auto-generated)",
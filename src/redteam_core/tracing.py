@@ -0,0 +1,176 @@
+from contextlib import contextmanager
+from typing import Callable, Iterator
+import functools
+import json
+import os
+import threading
+import time
+import uuid
+
+import bittensor as bt
+
+from redteam_core.config import constants
+
+
+class Tracer:
+    """
+    Records span-style timers of the validator run.
+
+    Spans are nested per thread and inherit the tags of their parent span (e.g. challenge name,
+    miner UID and image digest). Finished spans are appended to a JSON lines file and aggregated
+    into an in-process summary per span name, so timings are available offline. The file is
+    rotated to `<export_path>.1` once it exceeds `max_bytes`, keeping a single backup.
+    """
+
+    def __init__(
+        self,
+        export_path: str | None = None,
+        enabled: bool = True,
+        max_bytes: int = 0,
+    ):
+        """
+        Args:
+            export_path: JSON lines file finished spans are appended to, no file export if None
+            enabled: Whether spans are recorded at all
+            max_bytes: Size of the export file it is rotated at, never rotated if 0
+        """
+        self.enabled = enabled
+        self.export_path = export_path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._export_file = None
+        self._export_file_path = None
+
+        # Span summary, mapping from span name to {"count", "errors", "total_seconds", "max_seconds"}
+        self._summary: dict[str, dict] = {}
+
+    @contextmanager
+    def span(self, name: str, **tags) -> Iterator[dict]:
+        """
+        Times the enclosed block as a span.
+
+        Args:
+            name: Span name, e.g. "controller.solve"
+            **tags: Span tags, merged with the tags of the parent span
+
+        Yields:
+            dict: Tags of the span, can be extended inside the block
+        """
+        if not self.enabled:
+            yield dict(tags)
+            return
+
+        _stack = self._get_stack()
+        _parent = _stack[-1] if _stack else None
+        _span = {
+            "name": name,
+            "span_id": uuid.uuid4().hex[:16],
+            "parent_id": _parent["span_id"] if _parent else None,
+            "tags": {**(_parent["tags"] if _parent else {}), **tags},
+            "thread": threading.current_thread().name,
+        }
+        _stack.append(_span)
+        _start_time = time.time()
+        _start_perf_counter = time.perf_counter()
+        _error = None
+        try:
+            yield _span["tags"]
+        except BaseException as e:
+            _error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            _stack.pop()
+            _span["start_time"] = _start_time
+            _span["duration"] = time.perf_counter() - _start_perf_counter
+            _span["error"] = _error
+            self._record(_span)
+
+    def traced(self, name: str | None = None, **tags) -> Callable:
+        """Decorator timing every call of the function as a span, named after the function by default."""
+
+        def decorator(func: Callable) -> Callable:
+            _name = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(_name, **tags):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def get_summary(self) -> dict[str, dict]:
+        """
+        Returns the aggregated timings of every span name.
+
+        Returns:
+            dict[str, dict]: Mapping from span name to its count, error count, total, mean
+                and max duration (seconds), sorted by total duration
+        """
+        with self._lock:
+            return {
+                name: {
+                    **_stats,
+                    "mean_seconds": _stats["total_seconds"] / _stats["count"],
+                }
+                for name, _stats in sorted(
+                    self._summary.items(),
+                    key=lambda item: item[1]["total_seconds"],
+                    reverse=True,
+                )
+            }
+
+    def reset_summary(self):
+        with self._lock:
+            self._summary = {}
+
+    def _get_stack(self) -> list[dict]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def _record(self, span: dict):
+        with self._lock:
+            _stats = self._summary.setdefault(
+                span["name"],
+                {"count": 0, "errors": 0, "total_seconds": 0.0, "max_seconds": 0.0},
+            )
+            _stats["count"] += 1
+            _stats["errors"] += int(span["error"] is not None)
+            _stats["total_seconds"] += span["duration"]
+            _stats["max_seconds"] = max(_stats["max_seconds"], span["duration"])
+
+            if not self.export_path:
+                return
+            try:
+                if self._export_file_path != self.export_path:
+                    self._close_export_file()
+                if self._export_file is None:
+                    os.makedirs(os.path.dirname(self.export_path), exist_ok=True)
+                    self._export_file = open(self.export_path, "a", buffering=1)
+                    self._export_file_path = self.export_path
+                self._export_file.write(json.dumps(span, default=str) + "\n")
+                if self.max_bytes and self._export_file.tell() >= self.max_bytes:
+                    self._close_export_file()
+                    os.replace(self.export_path, f"{self.export_path}.1")
+            except OSError as e:
+                bt.logging.warning(f"[TRACING] Failed to export span: {e}")
+                self.export_path = None
+
+    def _close_export_file(self):
+        if self._export_file is not None:
+            self._export_file.close()
+        self._export_file = None
+        self._export_file_path = None
+
+
+tracer = Tracer(
+    export_path=constants.TRACE_FILE
+    or os.path.join(constants.CACHE_DIR, "traces", "spans.jsonl"),
+    enabled=constants.TRACING_ENABLED,
+    max_bytes=constants.TRACE_FILE_MAX_BYTES,
+)
+span = tracer.span
+traced = tracer.traced
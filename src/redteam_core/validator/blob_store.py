@@ -0,0 +1,56 @@
+import hashlib
+import json
+import threading
+
+
+class BlobStore:
+    """
+    Content-addressed store of the payloads referenced by comparison logs (miner inputs, miner
+    and reference outputs), keyed by their SHA256 content hash.
+
+    Payloads with the same content are interned to a single shared object, so a script compared
+    against every reference, or a reference script compared against every miner, is held once
+    per run however many logs reference it. Interned payloads must not be modified in place.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._blobs: dict[str, dict] = {}
+
+    @staticmethod
+    def hash_payload(payload: dict) -> str:
+        return hashlib.sha256(
+            json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
+    def intern(self, payload: dict | None) -> tuple[str | None, dict | None]:
+        """
+        Stores the payload unless a payload with the same content is already stored.
+
+        Args:
+            payload: Payload to intern
+
+        Returns:
+            tuple[str | None, dict | None]: Content hash and shared payload, (None, None) if
+                the payload is None
+        """
+        if payload is None:
+            return None, None
+
+        _hash = self.hash_payload(payload)
+        with self._lock:
+            return _hash, self._blobs.setdefault(_hash, payload)
+
+    def get(self, content_hash: str) -> dict | None:
+        with self._lock:
+            return self._blobs.get(content_hash, None)
+
+    def __contains__(self, content_hash: str) -> bool:
+        return content_hash in self._blobs
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+    def clear(self):
+        with self._lock:
+            self._blobs = {}
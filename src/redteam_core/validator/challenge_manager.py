@@ -1,9 +1,13 @@
 from abc import abstractmethod
+import functools
 import heapq
 
 import bittensor as bt
+import numpy as np
 
 from redteam_core.validator.models import MinerChallengeCommit, MinerChallengeInfo
+from redteam_core.validator.miner_state_store import MinerStateStore
+from redteam_core.tracing import traced
 
 
 class ChallengeManager:
@@ -33,7 +37,48 @@ class ChallengeManager:
 
         # Miner states, mapping from uid to miner state
         self.miner_states: dict[int, MinerChallengeInfo] = {}
+        # Columnar copy of the scoring fields of the miner states, indexed by uid, with the
+        # uids whose row is out of date
+        self.state_store = MinerStateStore()
+        self._stale_uids: set[int] = set()
+
+        # Changes since the last exported state, written by `export_state_delta`
+        self._dirty_uids: set[int] = set()
+        self._removed_uids: set[int] = set()
+        self._exported_scored_docker_hub_ids: set[str] = set()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Scoring changes the miner states of the scored commits, so every implementation of
+        # `update_miner_scores` marks them as changed, whoever calls it
+        if "update_miner_scores" in cls.__dict__:
+            cls.update_miner_scores = _marks_scored_commits(
+                cls.__dict__["update_miner_scores"]
+            )
+
+    def mark_dirty(self, uids):
+        """
+        Marks miner states as changed, so that they are included in the next state delta and
+        their state store row is refreshed before the next read. Changes made to
+        `miner_states` outside `update_miner_infos` and `update_miner_scores` must be marked.
+
+        Args:
+            uids (Iterable[int]): UIDs of the changed miner states
+        """
+        _uids = set(uids)
+        self._dirty_uids.update(_uids)
+        self._stale_uids.update(_uids)
+
+    def _refresh_state_store(self):
+        """Rewrites the state store rows of the stale uids from their miner states."""
+        for uid in self._stale_uids:
+            if uid in self.miner_states:
+                self.state_store.update(uid, self.miner_states[uid])
+            else:
+                self.state_store.remove(uid)
+        self._stale_uids = set()
 
+    @traced("challenge_manager.update_miner_infos")
     def update_miner_infos(
         self, miner_commits: list[MinerChallengeCommit]
     ) -> list[MinerChallengeCommit]:
@@ -47,6 +92,7 @@ class ChallengeManager:
         Returns:
             list[MinerChallengeCommit]: A list of miner commits that are updated for the challenge.
         """
+        self.mark_dirty(miner_commit.miner_uid for miner_commit in miner_commits)
         for miner_commit in miner_commits:
             current_miner_state: MinerChallengeInfo = self.miner_states.setdefault(
                 miner_commit.miner_uid,
@@ -84,6 +130,7 @@ class ChallengeManager:
             current_miner_state.latest_commit = miner_commit
 
         # Remove miners not in metagraph using dict comprehension
+        _previous_uids = set(self.miner_states)
         self.miner_states = {
             miner_uid: miner_state
             for miner_uid, miner_state in self.miner_states.items()
@@ -93,6 +140,9 @@ class ChallengeManager:
                 and self.metagraph.hotkeys[miner_uid] == miner_state.miner_hotkey
             )
         }
+        _removed_uids = _previous_uids - set(self.miner_states)
+        self._removed_uids.update(_removed_uids)
+        self._stale_uids.update(_removed_uids)
 
     def _try_add_unique_commit(
         self, encrypted_commit: str, score: float, docker_hub_id: str
@@ -132,34 +182,12 @@ class ChallengeManager:
         """
         Exports the current state of the ChallengeManager to a serializable dictionary.
         Only exports dynamic state that needs to be preserved between sessions.
+        Exporting the state view resets the changes tracked for `export_state_delta`.
 
         Returns:
             dict: A dictionary containing the serialized state
         """
 
-        def _serialize_miner_state(miner_state: MinerChallengeInfo) -> dict:
-            if public_view:
-                return miner_state.public_view().model_dump()
-
-            state_data = miner_state.model_dump(
-                exclude={"latest_commit", "best_commit"}
-            )
-            if miner_state.latest_commit:
-                state_data["latest_commit"] = (
-                    miner_state.latest_commit.state_view().model_dump()
-                )
-            else:
-                state_data["latest_commit"] = None
-
-            if miner_state.best_commit:
-                state_data["best_commit"] = (
-                    miner_state.best_commit.state_view().model_dump()
-                )
-            else:
-                state_data["best_commit"] = None
-
-            return state_data
-
         state = {
             "unique_commits": [
                 {
@@ -171,16 +199,96 @@ class ChallengeManager:
             ],
             "unique_scored_docker_hub_ids": list(self._unique_scored_docker_hub_ids),
             "miner_states": {
-                str(uid): _serialize_miner_state(miner_state)
+                str(uid): (
+                    miner_state.public_view()
+                    if public_view
+                    else miner_state.state_view()
+                ).model_dump()
                 for uid, miner_state in self.miner_states.items()
             },
         }
+        if not public_view:
+            self._reset_dirty()
 
         return state
 
+    def export_state_delta(self) -> dict:
+        """
+        Exports the changes since the last exported state: the miner states marked dirty, the
+        uids removed and the scored docker_hub_ids added. The unique commits are small and
+        exported in full. Replaying the delta on the last exported state with
+        `apply_state_delta` gives the current state.
+
+        Returns:
+            dict: A dictionary containing the serialized state delta
+        """
+        delta = {
+            "unique_commits": [
+                {
+                    "score": float(score),
+                    "commit": commit,
+                    "docker_hub_id": docker_hub_id,
+                }
+                for score, commit, docker_hub_id in self._unique_commits_heap
+            ],
+            "added_scored_docker_hub_ids": list(
+                self._unique_scored_docker_hub_ids
+                - self._exported_scored_docker_hub_ids
+            ),
+            "miner_states": {
+                str(uid): self.miner_states[uid].state_view().model_dump()
+                for uid in self._dirty_uids
+                if uid in self.miner_states
+            },
+            "removed_uids": [
+                str(uid) for uid in self._removed_uids if uid not in self.miner_states
+            ],
+        }
+        self._reset_dirty()
+
+        return delta
+
+    def _reset_dirty(self):
+        self._dirty_uids = set()
+        self._removed_uids = set()
+        self._exported_scored_docker_hub_ids = set(self._unique_scored_docker_hub_ids)
+
+    @staticmethod
+    def apply_state_delta(state: dict, delta: dict) -> dict:
+        """
+        Replays a state delta on a serialized state.
+
+        Args:
+            state (dict): The serialized state the delta was exported against
+            delta (dict): The serialized state delta
+
+        Returns:
+            dict: A new serialized state with the delta applied
+        """
+        _miner_states = dict(state["miner_states"])
+        for uid in delta["removed_uids"]:
+            _miner_states.pop(uid, None)
+        _miner_states.update(delta["miner_states"])
+
+        return {
+            **state,
+            "unique_commits": delta["unique_commits"],
+            "unique_scored_docker_hub_ids": list(
+                dict.fromkeys(
+                    state.get("unique_scored_docker_hub_ids", [])
+                    + delta["added_scored_docker_hub_ids"]
+                )
+            ),
+            "miner_states": _miner_states,
+        }
+
     @classmethod
     def load_state(
-        cls, state: dict, challenge_info: dict, metagraph: bt.Metagraph
+        cls,
+        state: dict,
+        challenge_info: dict,
+        metagraph: bt.Metagraph,
+        deltas: list[dict] | None = None,
     ) -> "ChallengeManager":
         """
         Creates a new ChallengeManager instance from a serialized state.
@@ -189,11 +297,14 @@ class ChallengeManager:
             state (dict): The serialized state dictionary
             challenge_info (dict): The challenge configuration info
             metagraph (bt.Metagraph): The Bittensor metagraph
+            deltas (list[dict] | None): State deltas exported after the state, replayed in order
 
         Returns:
             ChallengeManager: A new instance with the loaded state
         """
         instance = cls(challenge_info, metagraph)
+        for delta in deltas or []:
+            state = cls.apply_state_delta(state, delta)
 
         # Restore unique commits
         instance._unique_commits_heap = [
@@ -218,13 +329,41 @@ class ChallengeManager:
             int(uid): MinerChallengeInfo.model_validate(miner_state_data)
             for uid, miner_state_data in state["miner_states"].items()
         }
+        instance._stale_uids = set(instance.miner_states)
+        instance._reset_dirty()
 
         return instance
 
     @abstractmethod
     def update_miner_scores(self, miner_commits: list[MinerChallengeCommit]):
-        """Update miners 's latest submission scores and penalties."""
+        """
+        Update miners 's latest submission scores and penalties. The miner states of the
+        commits are marked as changed once it returns.
+        """
 
-    @abstractmethod
-    def get_challenge_scores(self):
-        pass
+    def get_challenge_scores(self) -> np.ndarray:
+        """
+        Returns the accepted best commit scores of the miners, read from the state store.
+
+        Returns:
+            np.ndarray: Best commit scores indexed by uid, 0 for uids without an accepted one
+        """
+        self._refresh_state_store()
+        return self.state_store.get_best_scores(len(self.metagraph.hotkeys))
+
+
+def _marks_scored_commits(update_miner_scores):
+    """Wraps an `update_miner_scores` implementation to mark the scored miner states as changed."""
+    if getattr(update_miner_scores, "_marks_scored_commits", False):
+        return update_miner_scores
+
+    @traced("challenge_manager.update_miner_scores")
+    @functools.wraps(update_miner_scores)
+    def wrapper(self, miner_commits: list[MinerChallengeCommit], *args, **kwargs):
+        try:
+            return update_miner_scores(self, miner_commits, *args, **kwargs)
+        finally:
+            self.mark_dirty(miner_commit.miner_uid for miner_commit in miner_commits)
+
+    wrapper._marks_scored_commits = True
+    return wrapper
@@ -6,6 +6,7 @@ import bittensor as bt
 
 from redteam_core.config import constants
 from redteam_core.validator.challenge_manager import ChallengeManager
+from redteam_core.tracing import traced
 
 
 class MinerManager:
@@ -21,6 +22,7 @@ class MinerManager:
         self.challenge_managers = challenge_managers
         self.weights_to_redistribute = 0.0
 
+    @traced("miner_manager.update_challenge_managers")
     def update_challenge_managers(
         self, challenge_managers: dict[str, ChallengeManager]
     ):
@@ -174,6 +176,7 @@ class MinerManager:
 
         return _normalized_scores
 
+    @traced("miner_manager.get_onchain_scores")
     def get_onchain_scores(self, n_uids: int, docker_usernames: dict) -> np.ndarray:
         """
         Returns a numpy array of weighted scores combining:
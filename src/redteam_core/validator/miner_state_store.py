@@ -0,0 +1,183 @@
+from typing import Optional
+
+import numpy as np
+
+from redteam_core.validator.models import MinerChallengeCommit, MinerChallengeInfo
+
+
+class StringTable:
+    """
+    Interned strings addressed by integer ids, so that hotkeys and docker hub ids repeated
+    across rows and challenges are held once. The id of None is -1.
+    """
+
+    __slots__ = ("_ids", "_strings")
+
+    def __init__(self):
+        self._ids: dict[str, int] = {}
+        self._strings: list[str] = []
+
+    def intern(self, value: Optional[str]) -> int:
+        if value is None:
+            return -1
+
+        _id = self._ids.get(value)
+        if _id is None:
+            _id = len(self._strings)
+            self._ids[value] = _id
+            self._strings.append(value)
+        return _id
+
+    def get(self, string_id: int) -> Optional[str]:
+        if string_id < 0:
+            return None
+        return self._strings[string_id]
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+
+class MinerStateStore:
+    """
+    Columnar copy of the fields of a challenge's miner states that scoring reads, with one row
+    per uid: the best commit's score, penalty and accepted flag, the latest commit's score and
+    the timestamps, plus the hotkey and docker hub ids in a `StringTable`.
+
+    Rows without a miner state, or without a commit, hold NaN scores and timestamps, so the
+    challenge scores of all uids are a single vectorized read. The pydantic miner states stay
+    the source of truth for the commits and their logs, which are only dumped when the state is
+    persisted or published.
+    """
+
+    __slots__ = (
+        "strings",
+        "present",
+        "hotkey_ids",
+        "best_docker_hub_ids",
+        "best_scores",
+        "best_penalties",
+        "best_accepted",
+        "best_commit_timestamps",
+        "best_scored_timestamps",
+        "latest_scores",
+        "latest_scored_timestamps",
+    )
+
+    # Columns with their dtype and the value of rows without data
+    _COLUMNS = {
+        "present": (np.bool_, False),
+        "hotkey_ids": (np.int32, -1),
+        "best_docker_hub_ids": (np.int32, -1),
+        "best_scores": (np.float64, np.nan),
+        "best_penalties": (np.float64, np.nan),
+        "best_accepted": (np.bool_, False),
+        "best_commit_timestamps": (np.float64, np.nan),
+        "best_scored_timestamps": (np.float64, np.nan),
+        "latest_scores": (np.float64, np.nan),
+        "latest_scored_timestamps": (np.float64, np.nan),
+    }
+
+    def __init__(self, capacity: int = 256, strings: Optional[StringTable] = None):
+        """
+        Args:
+            capacity: Initial number of rows, grown to fit the highest uid
+            strings: String table to share with other stores, a new one by default
+        """
+        self.strings = strings if strings is not None else StringTable()
+        for name, (dtype, empty) in self._COLUMNS.items():
+            setattr(self, name, np.full(capacity, empty, dtype=dtype))
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.present))
+
+    @property
+    def capacity(self) -> int:
+        return len(self.present)
+
+    def _ensure_capacity(self, uid: int):
+        if uid < self.capacity:
+            return
+
+        _capacity = max(uid + 1, self.capacity * 2)
+        for name, (dtype, empty) in self._COLUMNS.items():
+            _column = np.full(_capacity, empty, dtype=dtype)
+            _old_column = getattr(self, name)
+            _column[: len(_old_column)] = _old_column
+            setattr(self, name, _column)
+
+    def update(self, uid: int, miner_state: MinerChallengeInfo):
+        """
+        Writes the row of a uid from its miner state.
+
+        Args:
+            uid: Miner's UID
+            miner_state: Current state of the miner
+        """
+        self._ensure_capacity(uid)
+        _best_commit: Optional[MinerChallengeCommit] = miner_state.best_commit
+        _latest_commit: Optional[MinerChallengeCommit] = miner_state.latest_commit
+
+        self.present[uid] = True
+        self.hotkey_ids[uid] = self.strings.intern(miner_state.miner_hotkey)
+        if _best_commit is not None:
+            self.best_docker_hub_ids[uid] = self.strings.intern(
+                _best_commit.docker_hub_id
+            )
+            self.best_scores[uid] = _to_float(_best_commit.score)
+            self.best_penalties[uid] = _to_float(_best_commit.penalty)
+            self.best_accepted[uid] = bool(_best_commit.accepted)
+            self.best_commit_timestamps[uid] = _to_float(_best_commit.commit_timestamp)
+            self.best_scored_timestamps[uid] = _to_float(_best_commit.scored_timestamp)
+        else:
+            self._clear_columns(uid, keep=("present", "hotkey_ids"))
+
+        if _latest_commit is not None:
+            self.latest_scores[uid] = _to_float(_latest_commit.score)
+            self.latest_scored_timestamps[uid] = _to_float(
+                _latest_commit.scored_timestamp
+            )
+        else:
+            self.latest_scores[uid] = np.nan
+            self.latest_scored_timestamps[uid] = np.nan
+
+    def remove(self, uid: int):
+        if uid < self.capacity:
+            self._clear_columns(uid)
+
+    def _clear_columns(self, uid: int, keep: tuple[str, ...] = ()):
+        for name, (_, empty) in self._COLUMNS.items():
+            if name not in keep:
+                getattr(self, name)[uid] = empty
+
+    def get_hotkey(self, uid: int) -> Optional[str]:
+        if uid >= self.capacity:
+            return None
+        return self.strings.get(int(self.hotkey_ids[uid]))
+
+    def get_best_docker_hub_id(self, uid: int) -> Optional[str]:
+        if uid >= self.capacity:
+            return None
+        return self.strings.get(int(self.best_docker_hub_ids[uid]))
+
+    def get_best_scores(self, n_uids: int, accepted_only: bool = True) -> np.ndarray:
+        """
+        Reads the best commit scores of the first `n_uids` uids.
+
+        Args:
+            n_uids: Number of UIDs in the network
+            accepted_only: Score uids whose best commit is not accepted as 0
+
+        Returns:
+            np.ndarray: Best commit scores, 0 for uids without a scored best commit
+        """
+        _scores = np.zeros(n_uids, dtype=np.float64)
+        _rows = min(n_uids, self.capacity)
+        _best_scores = np.nan_to_num(self.best_scores[:_rows], nan=0.0)
+        if accepted_only:
+            _best_scores = np.where(self.best_accepted[:_rows], _best_scores, 0.0)
+        _scores[:_rows] = _best_scores
+        return _scores
+
+
+def _to_float(value: Optional[float]) -> float:
+    return np.nan if value is None else float(value)
@@ -1,11 +1,51 @@
-from typing import Optional, Any
+from typing import ClassVar, Optional, Any
+import copy
 import hashlib
 import json
 
 from pydantic import BaseModel
 
+from redteam_core.validator.blob_store import BlobStore
 
-class ScoringLog(BaseModel):
+
+class ViewModel(BaseModel):
+    """
+    Base of the models with a public and a state view.
+
+    A view is a copy of the model with the fields of `view_excluded_fields` set to None, built
+    without validating or hashing anything again. The lists and dicts it keeps are copied, so
+    that changing a view never changes the model it was built from.
+    """
+
+    # Fields set to None by each view
+    view_excluded_fields: ClassVar[dict[str, tuple[str, ...]]] = {
+        "public": (),
+        "state": (),
+    }
+
+    def public_view(self):
+        return self._make_view("public")
+
+    def state_view(self):
+        return self._make_view("state")
+
+    def _make_view(self, view: str, update: Optional[dict] = None):
+        """
+        Args:
+            view: Name of the view in `view_excluded_fields`
+            update: Fields of the view built by the caller, used as they are
+        """
+        _update = dict.fromkeys(self.view_excluded_fields[view])
+        _update.update(update or {})
+        for name in type(self).model_fields:
+            if name not in _update:
+                _value = getattr(self, name)
+                if isinstance(_value, (dict, list)):
+                    _update[name] = copy.deepcopy(_value)
+        return self.model_copy(update=_update)
+
+
+class ScoringLog(ViewModel):
     score: Optional[float] = None
     miner_input: Optional[dict] = None
     miner_output: Optional[dict] = None
@@ -13,39 +53,31 @@ class ScoringLog(BaseModel):
     error: Optional[str] = None
     baseline_score: Optional[float] = None
     input_hash: Optional[str] = None
+    solve_duration: Optional[float] = None
+    queue_delay: Optional[float] = None
+
+    view_excluded_fields = {
+        "public": ("miner_input", "miner_output", "input_hash"),
+        "state": ("miner_input", "miner_output", "validation_output"),
+    }
 
     def model_post_init(self, __context: Any):
-        if self.miner_input:
+        # Hashed once, views and loaded states carry the hash over
+        if self.input_hash is None and self.miner_input:
             self.input_hash = hashlib.sha256(
                 json.dumps(self.miner_input).encode("utf-8")
             ).hexdigest()
-        else:
-            self.input_hash = None
 
-    def public_view(self) -> "ScoringLog":
-        return ScoringLog(
-            score=self.score,
-            miner_input=None,
-            miner_output=None,
-            validation_output=self.validation_output,
-            error=self.error,
-            baseline_score=self.baseline_score,
-            input_hash=None,
-        )
 
-    def state_view(self) -> "ScoringLog":
-        return ScoringLog(
-            score=self.score,
-            miner_input=None,
-            miner_output=None,
-            validation_output=None,
-            error=self.error,
-            baseline_score=self.baseline_score,
-            input_hash=self.input_hash,
-        )
+class ComparisonLog(ViewModel):
+    """
+    Result of comparing a miner's output with a reference output.
 
+    The input and output payloads are referenced by content hash, and logs created with
+    `from_payloads` share the interned payload objects of a `BlobStore`. The payloads are
+    expanded by a full `model_dump` and omitted by the public and state views.
+    """
 
-class ComparisonLog(BaseModel):
     similarity_score: Optional[float] = None
     miner_input: Optional[dict] = None
     miner_output: Optional[dict] = None
@@ -57,41 +89,71 @@ class ComparisonLog(BaseModel):
     reference_hotkey: Optional[str] = None
     reference_similarity_score: Optional[float] = None
 
+    miner_output_hash: Optional[str] = None
+    reference_output_hash: Optional[str] = None
+
+    view_excluded_fields = {
+        "public": (
+            "miner_input",
+            "miner_output",
+            "reference_output",
+            "input_hash",
+            "miner_output_hash",
+            "reference_output_hash",
+        ),
+        "state": ("miner_input", "miner_output", "reference_output"),
+    }
+
     def model_post_init(self, __context: Any):
-        if self.miner_input:
+        # Hashed once, views and loaded states carry the hashes over
+        if self.input_hash is None and self.miner_input:
             self.input_hash = hashlib.sha256(
                 json.dumps(self.miner_input).encode("utf-8")
             ).hexdigest()
-        else:
-            self.input_hash = None
-
-    def public_view(self) -> "ComparisonLog":
-        return ComparisonLog(
-            similarity_score=self.similarity_score,
-            miner_input=None,
-            miner_output=None,
-            reference_output=None,
-            reason=self.reason,
-            error=self.error,
-            reference_hotkey=self.reference_hotkey,
-            reference_similarity_score=self.reference_similarity_score,
-        )
+        if self.miner_output is not None and self.miner_output_hash is None:
+            self.miner_output_hash = BlobStore.hash_payload(self.miner_output)
+        if self.reference_output is not None and self.reference_output_hash is None:
+            self.reference_output_hash = BlobStore.hash_payload(self.reference_output)
+
+    @classmethod
+    def from_payloads(
+        cls,
+        blob_store: BlobStore,
+        miner_input: Optional[dict] = None,
+        miner_output: Optional[dict] = None,
+        reference_output: Optional[dict] = None,
+        **kwargs,
+    ) -> "ComparisonLog":
+        """
+        Creates a comparison log referencing the interned payloads of `blob_store` instead of
+        holding its own copies.
 
-    def state_view(self) -> "ComparisonLog":
-        return ComparisonLog(
-            similarity_score=self.similarity_score,
-            miner_input=None,
-            miner_output=None,
-            reference_output=None,
-            reason=self.reason,
-            error=self.error,
-            input_hash=self.input_hash,
-            reference_hotkey=self.reference_hotkey,
-            reference_similarity_score=self.reference_similarity_score,
+        Args:
+            blob_store: Blob store of the run
+            miner_input: Input used for both outputs
+            miner_output: Output of the compared miner
+            reference_output: Output of the reference miner
+            **kwargs: Other fields of the log
+
+        Returns:
+            ComparisonLog: Comparison log sharing the payloads
+        """
+        _log = cls(**kwargs)
+        # Assigned after validation, which would copy the payloads
+        _, _log.miner_input = blob_store.intern(miner_input)
+        _log.miner_output_hash, _log.miner_output = blob_store.intern(miner_output)
+        _log.reference_output_hash, _log.reference_output = blob_store.intern(
+            reference_output
         )
+        _log.input_hash = (
+            hashlib.sha256(json.dumps(miner_input).encode("utf-8")).hexdigest()
+            if miner_input
+            else None
+        )
+        return _log
 
 
-class MinerChallengeCommit(BaseModel):
+class MinerChallengeCommit(ViewModel):
     # Basic information
     miner_uid: Optional[int] = None
     miner_hotkey: Optional[str] = None
@@ -116,48 +178,32 @@ class MinerChallengeCommit(BaseModel):
     # Accepted by having penalty less than threshold
     accepted: Optional[bool] = None
 
+    view_excluded_fields = {"public": (), "state": ("key",)}
+
     def public_view(self) -> "MinerChallengeCommit":
         """Returns a new instance with sensitive fields (scoring logs, comparison logs) removed."""
-        return MinerChallengeCommit(
-            miner_uid=self.miner_uid,
-            miner_hotkey=self.miner_hotkey,
-            challenge_name=self.challenge_name,
-            docker_hub_id=self.docker_hub_id,
-            commit_timestamp=self.commit_timestamp,
-            encrypted_commit=self.encrypted_commit,
-            key=self.key,
-            commit=self.commit,
-            scoring_logs=[log.public_view() for log in self.scoring_logs],
-            comparison_logs={
-                ref_commit: [log.public_view() for log in logs]
-                for ref_commit, logs in self.comparison_logs.items()
+        return self._make_view(
+            "public",
+            {
+                "scoring_logs": [log.public_view() for log in self.scoring_logs],
+                "comparison_logs": {
+                    ref_commit: [log.public_view() for log in logs]
+                    for ref_commit, logs in self.comparison_logs.items()
+                },
             },
-            scored_timestamp=self.scored_timestamp,
-            score=self.score,
-            penalty=self.penalty,
-            accepted=self.accepted,
         )
 
     def state_view(self) -> "MinerChallengeCommit":
         """Returns a compact instance suitable for validator state persistence."""
-        return MinerChallengeCommit(
-            miner_uid=self.miner_uid,
-            miner_hotkey=self.miner_hotkey,
-            challenge_name=self.challenge_name,
-            docker_hub_id=self.docker_hub_id,
-            commit_timestamp=self.commit_timestamp,
-            encrypted_commit=self.encrypted_commit,
-            key=None,
-            commit=self.commit,
-            scoring_logs=[log.state_view() for log in self.scoring_logs],
-            comparison_logs={
-                ref_commit: [log.state_view() for log in logs]
-                for ref_commit, logs in self.comparison_logs.items()
+        return self._make_view(
+            "state",
+            {
+                "scoring_logs": [log.state_view() for log in self.scoring_logs],
+                "comparison_logs": {
+                    ref_commit: [log.state_view() for log in logs]
+                    for ref_commit, logs in self.comparison_logs.items()
+                },
             },
-            scored_timestamp=self.scored_timestamp,
-            score=self.score,
-            penalty=self.penalty,
-            accepted=self.accepted,
         )
 
     def remove_lower_than_highest_score(self):
@@ -271,7 +317,7 @@ class MinerChallengeCommit(BaseModel):
         )
 
 
-class MinerChallengeInfo(BaseModel):
+class MinerChallengeInfo(ViewModel):
     """
     Holds the state of a miner for a specific challenge.
 
@@ -318,13 +364,28 @@ class MinerChallengeInfo(BaseModel):
 
     def public_view(self) -> "MinerChallengeInfo":
         """Returns a new instance with sensitive fields removed from commits."""
-        return MinerChallengeInfo(
-            miner_uid=self.miner_uid,
-            miner_hotkey=self.miner_hotkey,
-            challenge_name=self.challenge_name,
-            latest_commit=(
-                self.latest_commit.public_view() if self.latest_commit else None
-            ),
-            best_commit=self.best_commit.public_view() if self.best_commit else None,
-            daily_scores=self.daily_scores,
+        return self._make_view(
+            "public",
+            {
+                "latest_commit": (
+                    self.latest_commit.public_view() if self.latest_commit else None
+                ),
+                "best_commit": (
+                    self.best_commit.public_view() if self.best_commit else None
+                ),
+            },
+        )
+
+    def state_view(self) -> "MinerChallengeInfo":
+        """Returns a new instance with commits reduced to their state view."""
+        return self._make_view(
+            "state",
+            {
+                "latest_commit": (
+                    self.latest_commit.state_view() if self.latest_commit else None
+                ),
+                "best_commit": (
+                    self.best_commit.state_view() if self.best_commit else None
+                ),
+            },
         )
@@ -19,6 +19,7 @@ from redteam_core.validator.models import MinerChallengeCommit
 
 from redteam_core import challenge_pool
 from redteam_core.config import constants
+from redteam_core.tracing import traced
 
 
 class StorageManager:
@@ -45,6 +46,11 @@ class StorageManager:
         self.cache_dir = cache_dir
         self.local_caches: dict[Cache] = {}
 
+        # Number of validator state deltas queued since the last full state, by validator hotkey,
+        # and the validator hotkeys whose deltas are refused until a full state is written
+        self._state_deltas_since_snapshot: dict[str, int] = {}
+        self._broken_state_delta_hotkeys: set[str] = set()
+
         # Queue and background thread for async updates
         self._storage_queue = Queue()  # Queue of tuples (data, processing_method)
         self.storage_thread = threading.Thread(
@@ -71,27 +77,70 @@ class StorageManager:
     ) -> Optional[dict]:
         """
         Retrieves the latest validator state from local cache for a specific validator.
-        Uses the most recent date key to find the latest state.
+        Uses the validator's index of state keys, the last key is the latest state.
 
         Returns:
             Optional[dict]: The latest validator state if found, None otherwise
         """
         try:
             cache = self._get_cache("_validator_state")
-            # Get all date keys and sort them in descending order
-            validator_keys = [
-                key
-                for key in cache.iterkeys()
-                if key.startswith(f"{validator_hotkey}_")
-            ]
-            validator_keys.sort(reverse=True)
+            validator_keys = self._get_validator_state_index(cache, validator_hotkey)
             if validator_keys:
-                return cache[validator_keys[0]]
+                return cache.get(validator_keys[-1], None)
             return None
         except Exception as e:
             bt.logging.error(f"[STORAGE] Error retrieving latest validator state: {e}")
             return None
 
+    def get_latest_validator_state_with_deltas_from_cache(
+        self, validator_uid: int, validator_hotkey: str
+    ) -> tuple[Optional[dict], list[dict]]:
+        """
+        Retrieves the latest validator state from local cache with the state deltas written after
+        it, to be replayed in order. The deltas are numbered from 1 after each full state, if
+        one of them is missing none is returned and the state is loaded alone.
+
+        Returns:
+            tuple[Optional[dict], list[dict]]: The latest validator state, None if not found, and
+                its state deltas ordered by sequence number
+        """
+        state = self.get_latest_validator_state_from_cache(
+            validator_uid, validator_hotkey
+        )
+        if state is None:
+            return None, []
+
+        try:
+            # Deltas older than the latest state are removed when the state is written
+            cache = self._get_cache("_validator_state_delta")
+            delta_keys = sorted(
+                key
+                for key in cache.iterkeys()
+                if key.startswith(f"{validator_hotkey}_")
+            )
+            deltas = [cache[key] for key in delta_keys]
+        except Exception as e:
+            bt.logging.error(f"[STORAGE] Error retrieving validator state deltas: {e}")
+            return state, []
+
+        _sequences = [delta.get("sequence") for delta in deltas]
+        if _sequences != list(range(1, len(deltas) + 1)):
+            bt.logging.warning(
+                f"[STORAGE] Validator state deltas {_sequences} are not contiguous, loading the state alone"
+            )
+            return state, []
+        return state, deltas
+
+    def needs_full_validator_state(self, validator_hotkey: str) -> bool:
+        """
+        Returns True if the next validator state must be written in full with
+        `update_validator_state`, False if a delta can be written with
+        `update_validator_state_delta`. A full state is needed after a restart, after
+        `STATE_SNAPSHOT_INTERVAL` deltas, and after a delta failed to be written.
+        """
+        _deltas = self._state_deltas_since_snapshot.get(validator_hotkey)
+        return _deltas is None or _deltas >= constants.STATE_SNAPSHOT_INTERVAL
+
     def get_latest_validator_state_from_storage(
         self, validator_uid: int, validator_hotkey: str
     ) -> Optional[dict]:
@@ -132,6 +181,7 @@ class StorageManager:
         return None
 
     # MARK: Update Methods
+    @traced("storage.update_commit")
     def update_commit(
         self,
         commit: MinerChallengeCommit,
@@ -160,9 +210,16 @@ class StorageManager:
         challenge_name = commit.challenge_name
         hashed_cache_key = self.hash_cache_key(commit.encrypted_commit)
         data_dict = commit.model_dump()  # Convert to serializable dict
+        # Hash of the canonical serialization, only used to skip unchanged records, it does not
+        # depend on the key order of the record
+        fingerprint = hashlib.sha256(
+            json.dumps(data_dict, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        ).hexdigest()
 
         # Check if update is needed
-        if self._compare_record_to_cache(challenge_name, hashed_cache_key, data_dict):
+        if self._compare_fingerprint_to_cache(
+            challenge_name, hashed_cache_key, fingerprint, data_dict
+        ):
             # 20% chance to update anyway
             if random.random() < 0.2:
                 bt.logging.debug(
@@ -182,6 +239,9 @@ class StorageManager:
         def local_operation():
             cache = self._get_cache(challenge_name)
             cache[hashed_cache_key] = data_dict
+            self._get_cache("_commit_fingerprints")[
+                f"{challenge_name}_{hashed_cache_key}"
+            ] = fingerprint
 
         local_success, error = self._retry_operation(
             local_operation, retry_config["local"], "Local cache update"
@@ -216,6 +276,7 @@ class StorageManager:
                 f"[STORAGE] Failed to update commit from challenge: {challenge_name}, encrypted_commit: {commit.encrypted_commit}, key: {hashed_cache_key}. Errors: {errors}"
             )
 
+    @traced("storage.update_commit_batch")
     def update_commit_batch(
         self,
         commits: list[MinerChallengeCommit],
@@ -248,6 +309,7 @@ class StorageManager:
         with ThreadPoolExecutor(max_workers=5) as executor:
             executor.map(safe_update_commit, commits)
 
+    @traced("storage.update_validator_state")
     def update_validator_state(self, data: dict, async_update: bool = True):
         """
         Updates validator state in centralized storage and local cache.
@@ -259,10 +321,16 @@ class StorageManager:
             async_update (bool): Whether to process the update asynchronously
         """
         if async_update:
+            # Deltas queued from now on follow this state
+            self._state_deltas_since_snapshot[data["validator_hotkey"]] = 0
             self._storage_queue.put((data, "update_validator_state"))
             bt.logging.debug("[STORAGE] Validator state queued for storage")
             return
 
+        if threading.current_thread() is not self.storage_thread:
+            # Queued states were counted when queued, deltas may already follow them
+            self._state_deltas_since_snapshot[data["validator_hotkey"]] = 0
+
         # Get current UTC date and time for the key
         current_utc = datetime.datetime.now(datetime.timezone.utc)
         date = current_utc.strftime(
@@ -276,7 +344,29 @@ class StorageManager:
         # Step 1: Local Cache with retry
         def local_operation():
             cache = self._get_cache("_validator_state")
-            cache[validator_state_key] = data
+            # The state and the index are written in one transaction, states out of the
+            # retention are removed with it
+            with cache.transact():
+                validator_keys = [
+                    key
+                    for key in self._get_validator_state_index(
+                        cache, data["validator_hotkey"]
+                    )
+                    if key != validator_state_key
+                ]
+                validator_keys.append(validator_state_key)
+                _retention_start = max(
+                    len(validator_keys) - constants.STATE_SNAPSHOT_RETENTION, 0
+                )
+                _expired_keys = validator_keys[:_retention_start]
+                validator_keys = validator_keys[_retention_start:]
+
+                cache[validator_state_key] = data
+                cache[self._get_validator_state_index_key(data["validator_hotkey"])] = (
+                    validator_keys
+                )
+                for key in _expired_keys:
+                    cache.delete(key)
 
         local_success, error = self._retry_operation(
             local_operation, retry_config["local"], "Local validator state update"
@@ -285,8 +375,15 @@ class StorageManager:
             bt.logging.error(
                 f"[STORAGE] Failed to update local validator state: {error}"
             )
+            self._state_deltas_since_snapshot.pop(data["validator_hotkey"], None)
+            # Deltas queued after this state must not be replayed on the previous one
+            self._broken_state_delta_hotkeys.add(data["validator_hotkey"])
             return
 
+        # Deltas written before this state are replaced by it
+        self._remove_validator_state_deltas(data["validator_hotkey"])
+        self._broken_state_delta_hotkeys.discard(data["validator_hotkey"])
+
         # Step 2: Centralized Storage with retry
         def centralized_operation():
             _base_url_path = str(constants.STORAGE_API_URL).rstrip("/")
@@ -313,6 +410,94 @@ class StorageManager:
             f"[STORAGE] Validator state successfully updated in all storages with key {validator_state_key}"
         )
 
+    @traced("storage.update_validator_state_delta")
+    def update_validator_state_delta(self, data: dict, async_update: bool = True):
+        """
+        Writes a validator state delta to local cache, to be replayed on the latest validator
+        state when loading it. Deltas are not uploaded to centralized storage, which receives
+        the full states written with `update_validator_state`.
+
+        Deltas are numbered from 1 after each full state when they are queued. Once a delta or a
+        full state fails to be written, the following deltas are refused until a full state is
+        written, so that no delta is replayed on a state it does not follow.
+
+        Args:
+            data (dict): The validator state delta to store, with the validator hotkey
+            async_update (bool): Whether to process the update asynchronously
+        """
+        _validator_hotkey = data["validator_hotkey"]
+        if "sequence" not in data:
+            _sequence = self._state_deltas_since_snapshot.get(_validator_hotkey, 0) + 1
+            self._state_deltas_since_snapshot[_validator_hotkey] = _sequence
+            data = {**data, "sequence": _sequence}
+
+        if async_update:
+            self._storage_queue.put((data, "update_validator_state_delta"))
+            bt.logging.debug("[STORAGE] Validator state delta queued for storage")
+            return
+
+        if _validator_hotkey in self._broken_state_delta_hotkeys:
+            bt.logging.warning(
+                f"[STORAGE] Skipping validator state delta {data['sequence']}, waiting for a full validator state"
+            )
+            return
+
+        # Microseconds keep the deltas of a same second ordered
+        date = datetime.datetime.now(datetime.timezone.utc).strftime(
+            "%Y-%m-%d_%H-%M-%S_%f"
+        )
+        validator_state_delta_key = f"{_validator_hotkey}_{date}"
+
+        def local_operation():
+            cache = self._get_cache("_validator_state_delta")
+            cache[validator_state_delta_key] = data
+
+        local_success, error = self._retry_operation(
+            local_operation, 3, "Local validator state delta update"
+        )
+        if not local_success:
+            # A missing delta breaks the replay, the next state is written in full
+            bt.logging.error(
+                f"[STORAGE] Failed to update local validator state delta: {error}"
+            )
+            self._state_deltas_since_snapshot.pop(_validator_hotkey, None)
+            self._broken_state_delta_hotkeys.add(_validator_hotkey)
+            return
+
+        bt.logging.debug(
+            f"[STORAGE] Validator state delta updated in local cache with key {validator_state_delta_key}"
+        )
+
+    def _get_validator_state_index_key(self, validator_hotkey: str) -> str:
+        return f"_index_{validator_hotkey}"
+
+    def _get_validator_state_index(
+        self, cache: Cache, validator_hotkey: str
+    ) -> list[str]:
+        """
+        Returns the keys of the validator's states in local cache, oldest first. Caches written
+        before the index existed are scanned once and indexed.
+        """
+        _index_key = self._get_validator_state_index_key(validator_hotkey)
+        validator_keys = cache.get(_index_key, None)
+        if validator_keys is None:
+            validator_keys = sorted(
+                key
+                for key in cache.iterkeys()
+                if key.startswith(f"{validator_hotkey}_")
+            )
+            cache[_index_key] = validator_keys
+        return validator_keys
+
+    def _remove_validator_state_deltas(self, validator_hotkey: str):
+        try:
+            cache = self._get_cache("_validator_state_delta")
+            for key in list(cache.iterkeys()):
+                if key.startswith(f"{validator_hotkey}_"):
+                    cache.delete(key)
+        except Exception as e:
+            bt.logging.error(f"[STORAGE] Error removing validator state deltas: {e}")
+
     # MARK: Helper Methods
     def hash_cache_key(self, cache_key: str) -> str:
         """
@@ -352,6 +537,8 @@ class StorageManager:
                     self.update_commit(data, async_update=False)
                 elif method == "update_validator_state":
                     self.update_validator_state(data, async_update=False)
+                elif method == "update_validator_state_delta":
+                    self.update_validator_state_delta(data, async_update=False)
                 elif method == "update_commit_batch":
                     self.update_commit_batch(data, async_update=False)
                 else:
@@ -368,6 +555,29 @@ class StorageManager:
 
             time.sleep(1)  # Prevent the thread from consuming too much CPU
 
+    def _compare_fingerprint_to_cache(
+        self, cache_name: str, cache_key: str, fingerprint: str, record: dict
+    ) -> bool:
+        """
+        Compares a record's fingerprint to the fingerprint stored with the cached record and
+        returns True if they are the same, False otherwise. Records cached without a fingerprint
+        are compared in full, and fingerprinted if they are the same.
+        """
+        try:
+            fingerprints = self._get_cache("_commit_fingerprints")
+            cached_fingerprint = fingerprints.get(f"{cache_name}_{cache_key}", None)
+            if cached_fingerprint is not None:
+                return cached_fingerprint == fingerprint
+
+            # Fingerprint the cached record once it is known to be the same
+            if self._compare_record_to_cache(cache_name, cache_key, record):
+                fingerprints[f"{cache_name}_{cache_key}"] = fingerprint
+                return True
+            return False
+        except Exception as e:
+            bt.logging.error(f"[STORAGE] Error comparing record fingerprints: {str(e)}")
+            return False
+
     def _compare_record_to_cache(
         self, cache_name: str, cache_key: str, record: dict
     ) -> bool:
@@ -1,7 +1,14 @@
 import logging
+import os
 
 import pytest
 
+# Challenge modules are not part of this repository, an empty active challenges file keeps
+# `redteam_core.challenge_pool` importable
+os.environ.setdefault(
+    "ACTIVE_CHALLENGES_FILE",
+    os.path.join(os.path.dirname(__file__), "data", "active_challenges.yaml"),
+)
 
 logger = logging.getLogger(__name__)
 
@@ -0,0 +1,200 @@
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from redteam_core.validator import storage_manager
+from redteam_core.validator.challenge_manager import ChallengeManager
+from redteam_core.validator.storage_manager import StorageManager
+from redteam_core.validator.models import MinerChallengeCommit, ScoringLog
+
+CHALLENGE_INFO = {
+    "name": "challenge",
+    "challenge_incentive_weight": 1.0,
+    "comparison_config": {"max_unique_commits": 15},
+}
+
+
+class ScoreChallengeManager(ChallengeManager):
+    """Challenge manager accepting the score of every commit as it is."""
+
+    def update_miner_scores(self, miner_commits: list[MinerChallengeCommit]):
+        for miner_commit in miner_commits:
+            miner_commit.accepted = True
+            self._unique_scored_docker_hub_ids.add(miner_commit.docker_hub_id)
+            self.miner_states[miner_commit.miner_uid].update_best_commit(miner_commit)
+
+
+def _make_commit(uid: int, score: float, hotkey: str | None = None):
+    return MinerChallengeCommit(
+        miner_uid=uid,
+        miner_hotkey=hotkey or f"hotkey_{uid}",
+        challenge_name="challenge",
+        docker_hub_id=f"miner_{uid}@sha256:{score}",
+        encrypted_commit=f"commit_{uid}_{score}",
+        scoring_logs=[ScoringLog(score=score, miner_input={"task_id": uid})],
+        score=score,
+        penalty=0.0,
+    )
+
+
+def _submit(manager: ChallengeManager, commits: list[MinerChallengeCommit]):
+    manager.update_miner_infos(commits)
+    manager.update_miner_scores(commits)
+
+
+@pytest.fixture
+def metagraph() -> SimpleNamespace:
+    return SimpleNamespace(hotkeys=[f"hotkey_{uid}" for uid in range(4)])
+
+
+@pytest.fixture
+def manager(metagraph: SimpleNamespace) -> ScoreChallengeManager:
+    _manager = ScoreChallengeManager(CHALLENGE_INFO, metagraph)
+    _submit(_manager, [_make_commit(0, 0.5), _make_commit(2, 0.8)])
+    return _manager
+
+
+def test_challenge_scores_follow_scored_commits(manager: ScoreChallengeManager):
+    np.testing.assert_array_equal(manager.get_challenge_scores(), [0.5, 0.0, 0.8, 0.0])
+
+    _submit(manager, [_make_commit(0, 0.9), _make_commit(1, 0.3)])
+    np.testing.assert_array_equal(manager.get_challenge_scores(), [0.9, 0.3, 0.8, 0.0])
+
+
+def test_scores_set_by_update_miner_scores_reach_state_and_deltas(
+    manager: ScoreChallengeManager,
+):
+    _commits = [_make_commit(1, 0.4)]
+    manager.update_miner_infos(_commits)
+    # Reads between the commit update and the scoring must not hide the scoring changes
+    np.testing.assert_array_equal(manager.get_challenge_scores(), [0.5, 0.0, 0.8, 0.0])
+    manager.export_state_delta()
+
+    manager.update_miner_scores(_commits)
+
+    np.testing.assert_array_equal(manager.get_challenge_scores(), [0.5, 0.4, 0.8, 0.0])
+    _delta_state = manager.export_state_delta()["miner_states"]["1"]
+    assert _delta_state["best_commit"]["score"] == 0.4
+
+
+def test_overriding_update_miner_scores_keeps_marking(metagraph: SimpleNamespace):
+    class PenaltyChallengeManager(ScoreChallengeManager):
+        def update_miner_scores(self, miner_commits: list[MinerChallengeCommit]):
+            super().update_miner_scores(miner_commits)
+            for miner_commit in miner_commits:
+                miner_commit.penalty = 0.1
+
+    _manager = PenaltyChallengeManager(CHALLENGE_INFO, metagraph)
+    _commits = [_make_commit(3, 0.6)]
+    _manager.update_miner_infos(_commits)
+    _manager.export_state_delta()
+
+    _manager.update_miner_scores(_commits)
+
+    _delta_state = _manager.export_state_delta()["miner_states"]["3"]
+    assert _delta_state["best_commit"]["penalty"] == 0.1
+
+
+def test_challenge_scores_drop_deregistered_miners(
+    manager: ScoreChallengeManager, metagraph: SimpleNamespace
+):
+    manager.get_challenge_scores()
+    metagraph.hotkeys[2] = "new_hotkey_2"
+    manager.update_miner_infos([])
+
+    np.testing.assert_array_equal(manager.get_challenge_scores(), [0.5, 0.0, 0.0, 0.0])
+
+
+def test_loaded_challenge_scores(manager: ScoreChallengeManager):
+    _loaded_manager = ScoreChallengeManager.load_state(
+        manager.export_state(), CHALLENGE_INFO, manager.metagraph
+    )
+
+    np.testing.assert_array_equal(
+        _loaded_manager.get_challenge_scores(), manager.get_challenge_scores()
+    )
+
+
+def _normalize_state(state: dict) -> dict:
+    # Sets are exported as lists in arbitrary order
+    return {
+        **state,
+        "unique_commits": sorted(
+            state["unique_commits"], key=lambda item: item["commit"]
+        ),
+        "unique_scored_docker_hub_ids": sorted(state["unique_scored_docker_hub_ids"]),
+    }
+
+
+def test_state_deltas_round_trip(
+    manager: ScoreChallengeManager, metagraph: SimpleNamespace
+):
+    _state = manager.export_state()
+
+    _submit(manager, [_make_commit(1, 0.3), _make_commit(3, 0.7)])
+    _first_delta = manager.export_state_delta()
+    metagraph.hotkeys[2] = "new_hotkey_2"
+    _submit(manager, [_make_commit(0, 0.9)])
+    _second_delta = manager.export_state_delta()
+
+    assert _second_delta["removed_uids"] == ["2"]
+    assert set(_second_delta["miner_states"]) == {"0"}
+    assert set(_first_delta["added_scored_docker_hub_ids"]) == {
+        "miner_1@sha256:0.3",
+        "miner_3@sha256:0.7",
+    }
+    assert _second_delta["added_scored_docker_hub_ids"] == ["miner_0@sha256:0.9"]
+
+    _loaded_manager = ScoreChallengeManager.load_state(
+        _state, CHALLENGE_INFO, metagraph, deltas=[_first_delta, _second_delta]
+    )
+    assert _normalize_state(_loaded_manager.export_state()) == _normalize_state(
+        manager.export_state()
+    )
+
+
+def test_public_export_keeps_changes_for_the_next_delta(
+    manager: ScoreChallengeManager,
+):
+    manager.export_state()
+    _submit(manager, [_make_commit(1, 0.3)])
+
+    manager.export_state(public_view=True)
+    _delta = manager.export_state_delta()
+
+    assert set(_delta["miner_states"]) == {"1"}
+    assert _delta["added_scored_docker_hub_ids"] == ["miner_1@sha256:0.3"]
+    assert manager.export_state_delta()["miner_states"] == {}
+
+
+def test_failed_state_delta_forces_full_state(manager: ScoreChallengeManager, tmp_path):
+    _storage_manager = StorageManager(
+        cache_dir=str(tmp_path),
+        validator_request_header_fn=lambda data: {},
+        sync_on_init=False,
+    )
+    _validator_hotkey = "validator_hotkey"
+    assert _storage_manager.needs_full_validator_state(_validator_hotkey)
+
+    with mock.patch.object(storage_manager.requests, "post"):
+        _storage_manager.update_validator_state(
+            {"validator_hotkey": _validator_hotkey, **manager.export_state()},
+            async_update=False,
+        )
+    assert not _storage_manager.needs_full_validator_state(_validator_hotkey)
+
+    _submit(manager, [_make_commit(1, 0.3)])
+    with (
+        mock.patch.object(
+            _storage_manager, "_get_cache", side_effect=OSError("disk full")
+        ),
+        mock.patch.object(storage_manager.time, "sleep"),
+    ):
+        _storage_manager.update_validator_state_delta(
+            {"validator_hotkey": _validator_hotkey, **manager.export_state_delta()},
+            async_update=False,
+        )
+
+    assert _storage_manager.needs_full_validator_state(_validator_hotkey)
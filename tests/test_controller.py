@@ -0,0 +1,105 @@
+import pytest
+
+from benchmarks.bench_controller import build_parser, run_benchmark
+
+
+def _run_benchmark(*argv: str) -> dict:
+    _args = build_parser().parse_args(
+        [
+            "--miners",
+            "6",
+            "--tasks",
+            "2",
+            "--references",
+            "2",
+            "--latency",
+            "0",
+            "--solve-latency",
+            "0.005",
+            "--score-latency",
+            "0",
+            "--compare-latency",
+            "0",
+            "--run-latency",
+            "0",
+            "--pull-latency",
+            "0",
+            "--stop-latency",
+            "0",
+            "--no-resource-usage",
+            *argv,
+        ]
+    )
+    return run_benchmark(_args)
+
+
+def _count_calls(report: dict, phase: str) -> int:
+    return sum(report["http_calls"].get(phase, {}).values())
+
+
+def _get_deterministic_calls(report: dict) -> dict[str, dict[str, int]]:
+    # Same score comparisons depend on score collisions between random miner outputs
+    return {
+        phase: {
+            route: calls
+            for route, calls in routes.items()
+            if route != "internal_services POST /compare/same-score"
+        }
+        for phase, routes in report["http_calls"].items()
+    }
+
+
+@pytest.fixture(scope="module")
+def sequential_report() -> dict:
+    return _run_benchmark()
+
+
+def test_sequential_scores_every_miner(sequential_report: dict):
+    assert sequential_report["failed_miners"] == 0
+    assert sequential_report["phases"]["controller.score"]["count"] == 6
+    assert sequential_report["http_calls"]["controller.solve"] == {
+        "miner POST /solve": 12
+    }
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ("--max-concurrent-miners", "3"),
+        ("--max-concurrent-miners", "3", "--solve-concurrency", "2"),
+        ("--max-concurrent-miners", "3", "--pipeline"),
+    ],
+    ids=["pool", "pool_concurrent_solves", "pipeline"],
+)
+def test_concurrent_evaluation_matches_sequential(
+    sequential_report: dict, argv: tuple[str, ...]
+):
+    _report = _run_benchmark(*argv)
+
+    assert _report["failed_miners"] == 0
+    assert _report["phases"]["controller.score"]["count"] == 6
+    assert _get_deterministic_calls(_report) == _get_deterministic_calls(
+        sequential_report
+    )
+    # Every miner container is started once and removed
+    assert _report["docker_calls"]["containers.run"] == 7
+    assert _report["docker_calls"]["containers.remove"] == 7
+
+
+@pytest.mark.parametrize(
+    "max_concurrent_miners", ["1", "3"], ids=["sequential", "pool"]
+)
+def test_cached_solves_defer_miner_containers(tmp_path, max_concurrent_miners: str):
+    _argv = ("--deterministic", "--cache-dir", str(tmp_path), "--max-concurrent-miners")
+    _first_report = _run_benchmark(*_argv, max_concurrent_miners)
+    _second_report = _run_benchmark(
+        *_argv, max_concurrent_miners, "--solve-concurrency", "2"
+    )
+
+    assert _first_report["failed_miners"] == 0
+    assert _first_report["result_cache"]["hits"]["solve"] == 0
+    assert _second_report["failed_miners"] == 0
+    assert _second_report["result_cache"]["hits"]["solve"] == 12
+    # Solved from the result cache, only the challenge container is started
+    assert _count_calls(_second_report, "controller.solve") == 0
+    assert _second_report["docker_calls"]["containers.run"] == 1
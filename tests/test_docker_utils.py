@@ -0,0 +1,50 @@
+from unittest import mock
+import socket
+
+import pytest
+
+from benchmarks.fake_docker import FakeDockerClient
+from redteam_core.challenge_pool import docker_utils
+
+
+def _get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_container_dead_before_the_events_subscription_is_detected():
+    # The container exited before the events stream was subscribed, its status is only
+    # known to the daemon until it is reloaded
+    _container = mock.Mock(id="container_id", status="running")
+    _container.name = "challenge"
+    _container.client = FakeDockerClient()
+    _container.logs.return_value = b"crashed"
+    _container.reload.side_effect = lambda: setattr(_container, "status", "exited")
+
+    with pytest.raises(RuntimeError, match="Container failed to start"):
+        docker_utils.check_container_alive(
+            _container, health_port=_get_free_port(), ip="127.0.0.1", timeout=5
+        )
+    _container.reload.assert_called()
+
+
+def test_clean_docker_resources_only_removes_managed_resources():
+    _client = FakeDockerClient()
+    _client.images.add("other/image:latest")
+    _other_container = _client.containers.run("other/unused:latest")
+    _other_container.stop()
+    _managed_container = _client.containers.run(
+        "miner/image:latest", labels={docker_utils.MANAGED_LABEL: "true"}
+    )
+    _managed_container.stop()
+
+    _report = docker_utils.clean_docker_resources(_client)
+
+    assert _report["containers"] == 1
+    assert _report["images"] == 1
+    assert [image.tags[0] for image in _client.images.list()] == [
+        "other/image:latest",
+        "other/unused:latest",
+    ]
+    assert _client.containers.list(all=True) == [_other_container]
@@ -0,0 +1,198 @@
+import hashlib
+import json
+
+from redteam_core.validator.models import (
+    ComparisonLog,
+    MinerChallengeCommit,
+    MinerChallengeInfo,
+    ScoringLog,
+)
+
+MINER_INPUT = {"task_id": "task_0", "payload": 0}
+MINER_OUTPUT = {"script": "print('miner')"}
+REFERENCE_OUTPUT = {"script": "print('reference')"}
+
+
+def _make_commit() -> MinerChallengeCommit:
+    return MinerChallengeCommit(
+        miner_uid=1,
+        miner_hotkey="hotkey_1",
+        challenge_name="challenge",
+        docker_hub_id="miner/image@sha256:digest",
+        commit_timestamp=1.0,
+        encrypted_commit="encrypted",
+        key="key",
+        commit="commit",
+        scoring_logs=[
+            ScoringLog(
+                score=0.9,
+                miner_input=MINER_INPUT,
+                miner_output=MINER_OUTPUT,
+                validation_output={"valid": True},
+                baseline_score=0.5,
+                solve_duration=1.0,
+                queue_delay=0.1,
+            )
+        ],
+        comparison_logs={
+            "reference/image@sha256:digest": [
+                ComparisonLog(
+                    similarity_score=0.1,
+                    miner_input=MINER_INPUT,
+                    miner_output=MINER_OUTPUT,
+                    reference_output=REFERENCE_OUTPUT,
+                    reason="different",
+                    reference_hotkey="reference_hotkey",
+                    reference_similarity_score=0.2,
+                )
+            ]
+        },
+        scored_timestamp=2.0,
+        score=0.9,
+        penalty=0.1,
+        accepted=True,
+    )
+
+
+def _get_set_fields(data: dict) -> set[str]:
+    return {key for key, value in data.items() if value is not None}
+
+
+def test_scoring_log_views():
+    _scoring_log = _make_commit().scoring_logs[0]
+
+    assert _get_set_fields(_scoring_log.public_view().model_dump()) == {
+        "score",
+        "validation_output",
+        "baseline_score",
+        "solve_duration",
+        "queue_delay",
+    }
+    assert _get_set_fields(_scoring_log.state_view().model_dump()) == {
+        "score",
+        "baseline_score",
+        "input_hash",
+        "solve_duration",
+        "queue_delay",
+    }
+
+
+def test_comparison_log_views():
+    _comparison_log = _make_commit().comparison_logs["reference/image@sha256:digest"][0]
+
+    assert _get_set_fields(_comparison_log.public_view().model_dump()) == {
+        "similarity_score",
+        "reason",
+        "reference_hotkey",
+        "reference_similarity_score",
+    }
+    assert _get_set_fields(_comparison_log.state_view().model_dump()) == {
+        "similarity_score",
+        "input_hash",
+        "reason",
+        "reference_hotkey",
+        "reference_similarity_score",
+        "miner_output_hash",
+        "reference_output_hash",
+    }
+
+
+def test_commit_views():
+    _commit = _make_commit()
+    _commit_fields = set(MinerChallengeCommit.model_fields)
+
+    _public_data = _commit.public_view().model_dump()
+    assert _get_set_fields(_public_data) == _commit_fields
+    assert _public_data["key"] == "key"
+    assert _public_data["scoring_logs"][0]["miner_input"] is None
+
+    _state_data = _commit.state_view().model_dump()
+    assert _get_set_fields(_state_data) == _commit_fields - {"key"}
+    assert _state_data["scoring_logs"][0]["miner_output"] is None
+    assert _state_data["scoring_logs"][0]["input_hash"] is not None
+
+    # Views are copies, the commit keeps its payloads
+    assert _commit.key == "key"
+    assert _commit.scoring_logs[0].miner_input == MINER_INPUT
+
+
+def test_miner_challenge_info_views():
+    _commit = _make_commit()
+    _miner_state = MinerChallengeInfo(
+        miner_uid=1,
+        miner_hotkey="hotkey_1",
+        challenge_name="challenge",
+        latest_commit=_commit,
+        best_commit=_commit,
+    )
+
+    _public_data = _miner_state.public_view().model_dump()
+    _state_data = _miner_state.state_view().model_dump()
+    for commit_field in ("latest_commit", "best_commit"):
+        assert _public_data[commit_field] == _commit.public_view().model_dump()
+        assert _state_data[commit_field] == _commit.state_view().model_dump()
+
+
+def test_views_do_not_share_containers_with_model():
+    _commit = _make_commit()
+    _miner_state = MinerChallengeInfo(
+        miner_uid=1,
+        miner_hotkey="hotkey_1",
+        challenge_name="challenge",
+        latest_commit=_commit,
+        best_commit=_commit,
+        daily_scores={"2024-01-01": 0.9},
+    )
+    _commit_data = _commit.model_dump()
+    _miner_state_data = _miner_state.model_dump()
+
+    for _view in (_miner_state.public_view(), _miner_state.state_view()):
+        _view.daily_scores["2024-01-02"] = 1.0
+        for _view_commit in (_view.latest_commit, _view.best_commit):
+            _view_commit.scoring_logs[0].score = 0.0
+            if _view_commit.scoring_logs[0].validation_output is not None:
+                _view_commit.scoring_logs[0].validation_output["valid"] = False
+            _view_commit.scoring_logs.clear()
+            _view_commit.comparison_logs.clear()
+
+    _scoring_log = _commit.scoring_logs[0]
+    _scoring_log.public_view().validation_output["valid"] = False
+
+    assert _commit.model_dump() == _commit_data
+    assert _miner_state.model_dump() == _miner_state_data
+
+
+def test_input_hash_is_computed_once():
+    _scoring_log = ScoringLog(miner_input=MINER_INPUT)
+
+    assert (
+        _scoring_log.input_hash
+        == hashlib.sha256(json.dumps(MINER_INPUT).encode("utf-8")).hexdigest()
+    )
+
+
+def test_model_validate_reuses_stored_hashes():
+    _state_data = _make_commit().state_view().model_dump()
+    # Stored hashes are kept as they are, even with the payloads present
+    _state_data["scoring_logs"][0]["input_hash"] = "stored_input_hash"
+    _state_data["scoring_logs"][0]["miner_input"] = MINER_INPUT
+    _comparison_data = _state_data["comparison_logs"]["reference/image@sha256:digest"][
+        0
+    ]
+    _comparison_data["input_hash"] = "stored_input_hash"
+    _comparison_data["miner_output_hash"] = "stored_miner_output_hash"
+    _comparison_data["miner_input"] = MINER_INPUT
+    _comparison_data["miner_output"] = MINER_OUTPUT
+
+    _commit = MinerChallengeCommit.model_validate(_state_data)
+
+    assert _commit.scoring_logs[0].input_hash == "stored_input_hash"
+    _comparison_log = _commit.comparison_logs["reference/image@sha256:digest"][0]
+    assert _comparison_log.input_hash == "stored_input_hash"
+    assert _comparison_log.miner_output_hash == "stored_miner_output_hash"
+
+
+def test_state_view_round_trips():
+    _state_data = _make_commit().state_view().model_dump()
+
+    assert MinerChallengeCommit.model_validate(_state_data).model_dump() == _state_data
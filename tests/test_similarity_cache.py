@@ -0,0 +1,20 @@
+from redteam_core.challenge_pool.similarity_cache import SimilarityCache
+
+
+def test_pairs_with_a_missing_script_are_not_cached(tmp_path):
+    _cache = SimilarityCache(str(tmp_path), ttl=60, size_limit=1024**2)
+
+    for miner_script, reference_script in (
+        (None, "reference"),
+        ("miner", None),
+        (None, None),
+    ):
+        _key = _cache.make_key("type", "/compare", miner_script, reference_script)
+        assert _key is None
+        _cache.set(_key, 0.9)
+        assert _cache.get(_key) is None
+
+    _key = _cache.make_key("type", "/compare", "miner", "reference")
+    _cache.set(_key, 0.9)
+    assert _cache.get(_key) == 0.9
+    assert _cache.get(_cache.make_key("type", "/compare", "miner", "other")) is None
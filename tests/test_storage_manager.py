@@ -0,0 +1,126 @@
+from unittest import mock
+
+import pytest
+
+from redteam_core.validator import storage_manager
+from redteam_core.validator.models import MinerChallengeCommit, ScoringLog
+from redteam_core.validator.storage_manager import StorageManager
+
+
+def _make_commit(miner_input: dict) -> MinerChallengeCommit:
+    return MinerChallengeCommit(
+        miner_uid=1,
+        miner_hotkey="hotkey_1",
+        challenge_name="challenge",
+        docker_hub_id="miner@sha256:digest",
+        encrypted_commit="encrypted",
+        scoring_logs=[
+            ScoringLog(score=0.5, miner_input=miner_input, input_hash="input_hash")
+        ],
+    )
+
+
+@pytest.fixture
+def signed_bodies() -> list:
+    return []
+
+
+@pytest.fixture
+def manager(tmp_path, signed_bodies: list) -> StorageManager:
+    def _sign(body) -> dict:
+        signed_bodies.append(body)
+        return {"signature": "signature"}
+
+    return StorageManager(
+        cache_dir=str(tmp_path),
+        validator_request_header_fn=_sign,
+        sync_on_init=False,
+    )
+
+
+def test_commit_record_is_signed_and_uploaded_as_is(
+    manager: StorageManager, signed_bodies: list
+):
+    _commit = _make_commit({"b": 2, "a": 1})
+    with mock.patch.object(storage_manager.requests, "post") as post:
+        manager.update_commit(_commit, async_update=False)
+
+    assert post.call_count == 1
+    assert post.call_args.kwargs["json"] == _commit.model_dump()
+    assert "data" not in post.call_args.kwargs
+    assert signed_bodies == [post.call_args.kwargs["json"]]
+    assert post.call_args.kwargs["headers"] == {"signature": "signature"}
+
+
+def test_commit_fingerprint_ignores_key_order(manager: StorageManager):
+    with (
+        mock.patch.object(storage_manager.requests, "post") as post,
+        mock.patch.object(storage_manager.random, "random", return_value=0.5),
+    ):
+        manager.update_commit(_make_commit({"a": 1, "b": 2}), async_update=False)
+        manager.update_commit(_make_commit({"b": 2, "a": 1}), async_update=False)
+        assert post.call_count == 1
+
+        manager.update_commit(_make_commit({"a": 1, "b": 3}), async_update=False)
+        assert post.call_count == 2
+
+
+VALIDATOR_HOTKEY = "validator_hotkey"
+
+
+def _write_state(manager: StorageManager):
+    with mock.patch.object(storage_manager.requests, "post"):
+        manager.update_validator_state(
+            {"validator_hotkey": VALIDATOR_HOTKEY, "miner_states": {}},
+            async_update=False,
+        )
+
+
+def _queue_deltas(manager: StorageManager, count: int) -> list[dict]:
+    with mock.patch.object(manager, "_storage_queue") as queue:
+        for _ in range(count):
+            manager.update_validator_state_delta({"validator_hotkey": VALIDATOR_HOTKEY})
+    return [_call.args[0][0] for _call in queue.put.call_args_list]
+
+
+def test_deltas_are_refused_after_a_failed_delta(manager: StorageManager):
+    _write_state(manager)
+    _first_delta, _second_delta = _queue_deltas(manager, 2)
+    assert [_first_delta["sequence"], _second_delta["sequence"]] == [1, 2]
+
+    # The first delta fails while the second one is already queued
+    with (
+        mock.patch.object(manager, "_get_cache", side_effect=OSError("disk full")),
+        mock.patch.object(storage_manager.time, "sleep"),
+    ):
+        manager.update_validator_state_delta(_first_delta, async_update=False)
+    manager.update_validator_state_delta(_second_delta, async_update=False)
+
+    _state, _deltas = manager.get_latest_validator_state_with_deltas_from_cache(
+        0, VALIDATOR_HOTKEY
+    )
+    assert _state is not None
+    assert _deltas == []
+    assert manager.needs_full_validator_state(VALIDATOR_HOTKEY)
+
+    # A full state accepts deltas again, numbered after it
+    _write_state(manager)
+    (_delta,) = _queue_deltas(manager, 1)
+    manager.update_validator_state_delta(_delta, async_update=False)
+    _state, _deltas = manager.get_latest_validator_state_with_deltas_from_cache(
+        0, VALIDATOR_HOTKEY
+    )
+    assert [delta["sequence"] for delta in _deltas] == [1]
+
+
+def test_deltas_with_a_gap_are_not_loaded(manager: StorageManager):
+    _write_state(manager)
+    for _delta in _queue_deltas(manager, 3):
+        if _delta["sequence"] != 2:
+            manager.update_validator_state_delta(_delta, async_update=False)
+
+    _state, _deltas = manager.get_latest_validator_state_with_deltas_from_cache(
+        0, VALIDATOR_HOTKEY
+    )
+    assert _state is not None
+    assert _deltas == []
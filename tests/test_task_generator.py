@@ -0,0 +1,31 @@
+import threading
+import time
+
+from redteam_core.challenge_pool.task_generator import TaskGenerator
+
+
+def test_stop_prefill_waits_for_the_fill_to_stop(tmp_path):
+    _fetching = threading.Event()
+    _calls = []
+
+    def _fetch_task(stop_event: threading.Event | None = None) -> dict:
+        _calls.append(time.time())
+        _fetching.set()
+        # Slow request answered after the fill is stopped
+        stop_event.wait()
+        time.sleep(0.1)
+        return {"task_id": len(_calls)}
+
+    _task_generator = TaskGenerator(
+        fetch_task=_fetch_task, cache_dir=str(tmp_path), pool_key="pool"
+    )
+    _task_generator.start_prefill(target_size=10, max_concurrency=2)
+    assert _fetching.wait(5)
+
+    _task_generator.stop_prefill(timeout=0.01)
+    _stopped_calls = len(_calls)
+    time.sleep(0.2)
+
+    assert len(_calls) == _stopped_calls
+    # Tasks answered while stopping are not pooled
+    assert _task_generator.pool_size() == 0